@@ -2,32 +2,59 @@
 FastAPI application and HTTP/WebSocket entrypoint.
 Business logic and wiring live in src (screening, wiring).
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from apps.backend.routes import applications as applications_router
 from apps.backend.routes import analysis as analysis_router
+from apps.backend.routes import job_offers as job_offers_router
+from apps.backend.routes import metrics as metrics_router
 from apps.backend.routes import ws as ws_router
+from src import wiring
 from src.config import Settings
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled Torre client per process, shared by the bios and opportunities adapters.
+    wiring.open_torre_http_client()
+    # In async database mode, request-path repositories use asyncpg sessions bound to this loop.
+    wiring.open_async_database()
+    # Job offer ANN index (when enabled): memory-mapped snapshot if present, then caught up
+    # and periodically re-synced in the background.
+    wiring.open_job_offer_index()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(wiring.close_subscriber_loop)
+        await asyncio.to_thread(wiring.close_job_offer_index)
+        await wiring.close_async_database()
+        await wiring.close_torre_http_client()
+
+
 def create_app() -> FastAPI:
     settings = Settings()
     origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
     if not origins:
         origins = ["http://localhost:5173"]
 
-    app = FastAPI(title="Screening Backend", version="0.1.0")
+    app = FastAPI(title="Screening Backend", version="0.1.0", lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
     app.include_router(applications_router.router, prefix="/api")
     app.include_router(analysis_router.router, prefix="/api")
+    app.include_router(job_offers_router.router, prefix="/api")
     app.include_router(ws_router.router, prefix="/api")
+    app.include_router(metrics_router.router, prefix="/api")
     return app
 
 
@@ -1,17 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from apps.backend.schemas import AnalysisResponse
 from src.screening.analysis.application.services import AnalysisService
+from src.screening.analysis.domain.entities import ScreeningAnalysis
 from src.screening.shared.domain import ApplicationId
 from src import wiring
 
 router = APIRouter(tags=["analysis"])
 
+MAX_WAIT_SECONDS = 30.0
+
 
 def get_analysis_service() -> AnalysisService:
     return wiring.get_analysis_service()
 
 
+def analysis_etag(analysis: ScreeningAnalysis) -> str:
+    """Strong validator: a finished analysis is immutable until a new one replaces it."""
+    return f'"{analysis.id}.{analysis.completed_at.strftime("%Y%m%dT%H%M%S%f")}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so a W/ prefix added by a proxy still matches.
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+
 @router.get(
     "/applications/{application_id}/analysis",
     response_model=AnalysisResponse,
@@ -19,24 +37,38 @@ def get_analysis_service() -> AnalysisService:
     responses={
         200: {"description": "Analysis ready"},
         202: {"description": "Analysis pending"},
+        304: {"description": "Analysis unchanged since the ETag in If-None-Match"},
         404: {"description": "Application or analysis not found"},
     },
 )
 async def get_analysis(
     application_id: str,
+    response: Response,
+    wait: float = Query(
+        0.0,
+        ge=0.0,
+        le=MAX_WAIT_SECONDS,
+        description="Long-poll: seconds to hold a pending request open until the analysis lands",
+    ),
+    if_none_match: Optional[str] = Header(None),
     service: AnalysisService = Depends(get_analysis_service),
-) -> AnalysisResponse:
+) -> Union[AnalysisResponse, Response]:
     try:
         app_id = ApplicationId(application_id)
     except (ValueError, TypeError):
         raise HTTPException(status_code=404, detail="Application not found")
 
-    result = await service.get_analysis_for_application(app_id)
+    result = await service.wait_for_analysis(app_id, wait)
     if not result.found_application:
         raise HTTPException(status_code=404, detail="Application not found")
     if result.analysis is None:
         raise HTTPException(status_code=202, detail="Analysis pending")
 
+    etag = analysis_etag(result.analysis)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     failed = result.analysis.status == "failed"
     return AnalysisResponse(
         fit_score=result.analysis.fit_score,
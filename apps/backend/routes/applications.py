@@ -3,7 +3,14 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from apps.backend.schemas import CreateApplicationRequest, CreateApplicationResponse
+from apps.backend.schemas import (
+    ApplicationReadinessResponse,
+    BatchApplicationResult,
+    CreateApplicationRequest,
+    CreateApplicationResponse,
+    CreateApplicationsBatchRequest,
+    CreateApplicationsBatchResponse,
+)
 from src.screening.applications.application.services import ApplicationService
 from src.screening.applications.application.services.application_service import (
     TorreNotFoundError,
@@ -18,6 +25,25 @@ def get_application_service() -> ApplicationService:
     return wiring.get_app_application_service()
 
 
+def _to_http_error(error: Exception) -> Optional[HTTPException]:
+    """Map a service or upstream error to the HTTP error the API reports; None if unexpected."""
+    if isinstance(error, ValueError):
+        return HTTPException(status_code=400, detail=str(error))
+    if isinstance(error, EventPublishError):
+        return HTTPException(status_code=503, detail="Event broker unavailable")
+    if isinstance(error, TorreNotFoundError):
+        return HTTPException(status_code=404, detail=str(error))
+    if isinstance(error, (httpx.TimeoutException, httpx.ConnectError)):
+        return HTTPException(status_code=503, detail="Upstream service unavailable")
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code >= 500:
+            return HTTPException(status_code=502, detail="Upstream service error")
+        return HTTPException(status_code=422, detail="Invalid data from upstream")
+    if isinstance(error, httpx.RequestError):
+        return HTTPException(status_code=503, detail="Upstream service unavailable")
+    return None
+
+
 @router.post("", response_model=CreateApplicationResponse, status_code=201)
 async def create_application(
     body: Optional[CreateApplicationRequest] = None,
@@ -34,17 +60,51 @@ async def create_application(
         return CreateApplicationResponse(
             application_id=str(result.application_id),
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except EventPublishError:
-        raise HTTPException(status_code=503, detail="Event broker unavailable")
-    except TorreNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except (httpx.TimeoutException, httpx.ConnectError):
-        raise HTTPException(status_code=503, detail="Upstream service unavailable")
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code >= 500:
-            raise HTTPException(status_code=502, detail="Upstream service error")
-        raise HTTPException(status_code=422, detail="Invalid data from upstream")
-    except httpx.RequestError:
-        raise HTTPException(status_code=503, detail="Upstream service unavailable")
+    except Exception as e:
+        http_error = _to_http_error(e)
+        if http_error is None:
+            raise
+        raise http_error
+
+
+@router.post(":batch", response_model=CreateApplicationsBatchResponse, status_code=200)
+async def create_applications_batch(
+    body: CreateApplicationsBatchRequest,
+    service: ApplicationService = Depends(get_application_service),
+) -> CreateApplicationsBatchResponse:
+    """Create many applications; each item gets the status code the single-item endpoint would return."""
+    results = await service.create_applications(
+        [(item.username, item.job_offer_id) for item in body.items]
+    )
+    items = []
+    for result in results:
+        if result.error is None:
+            items.append(
+                BatchApplicationResult(
+                    status_code=201 if result.created else 200,
+                    application_id=str(result.application_id),
+                    created=result.created,
+                )
+            )
+            continue
+        http_error = _to_http_error(result.error) or HTTPException(
+            status_code=500, detail="Internal server error"
+        )
+        items.append(
+            BatchApplicationResult(
+                status_code=http_error.status_code,
+                application_id=str(result.application_id) if result.application_id else None,
+                created=result.created,
+                error=http_error.detail,
+            )
+        )
+    return CreateApplicationsBatchResponse(results=items)
+
+
+@router.get("/{application_id}/readiness", response_model=ApplicationReadinessResponse)
+async def get_application_readiness(application_id: str) -> ApplicationReadinessResponse:
+    """Progress of the application's JobOfferApplied stages (embeddings, call prompt)."""
+    status = wiring.get_application_readiness(application_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="No readiness recorded for this application")
+    return ApplicationReadinessResponse(**status)
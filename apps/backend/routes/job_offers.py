@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from apps.backend.schemas import (
+    MAX_RANKING_PAGE,
+    JobOfferRankingResponse,
+    RankedCandidateResponse,
+)
+from src.screening.analysis.application.services import CandidateRankingService
+from src import wiring
+
+router = APIRouter(tags=["job-offers"])
+
+
+def get_candidate_ranking_service() -> CandidateRankingService:
+    return wiring.get_candidate_ranking_service()
+
+
+@router.get(
+    "/job-offers/{external_id}/ranking",
+    response_model=JobOfferRankingResponse,
+    status_code=200,
+    responses={404: {"description": "Job offer not found"}},
+)
+async def get_job_offer_ranking(
+    external_id: str,
+    k: int = Query(50, ge=1, le=MAX_RANKING_PAGE, description="Page size"),
+    offset: int = Query(0, ge=0),
+    service: CandidateRankingService = Depends(get_candidate_ranking_service),
+) -> JobOfferRankingResponse:
+    if not external_id.strip():
+        raise HTTPException(status_code=404, detail="Job offer not found")
+    ranking = await service.rank(external_id, k=k, offset=offset)
+    if ranking is None:
+        raise HTTPException(status_code=404, detail="Job offer not found")
+    next_offset = offset + len(ranking.items)
+    return JobOfferRankingResponse(
+        job_offer_id=external_id.strip(),
+        total=ranking.total,
+        unscored=ranking.unscored,
+        offset=offset,
+        next_offset=next_offset if next_offset < ranking.total else None,
+        items=[
+            RankedCandidateResponse(
+                application_id=str(item.applicant.application_id),
+                username=item.applicant.username,
+                full_name=item.applicant.full_name,
+                fit_score=item.fit_score,
+                similarity=item.similarity,
+            )
+            for item in ranking.items
+        ],
+    )
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+
+from apps.backend.schemas import MetricsResponse
+from src import wiring
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_model=MetricsResponse, status_code=200)
+async def get_metrics() -> MetricsResponse:
+    """Database pool gauges, embedding cache hit counters and Torre single-flight/cache counters."""
+    return MetricsResponse(
+        database_pools=wiring.get_database_pool_metrics(),
+        embedding_cache=wiring.get_embedding_cache_metrics(),
+        torre=wiring.get_torre_adapter_metrics(),
+    )
@@ -1,11 +1,29 @@
 from apps.backend.schemas.applications import (
+    ApplicationReadinessResponse,
+    BatchApplicationResult,
     CreateApplicationRequest,
     CreateApplicationResponse,
+    CreateApplicationsBatchRequest,
+    CreateApplicationsBatchResponse,
 )
 from apps.backend.schemas.analysis import AnalysisResponse
+from apps.backend.schemas.job_offers import (
+    MAX_RANKING_PAGE,
+    JobOfferRankingResponse,
+    RankedCandidateResponse,
+)
+from apps.backend.schemas.metrics import MetricsResponse
 
 __all__ = [
     "CreateApplicationRequest",
     "CreateApplicationResponse",
+    "CreateApplicationsBatchRequest",
+    "CreateApplicationsBatchResponse",
+    "BatchApplicationResult",
+    "ApplicationReadinessResponse",
     "AnalysisResponse",
+    "JobOfferRankingResponse",
+    "MAX_RANKING_PAGE",
+    "RankedCandidateResponse",
+    "MetricsResponse",
 ]
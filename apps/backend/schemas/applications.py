@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, StrictStr
 
+MAX_BATCH_ITEMS = 500
+
 
 class CreateApplicationRequest(BaseModel):
     username: Optional[StrictStr] = Field(default=None)
@@ -10,3 +12,23 @@ class CreateApplicationRequest(BaseModel):
 
 class CreateApplicationResponse(BaseModel):
     application_id: str
+
+
+class CreateApplicationsBatchRequest(BaseModel):
+    items: list[CreateApplicationRequest] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchApplicationResult(BaseModel):
+    status_code: int
+    application_id: Optional[str] = None
+    created: bool = False
+    error: Optional[str] = None
+
+
+class CreateApplicationsBatchResponse(BaseModel):
+    results: list[BatchApplicationResult]
+
+
+class ApplicationReadinessResponse(BaseModel):
+    stages: dict[str, str]
+    seconds: dict[str, float]
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+MAX_RANKING_PAGE = 500
+
+
+class RankedCandidateResponse(BaseModel):
+    application_id: str
+    username: str
+    full_name: str
+    fit_score: int = Field(..., ge=0, le=100)
+    similarity: float = Field(..., description="Cosine similarity behind fit_score, in [-1, 1]")
+
+
+class JobOfferRankingResponse(BaseModel):
+    job_offer_id: str
+    total: int = Field(..., description="Applicants with an embedding, i.e. rankable")
+    unscored: int = Field(..., description="Applicants not ranked yet because their embedding is missing")
+    offset: int
+    next_offset: Optional[int] = Field(None, description="Offset of the next page, if any")
+    items: list[RankedCandidateResponse] = Field(default_factory=list)
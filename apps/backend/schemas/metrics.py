@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class MetricsResponse(BaseModel):
+    database_pools: dict[str, dict[str, float]] = Field(default_factory=dict)
+    embedding_cache: dict[str, float] = Field(default_factory=dict)
+    torre: dict[str, dict[str, float]] = Field(default_factory=dict)
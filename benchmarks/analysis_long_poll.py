@@ -0,0 +1,108 @@
+"""
+Load test: interval polling vs ?wait= long-poll on GET /api/applications/{id}/analysis.
+
+Runs the FastAPI app in-process with in-memory repositories. Each simulated client waits
+for one application's analysis, which finishes at a random moment within --spread seconds.
+Prints the total number of requests and the delay between an analysis landing and its
+client seeing it, for each strategy.
+
+    python -m benchmarks.analysis_long_poll [--clients 200] [--interval 1.0] [--spread 3.0]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+
+from apps.backend.main import app
+from apps.backend.routes.analysis import get_analysis_service
+from src.screening.analysis.application.services import AnalysisService
+from src.screening.analysis.infrastructure.adapters.in_memory_analysis_repository import (
+    InMemoryAnalysisRepository,
+)
+from src.screening.applications.domain.entities import ScreeningApplication
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.shared.domain import ApplicationId, CallId, CandidateId, JobOfferId
+
+
+async def _run(strategy: str, clients: int, interval: float, spread: float) -> tuple[int, list[float]]:
+    applications = InMemoryApplicationRepository()
+    ids = []
+    for _ in range(clients):
+        application = ScreeningApplication(
+            id=ApplicationId(uuid4()),
+            candidate_id=CandidateId(uuid4()),
+            job_offer_id=JobOfferId(uuid4()),
+            created_at=datetime.utcnow(),
+        )
+        await applications.save_application(application)
+        ids.append(application.id)
+    service = AnalysisService(
+        get_call_repository=lambda: None,
+        get_application_repository=lambda: applications,
+        get_embeddings=None,
+        analysis_repository=InMemoryAnalysisRepository(),
+    )
+    app.dependency_overrides[get_analysis_service] = lambda: service
+    landed_at: dict[ApplicationId, float] = {}
+    requests = 0
+    delays: list[float] = []
+
+    async def finish(application_id: ApplicationId) -> None:
+        await asyncio.sleep(random.uniform(0.0, spread))
+        await service.run_analysis(application_id, CallId(uuid4()))
+        landed_at[application_id] = time.perf_counter()
+
+    async def client(http: httpx.AsyncClient, application_id: ApplicationId) -> None:
+        nonlocal requests
+        url = f"/api/applications/{application_id}/analysis"
+        while True:
+            requests += 1
+            if strategy == "long-poll":
+                response = await http.get(url, params={"wait": 30})
+            else:
+                response = await http.get(url)
+            if response.status_code == 200:
+                delays.append(time.perf_counter() - landed_at[application_id])
+                return
+            if strategy != "long-poll":
+                await asyncio.sleep(interval)
+
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            await asyncio.gather(
+                *(finish(application_id) for application_id in ids),
+                *(client(http, application_id) for application_id in ids),
+            )
+    finally:
+        app.dependency_overrides.clear()
+    return requests, delays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--spread", type=float, default=3.0)
+    args = parser.parse_args()
+
+    random.seed(0)
+    for strategy in (f"poll every {args.interval:g}s", "long-poll"):
+        requests, delays = asyncio.run(_run(strategy, args.clients, args.interval, args.spread))
+        delays.sort()
+        print(
+            f"{strategy:>16}: {requests:6d} requests ({requests / args.clients:.1f}/client), "
+            f"time-to-result p50 {statistics.median(delays) * 1000:7.1f} ms, "
+            f"max {delays[-1] * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
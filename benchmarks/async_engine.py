@@ -0,0 +1,104 @@
+"""
+Benchmark: sync engine + asyncio.to_thread vs native asyncpg AsyncSession repositories.
+
+Replays the analysis-poll read path (get_application + analysis lookup) with many
+concurrent requests against a real Postgres and prints throughput and p50/p99 per mode.
+Needs SCREENING_DATABASE_URL; seeds its own rows.
+
+    SCREENING_DATABASE_URL=postgresql://... python -m benchmarks.async_engine [--requests 2000] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.stub_servers import percentile
+from src.screening.analysis.infrastructure.adapters.async_postgres_analysis_repository import (
+    AsyncPostgresAnalysisRepository,
+)
+from src.screening.analysis.infrastructure.adapters.postgres_analysis_repository import (
+    PostgresAnalysisRepository,
+)
+from src.screening.applications.domain.entities import ScreeningApplication
+from src.screening.applications.infrastructure.adapters.async_postgres_application_repository import (
+    AsyncPostgresApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    PostgresApplicationRepository,
+)
+from src.screening.persistence import (
+    AsyncSessionProvider,
+    create_engine_from_url,
+    ensure_schema,
+    get_session_factory,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+async def _seed(repo: PostgresApplicationRepository, count: int) -> list[ApplicationId]:
+    ids = []
+    for _ in range(count):
+        application = ScreeningApplication(
+            id=ApplicationId(uuid4()),
+            candidate_id=CandidateId(uuid4()),
+            job_offer_id=JobOfferId(uuid4()),
+            created_at=datetime.utcnow(),
+        )
+        await repo.save_application(application)
+        ids.append(application.id)
+    return ids
+
+
+async def _run(mode: str, database_url: str, requests: int, concurrency: int) -> None:
+    session_factory = get_session_factory(create_engine_from_url(database_url))
+    async_sessions = AsyncSessionProvider(database_url)
+    if mode == "async":
+        async_sessions.open()
+        applications = AsyncPostgresApplicationRepository(session_factory, async_sessions)
+        analyses = AsyncPostgresAnalysisRepository(session_factory, async_sessions)
+    else:
+        applications = PostgresApplicationRepository(session_factory)
+        analyses = PostgresAnalysisRepository(session_factory)
+
+    ids = await _seed(applications, 50)
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def poll(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            application_id = ids[i % len(ids)]
+            await applications.get_application(application_id)
+            await analyses.get_by_application_async(application_id)
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(poll(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await async_sessions.close()
+    print(
+        f"{mode:>6}: {requests / elapsed:8.1f} polls/s "
+        f"p50={percentile(samples, 50):.2f}ms p99={percentile(samples, 99):.2f}ms "
+        f"(n={requests}, concurrency={concurrency})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    database_url = os.environ.get("SCREENING_DATABASE_URL", "")
+    if not database_url:
+        print("async_engine: skipped (set SCREENING_DATABASE_URL to a Postgres database)")
+        return
+    ensure_schema(create_engine_from_url(database_url))
+    for mode in ("sync", "async"):
+        asyncio.run(_run(mode, database_url, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
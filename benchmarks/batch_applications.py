@@ -0,0 +1,145 @@
+"""
+Benchmark: POST /api/applications one item at a time vs POST /api/applications:batch.
+
+Drives ApplicationService directly against a local stub Torre server (with simulated
+upstream latency) and prints applications/second for sequential single-item calls,
+concurrent single-item calls and batches. With SCREENING_DATABASE_URL set, applications
+and the event outbox go through the Postgres repositories (tables are emptied before each
+mode) and database transactions per mode are reported; otherwise in-memory repositories.
+
+    python -m benchmarks.batch_applications [--items 400] [--batch-size 100] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from sqlalchemy import delete, event
+
+from benchmarks.stub_servers import serve_in_thread, torre_stub_app
+from src.screening.applications.application.services import ApplicationService
+from src.screening.applications.domain.ports import EventPublisher
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    PostgresApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
+from src.screening.applications.infrastructure.adapters.reliable_event_publisher import (
+    ReliableEventPublisher,
+)
+from src.screening.applications.infrastructure.adapters.torre_bios_adapter import (
+    TorreBiosAdapter,
+)
+from src.screening.applications.infrastructure.adapters.torre_http_client import (
+    create_torre_http_client,
+)
+from src.screening.applications.infrastructure.adapters.torre_opportunities_adapter import (
+    TorreOpportunitiesAdapter,
+)
+from src.screening.persistence import create_engine_from_url, ensure_schema, get_session_factory
+from src.screening.persistence.models import (
+    ApplicationModel,
+    CandidateModel,
+    JobOfferModel,
+    OutboxEventModel,
+)
+
+
+class _DiscardingPublisher(EventPublisher):
+    def subscribe(self, handler) -> None:
+        pass
+
+    def publish(self, event) -> None:
+        pass
+
+    def publish_many(self, events) -> None:
+        pass
+
+
+def _items(count: int) -> list[tuple[str, str]]:
+    # A recruiter-style import: many candidates spread over a handful of openings.
+    return [(f"user{i % (count // 2 or 1)}", f"job{i % 8}") for i in range(count)]
+
+
+def _reset(session_factory) -> None:
+    with session_factory() as session:
+        for model in (OutboxEventModel, ApplicationModel, CandidateModel, JobOfferModel):
+            session.execute(delete(model))
+        session.commit()
+
+
+async def _run(
+    base_url: str, mode: str, items: list[tuple[str, str]], batch_size: int, session_factory=None
+) -> float:
+    client = create_torre_http_client(http2=False)
+    if session_factory is None:
+        repository = InMemoryApplicationRepository()
+        publisher = _DiscardingPublisher()
+    else:
+        _reset(session_factory)
+        repository = PostgresApplicationRepository(session_factory)
+        publisher = ReliableEventPublisher(
+            delegate=_DiscardingPublisher(), outbox_repository=PostgresOutboxRepository(session_factory)
+        )
+    service = ApplicationService(
+        bios=TorreBiosAdapter(base_url=base_url, get_client=lambda: client),
+        opportunities=TorreOpportunitiesAdapter(base_url=base_url, get_client=lambda: client),
+        repository=repository,
+        event_publisher=publisher,
+    )
+    start = time.perf_counter()
+    try:
+        if mode == "single, sequential":
+            for username, job_offer_id in items:
+                await service.create_application(username, job_offer_id)
+        elif mode == "single, 16 concurrent":
+            semaphore = asyncio.Semaphore(16)
+
+            async def one(username: str, job_offer_id: str) -> None:
+                async with semaphore:
+                    await service.create_application(username, job_offer_id)
+
+            await asyncio.gather(*(one(u, j) for u, j in items))
+        else:
+            for offset in range(0, len(items), batch_size):
+                await service.create_applications(items[offset : offset + batch_size])
+    finally:
+        await client.aclose()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    items = _items(args.items)
+    engine = session_factory = None
+    commits: list[int] = []
+    database_url = os.environ.get("SCREENING_DATABASE_URL")
+    if database_url:
+        engine = create_engine_from_url(database_url)
+        ensure_schema(engine)
+        session_factory = get_session_factory(engine)
+        event.listen(engine, "commit", lambda conn: commits.append(1))
+    with serve_in_thread(torre_stub_app(latency_seconds=args.latency_ms / 1000.0)) as base_url:
+        for mode in ("single, sequential", "single, 16 concurrent", f"batch of {args.batch_size}"):
+            commits.clear()
+            elapsed = asyncio.run(_run(base_url, mode, items, args.batch_size, session_factory))
+            transactions = f", {len(commits) - 1} transactions" if engine is not None else ""
+            print(
+                f"{mode:>22}: {len(items) / elapsed:8.1f} applications/s "
+                f"({elapsed:.2f}s for {len(items)} items{transactions})"
+            )
+    if engine is not None:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
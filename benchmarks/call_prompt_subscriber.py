@@ -0,0 +1,133 @@
+"""
+Benchmark: GenerateCallPrompt handler throughput against the real repositories.
+
+Stores --applications applications to one job offer, then runs their GenerateCallPrompt
+handlers on --workers threads (the JobOfferApplied stage pool) through the repositories
+wiring builds: the application graph load and the call_prompts write hit the database.
+Prints handlers/second and latency percentiles. Uses SCREENING_DATABASE_URL when set
+(benchmark rows are deleted afterwards; add SCREENING_DATABASE_ASYNC=true for asyncpg on
+the subscriber loop), otherwise a throwaway SQLite file.
+
+    python -m benchmarks.call_prompt_subscriber [--applications 400] [--workers 12]
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import delete, insert
+
+from benchmarks.stub_servers import percentile
+from src import wiring
+from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.infrastructure.subscribers import call_prompt
+from src.screening.persistence.models import (
+    ApplicationModel,
+    CallPromptModel,
+    CandidateModel,
+    JobOfferModel,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+def _seed(session_factory, count: int) -> list[JobOfferApplied]:
+    job_offer_id = uuid4()
+    candidate_ids = [uuid4() for _ in range(count)]
+    application_ids = [uuid4() for _ in range(count)]
+    now = datetime.utcnow()
+    with session_factory() as session:
+        session.execute(
+            insert(JobOfferModel),
+            [
+                {
+                    "id": job_offer_id,
+                    "external_id": f"bench-prompt-{job_offer_id}",
+                    "objective": "Build APIs",
+                    "strengths": ["Python"],
+                    "responsibilities": ["Code review"],
+                }
+            ],
+        )
+        session.execute(
+            insert(CandidateModel),
+            [
+                {"id": cid, "username": f"bench{i}", "full_name": "", "skills": ["Python"], "jobs": []}
+                for i, cid in enumerate(candidate_ids)
+            ],
+        )
+        session.execute(
+            insert(ApplicationModel),
+            [
+                {"id": aid, "candidate_id": cid, "job_offer_id": job_offer_id, "created_at": now}
+                for aid, cid in zip(application_ids, candidate_ids)
+            ],
+        )
+        session.commit()
+    return [
+        JobOfferApplied(
+            candidate_id=CandidateId(cid),
+            job_offer_id=JobOfferId(job_offer_id),
+            application_id=ApplicationId(aid),
+            occurred_at=now,
+        )
+        for aid, cid in zip(application_ids, candidate_ids)
+    ]
+
+
+def _cleanup(session_factory, events: list[JobOfferApplied]) -> None:
+    application_ids = [event.application_id.value for event in events]
+    with session_factory() as session:
+        session.execute(delete(CallPromptModel).where(CallPromptModel.application_id.in_(application_ids)))
+        session.execute(delete(ApplicationModel).where(ApplicationModel.id.in_(application_ids)))
+        session.execute(
+            delete(CandidateModel).where(
+                CandidateModel.id.in_([event.candidate_id.value for event in events])
+            )
+        )
+        session.execute(delete(JobOfferModel).where(JobOfferModel.id == events[0].job_offer_id.value))
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--applications", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("SCREENING_DATABASE_URL", f"sqlite:///{tmp}/prompts.db")
+        session_factory = wiring._get_persistence_session_factory()
+        events = _seed(session_factory, args.applications)
+        prompts = wiring.get_call_prompt_repository()
+        latencies: list[float] = []
+
+        def handler(event: JobOfferApplied) -> None:
+            start = time.perf_counter()
+            call_prompt.generate_call_prompt(event).result()
+            latencies.append(time.perf_counter() - start)
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                list(pool.map(handler, events))
+            elapsed = time.perf_counter() - start
+            assert all(
+                prompts.get_prompt(str(e.application_id)).role_context.startswith("Objective:")
+                for e in events
+            )
+        finally:
+            wiring.close_subscriber_loop()
+            _cleanup(session_factory, events)
+
+    print(
+        f"{args.applications} handlers on {args.workers} threads in {elapsed:6.2f} s "
+        f"({args.applications / elapsed:7.1f} handlers/s), "
+        f"p50 {percentile(latencies, 50) * 1000:6.1f} ms, p95 {percentile(latencies, 95) * 1000:6.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
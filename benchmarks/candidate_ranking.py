@@ -0,0 +1,148 @@
+"""
+Benchmark: GET /api/job-offers/{id}/candidates end to end, minus HTTP.
+
+Stores --applicants applications to one job offer, each with a --dimensions-dim float32
+candidate embedding, then times the ranking repository's two queries, decoding the rows
+into the applicant matrix, and ranking it, over --repeats page requests. Uses
+SCREENING_DATABASE_URL when set (benchmark rows are deleted afterwards), otherwise a
+throwaway SQLite file.
+
+    python -m benchmarks.candidate_ranking [--applicants 10000] [--dimensions 768] [--repeats 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import delete, insert
+
+from src.screening.analysis.application.services import CandidateRankingService
+from src.screening.analysis.infrastructure.adapters.postgres_candidate_ranking_repository import (
+    PostgresCandidateRankingRepository,
+    _applicant_embeddings_stmt,
+    _job_offer_embedding_stmt,
+    _to_applicants,
+)
+from src.screening.persistence import create_engine_from_url, ensure_schema, get_session_factory
+from src.screening.persistence.models import (
+    ApplicationModel,
+    CandidateModel,
+    JobOfferModel,
+    entity_embeddings,
+)
+from src.screening.persistence.vectors import pack_float32
+
+_EXTERNAL_ID = "bench-ranking"
+
+
+def _seed(session_factory, applicants: int, dimensions: int) -> list:
+    rng = np.random.default_rng(0)
+    job_offer_id = uuid4()
+    candidate_ids = [uuid4() for _ in range(applicants)]
+    now = datetime.utcnow()
+    with session_factory() as session:
+        session.execute(
+            insert(JobOfferModel),
+            [
+                {
+                    "id": job_offer_id,
+                    "external_id": _EXTERNAL_ID,
+                    "objective": "",
+                    "strengths": [],
+                    "responsibilities": [],
+                }
+            ],
+        )
+        session.execute(
+            insert(CandidateModel),
+            [
+                {"id": cid, "username": f"bench{i}", "full_name": "", "skills": [], "jobs": []}
+                for i, cid in enumerate(candidate_ids)
+            ],
+        )
+        session.execute(
+            insert(ApplicationModel),
+            [
+                {"id": uuid4(), "candidate_id": cid, "job_offer_id": job_offer_id, "created_at": now}
+                for cid in candidate_ids
+            ],
+        )
+        vectors = rng.standard_normal((applicants + 1, dimensions)).astype(np.float32)
+        session.execute(
+            insert(entity_embeddings),
+            [
+                {
+                    "id": uuid4(),
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "embedding_f32": pack_float32(vector),
+                }
+                for (entity_type, entity_id), vector in zip(
+                    [("job_offer", job_offer_id)] + [("candidate", cid) for cid in candidate_ids],
+                    vectors,
+                )
+            ],
+        )
+        session.commit()
+    return [job_offer_id, *candidate_ids]
+
+
+def _cleanup(session_factory, ids: list) -> None:
+    with session_factory() as session:
+        session.execute(delete(entity_embeddings).where(entity_embeddings.c.entity_id.in_(ids)))
+        session.execute(delete(ApplicationModel).where(ApplicationModel.job_offer_id == ids[0]))
+        session.execute(delete(CandidateModel).where(CandidateModel.id.in_(ids[1:])))
+        session.execute(delete(JobOfferModel).where(JobOfferModel.id == ids[0]))
+        session.commit()
+
+
+def _time_page(session_factory, service: CandidateRankingService) -> dict[str, float]:
+    timings = {}
+    start = time.perf_counter()
+    with session_factory() as session:
+        job_offer_row = session.execute(_job_offer_embedding_stmt("float32", _EXTERNAL_ID)).one()
+        applicant_rows = session.execute(_applicant_embeddings_stmt("float32", _EXTERNAL_ID)).all()
+    timings["query"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _to_applicants("float32", job_offer_row, applicant_rows)
+    timings["decode + matrix"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(service.rank(_EXTERNAL_ID, k=50))
+    timings["full page (load + rank)"] = time.perf_counter() - start
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--applicants", type=int, default=10_000)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = os.environ.get("SCREENING_DATABASE_URL") or f"sqlite:///{tmp}/ranking.db"
+        engine = create_engine_from_url(database_url)
+        ensure_schema(engine)
+        session_factory = get_session_factory(engine)
+        ids = _seed(session_factory, args.applicants, args.dimensions)
+        service = CandidateRankingService(PostgresCandidateRankingRepository(session_factory))
+        try:
+            runs = [_time_page(session_factory, service) for _ in range(args.repeats)]
+        finally:
+            _cleanup(session_factory, ids)
+            engine.dispose()
+
+    print(f"{args.applicants} applicants x {args.dimensions} dims, median of {args.repeats}:")
+    for stage in runs[0]:
+        print(f"  {stage:>24}: {statistics.median(run[stage] for run in runs) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: one Ollama /api/embed request per text vs the shared EmbeddingBatcher.
+
+Simulates a burst of JobOfferApplied handlers: --applications handlers on --workers threads,
+each embedding a candidate bio and a job description through the subscriber's
+_embed_with_retry, against a local fake Ollama that processes --parallel requests at a time.
+The embedding cache is disabled so every text reaches the embed endpoint.
+
+    python -m benchmarks.embedding_batching [--applications 200] [--workers 16] [--parallel 1]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stub_servers import ollama_stub_app, serve_in_thread
+from src import wiring
+from src.screening.applications.infrastructure.subscribers import embeddings
+
+
+def _handler(index: int) -> None:
+    embeddings._embed_with_retry(f"Candidate {index} Python SQL Developer at Acme")
+    embeddings._embed_with_retry(f"Job {index} Build APIs Review code Python SQL")
+
+
+def _run(base_url: str, batch_size: int, applications: int, workers: int) -> float:
+    settings = wiring.get_settings()
+    settings.ollama_base_url = base_url
+    settings.embedding_cache_size = 0
+    settings.embedding_batch_max_size = batch_size
+    wiring._embedding_batcher = None
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_handler, range(applications)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--applications", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--parallel", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    for label, batch_size in (("unbatched", 1), (f"batched (max {args.batch_size})", args.batch_size)):
+        app = ollama_stub_app(parallel=args.parallel)
+        with serve_in_thread(app) as base_url:
+            elapsed = _run(base_url, batch_size, args.applications, args.workers)
+        texts = 2 * args.applications
+        print(
+            f"{label:>20}: {texts} texts in {elapsed:6.2f} s ({texts / elapsed:7.1f} texts/s), "
+            f"{app.state.requests} embed requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: JSONB float lists vs packed float32 bytea for entity embeddings.
+
+Always prints the encoded size and decode cost of one vector in each format. With
+SCREENING_DATABASE_URL set it also writes --rows embeddings per format through
+PostgresEmbeddingRepository, then reports stored column bytes and per-read latency.
+Benchmark rows use their own entity_type and are deleted afterwards.
+
+    python -m benchmarks.embedding_storage [--dimensions 768] [--rows 500]
+"""
+import argparse
+import json
+import os
+import time
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import delete, func, select
+
+from benchmarks.stub_servers import percentile
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+)
+from src.screening.persistence import create_engine_from_url, ensure_schema, get_session_factory
+from src.screening.persistence.models import entity_embeddings
+from src.screening.persistence.vectors import pack_float32, unpack_float32
+
+_MODES = ("jsonb", "float32")
+
+
+def _offline(dimensions: int, repeats: int = 2000) -> None:
+    vector = np.random.default_rng(0).standard_normal(dimensions).astype(np.float32).tolist()
+    encoded = {"jsonb": json.dumps(vector).encode(), "float32": pack_float32(vector)}
+    decoders = {
+        # What the JSONB read path did: parse, then convert every element.
+        "jsonb": lambda raw: [float(x) for x in json.loads(raw)],
+        "float32": unpack_float32,
+    }
+    for mode in _MODES:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            decoders[mode](encoded[mode])
+        elapsed = (time.perf_counter() - start) / repeats
+        print(
+            f"{mode:>8}: {len(encoded[mode]):6d} bytes/vector encoded, "
+            f"decode {elapsed * 1e6:8.1f} us"
+        )
+
+
+def _database(database_url: str, dimensions: int, rows: int) -> None:
+    engine = create_engine_from_url(database_url)
+    ensure_schema(engine)
+    session_factory = get_session_factory(engine)
+    rng = np.random.default_rng(1)
+    try:
+        for mode in _MODES:
+            repo = PostgresEmbeddingRepository(session_factory, storage=mode)
+            entity_type = f"bench_{mode}"
+            ids = [str(uuid4()) for _ in range(rows)]
+            for entity_id in ids:
+                repo._save_embedding(entity_type, entity_id, rng.standard_normal(dimensions).tolist())
+            latencies = []
+            for entity_id in ids:
+                start = time.perf_counter()
+                repo._get_embedding(entity_type, entity_id)
+                latencies.append(time.perf_counter() - start)
+            with session_factory() as session:
+                stored = session.scalar(
+                    select(
+                        func.sum(
+                            func.coalesce(func.pg_column_size(entity_embeddings.c.embedding), 0)
+                            + func.coalesce(func.pg_column_size(entity_embeddings.c.embedding_f32), 0)
+                        )
+                    ).where(entity_embeddings.c.entity_type == entity_type)
+                )
+            print(
+                f"{mode:>8}: {stored / rows:8.0f} stored bytes/row, "
+                f"read p50 {percentile(latencies, 50) * 1000:6.2f} ms, "
+                f"p99 {percentile(latencies, 99) * 1000:6.2f} ms"
+            )
+    finally:
+        with session_factory() as session:
+            session.execute(
+                delete(entity_embeddings).where(entity_embeddings.c.entity_type.like("bench_%"))
+            )
+            session.commit()
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--rows", type=int, default=500)
+    args = parser.parse_args()
+
+    _offline(args.dimensions)
+    database_url = os.environ.get("SCREENING_DATABASE_URL")
+    if not database_url:
+        print("SCREENING_DATABASE_URL not set; skipping the Postgres size/latency comparison.")
+        return
+    _database(database_url, args.dimensions, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: cosine similarity in pure Python vs NumPy per pair vs one matrix-vector product.
+
+Scores --candidates random --dimensions-dim embeddings against one job offer embedding and
+prints the time for each implementation.
+
+    python -m benchmarks.similarity [--candidates 500] [--dimensions 768]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.screening.analysis.domain.similarity import cosine_similarities, cosine_similarity
+
+
+def _python_cosine(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    na = sum(x * x for x in a) ** 0.5
+    nb = sum(y * y for y in b) ** 0.5
+    if na == 0 or nb == 0:
+        return 0.0
+    return dot / (na * nb)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--dimensions", type=int, default=768)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2)
+    job = rng.standard_normal(args.dimensions).astype(np.float32)
+    candidates = rng.standard_normal((args.candidates, args.dimensions)).astype(np.float32)
+    job_list, candidate_lists = job.tolist(), candidates.tolist()
+
+    start = time.perf_counter()
+    [_python_cosine(c, job_list) for c in candidate_lists]
+    python_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    [cosine_similarity(c, job) for c in candidates]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cosine_similarities(job, candidates)
+    batch_seconds = time.perf_counter() - start
+
+    print(
+        f"{args.candidates} x {args.dimensions}-dim: pure Python {python_seconds * 1000:.1f} ms, "
+        f"NumPy per pair {single_seconds * 1000:.1f} ms, "
+        f"matrix-vector {batch_seconds * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Local stub upstreams for benchmarks: Torre-like and Ollama-like APIs served by uvicorn on a
+loopback port.
+"""
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import uvicorn
+from fastapi import FastAPI
+
+
+def torre_stub_app(latency_seconds: float = 0.0) -> FastAPI:
+    import asyncio
+
+    app = FastAPI()
+
+    @app.get("/api/genome/bios/{username}")
+    async def bio(username: str) -> dict:
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        return {
+            "person": {"name": f"{username.title()} Stub"},
+            "strengths": [{"name": "Python"}, {"name": "SQL"}],
+            "experience": [{"name": "Developer", "organization": "Acme"}],
+        }
+
+    @app.get("/api/suite/opportunities/{job_offer_id}")
+    async def opportunity(job_offer_id: str) -> dict:
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        return {
+            "objective": f"Stub role {job_offer_id}",
+            "details": [
+                {"code": "strengths", "content": "Python\nSQL"},
+                {"code": "responsibilities", "content": "Build APIs\nReview code"},
+            ],
+        }
+
+    return app
+
+
+def ollama_stub_app(
+    request_seconds: float = 0.02,
+    per_input_seconds: float = 0.001,
+    parallel: int = 1,
+    dimensions: int = 768,
+) -> FastAPI:
+    """
+    Fake Ollama /api/embed. Each request costs ``request_seconds`` plus ``per_input_seconds``
+    per input, and at most ``parallel`` requests are processed at once (OLLAMA_NUM_PARALLEL).
+    ``app.state.requests`` and ``app.state.inputs`` count what was served.
+    """
+    import asyncio
+    import hashlib
+
+    app = FastAPI()
+    app.state.requests = 0
+    app.state.inputs = 0
+    slots = asyncio.Semaphore(parallel)
+
+    @app.post("/api/embed")
+    async def embed(body: dict) -> dict:
+        inputs = body.get("input") or []
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        app.state.requests += 1
+        app.state.inputs += len(inputs)
+        async with slots:
+            await asyncio.sleep(request_seconds + per_input_seconds * len(inputs))
+        vectors = []
+        for text in inputs:
+            seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+            vectors.append([((seed >> (i % 24)) % 1000) / 1000.0 for i in range(dimensions)])
+        return {"model": body.get("model"), "embeddings": vectors}
+
+    return app
+
+
+@contextmanager
+def serve_in_thread(app: FastAPI) -> Iterator[str]:
+    """Serve ``app`` on 127.0.0.1 (ephemeral port) in a daemon thread; yields the base URL."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        sock.close()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
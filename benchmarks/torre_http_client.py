@@ -0,0 +1,58 @@
+"""
+Benchmark: per-request httpx clients vs the shared pooled Torre client.
+
+Runs get_bio + get_opportunity (the two upstream calls of POST /api/applications)
+against a local stub Torre server and prints p50/p99 latency for each mode.
+
+    python -m benchmarks.torre_http_client [--requests 300]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.stub_servers import percentile, serve_in_thread, torre_stub_app
+from src.screening.applications.infrastructure.adapters.torre_bios_adapter import (
+    TorreBiosAdapter,
+)
+from src.screening.applications.infrastructure.adapters.torre_http_client import (
+    create_torre_http_client,
+)
+from src.screening.applications.infrastructure.adapters.torre_opportunities_adapter import (
+    TorreOpportunitiesAdapter,
+)
+
+
+async def _measure(base_url: str, requests: int, pooled: bool) -> list[float]:
+    client = create_torre_http_client(http2=False) if pooled else None
+    get_client = (lambda: client) if pooled else None
+    bios = TorreBiosAdapter(base_url=base_url, get_client=get_client)
+    opportunities = TorreOpportunitiesAdapter(base_url=base_url, get_client=get_client)
+    samples: list[float] = []
+    try:
+        for i in range(requests):
+            start = time.perf_counter()
+            await bios.get_bio(f"user{i}")
+            await opportunities.get_opportunity("job123")
+            samples.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        if client is not None:
+            await client.aclose()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    with serve_in_thread(torre_stub_app()) as base_url:
+        for label, pooled in (("per-request client", False), ("shared pooled client", True)):
+            samples = asyncio.run(_measure(base_url, args.requests, pooled))
+            print(
+                f"{label:>22}: p50={percentile(samples, 50):.2f}ms "
+                f"p99={percentile(samples, 99):.2f}ms (n={len(samples)})"
+            )
+
+
+if __name__ == "__main__":
+    main()
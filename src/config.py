@@ -7,12 +7,40 @@ class Settings(BaseSettings):
     torre_base_url: str = "https://torre.ai"
     torre_timeout: float = 5.0
     torre_retries: int = 1  # Number of retries after first attempt (1 = "retry once" per design)
+    torre_http2: bool = True
+    torre_max_connections: int = 100
+    torre_max_keepalive_connections: int = 20
+    torre_keepalive_expiry: float = 30.0  # Seconds an idle pooled connection is kept open
+    torre_opportunity_cache_size: int = 1024  # 0 disables the opportunity cache
+    torre_opportunity_cache_ttl: float = 300.0
+    torre_opportunity_cache_negative_ttl: float = 30.0  # How long a 404 is remembered
+    analysis_cache_size: int = 4096  # 0 disables the analysis polling cache
+    analysis_cache_ttl: float = 300.0  # How long a finished analysis is served from memory
+    call_prompt_cache_size: int = 4096  # LRU entries in front of call_prompts; without a database, the prompts kept
+    call_prompt_cache_ttl: float = 300.0
+    call_prompt_wait_seconds: float = 5.0  # How long a call start waits for its prompt before using the generic one
+    job_offer_freshness_seconds: float = 3600.0  # Stored job offers older than this are refreshed from Torre
     cors_origins: str = "http://localhost:5173"
 
     broker_url: str = ""
     database_url: str = ""
+    database_async: bool = False  # Request-path and call prompt queries on asyncpg engines; other workers keep the sync engine
+    database_pool_size: int = 5  # Per engine; async mode adds an async engine each for the serving and call prompt loops
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0  # Seconds to wait for a free connection before failing
+    database_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced; -1 disables
+    database_statement_timeout_ms: int = 0  # 0 keeps the server default
+    database_prepared_statement_cache_size: int = 100  # 0 disables client-side prepared statements (PgBouncer)
+    embedding_storage: str = "float32"  # float32 (packed bytea) | pgvector | jsonb (legacy)
+    job_offer_index_enabled: bool = False  # Build the job offer ANN index behind find_similar_job_offers
+    job_offer_index_refresh_seconds: float = 60.0  # Re-sync from the database so other workers' saves appear; 0 syncs at startup only
+    job_offer_index_path: str = ""  # Directory for the job offer ANN index snapshot; empty keeps it in memory only
+    job_offer_index_nprobe: int = 8  # IVF lists scanned per query; higher is more exact and slower
 
     ollama_base_url: str = "http://localhost:11434"
     ollama_timeout: float = 60.0
     ollama_embed_model: str = "nomic-embed-text"
+    embedding_batch_max_size: int = 32  # Texts per Ollama /api/embed request; 1 disables batching
+    embedding_batch_window_ms: float = 10.0  # How long the first text of a batch waits for others
+    embedding_cache_size: int = 4096  # In-process entries in front of the embedding_cache table; 0 disables the cache
     ollama_chat_model: str = "llama3.2"
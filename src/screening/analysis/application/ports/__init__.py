@@ -1,5 +1,10 @@
 from src.screening.analysis.application.ports.analysis_repository import (
     AnalysisRepository,
 )
+from src.screening.analysis.application.ports.candidate_ranking_repository import (
+    Applicant,
+    CandidateRankingRepository,
+    JobOfferApplicants,
+)
 
-__all__ = ["AnalysisRepository"]
+__all__ = ["AnalysisRepository", "Applicant", "CandidateRankingRepository", "JobOfferApplicants"]
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -17,3 +18,17 @@ class AnalysisRepository(ABC):
     @abstractmethod
     def upsert_by_application(self, analysis: ScreeningAnalysis) -> None:
         pass
+
+    # Async entry points for the request path. Defaults run the sync method in a worker
+    # thread; native-async adapters override them.
+
+    async def save_async(self, analysis: ScreeningAnalysis) -> None:
+        await asyncio.to_thread(self.save, analysis)
+
+    async def get_by_application_async(
+        self, application_id: ApplicationId
+    ) -> Optional[ScreeningAnalysis]:
+        return await asyncio.to_thread(self.get_by_application, application_id)
+
+    async def upsert_by_application_async(self, analysis: ScreeningAnalysis) -> None:
+        await asyncio.to_thread(self.upsert_by_application, analysis)
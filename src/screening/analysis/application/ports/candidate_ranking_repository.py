@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.screening.analysis.domain.similarity import row_norms
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+@dataclass(frozen=True)
+class Applicant:
+    application_id: ApplicationId
+    candidate_id: CandidateId
+    username: str
+    full_name: str
+
+
+@dataclass
+class JobOfferApplicants:
+    """
+    A job offer's applicants with usable candidate embeddings, row-aligned with
+    ``candidate_vectors`` (N x d float32) and their precomputed ``candidate_norms``.
+    ``unscored`` counts applicants left out because their embedding is missing or has a
+    different dimension than the job offer's.
+    """
+
+    job_offer_id: JobOfferId
+    job_offer_vector: Optional[np.ndarray]
+    applicants: list[Applicant]
+    candidate_vectors: np.ndarray
+    candidate_norms: np.ndarray
+    unscored: int
+
+    @classmethod
+    def from_rows(
+        cls,
+        job_offer_id: JobOfferId,
+        job_offer_vector: Optional[np.ndarray],
+        rows: Iterable[tuple[Applicant, Optional[np.ndarray]]],
+    ) -> "JobOfferApplicants":
+        dimensions = len(job_offer_vector) if job_offer_vector is not None else None
+        applicants: list[Applicant] = []
+        vectors: list[np.ndarray] = []
+        unscored = 0
+        for applicant, vector in rows:
+            if vector is None or dimensions is None or len(vector) != dimensions:
+                unscored += 1
+                continue
+            applicants.append(applicant)
+            vectors.append(vector)
+        matrix = (
+            np.stack(vectors).astype(np.float32, copy=False)
+            if vectors
+            else np.zeros((0, dimensions or 0), dtype=np.float32)
+        )
+        return cls(job_offer_id, job_offer_vector, applicants, matrix, row_norms(matrix), unscored)
+
+
+class CandidateRankingRepository(ABC):
+    """Read model for ranking a job offer's applicants by embedding similarity."""
+
+    @abstractmethod
+    async def load_job_offer_applicants(
+        self, job_offer_external_id: str
+    ) -> Optional[JobOfferApplicants]:
+        """
+        The job offer's embedding and every applicant's candidate embedding, the latter in
+        one query. None when no job offer has this Torre id.
+        """
+        pass
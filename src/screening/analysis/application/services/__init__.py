@@ -1,5 +1,10 @@
 from src.screening.analysis.application.services.analysis_service import (
     AnalysisService,
 )
+from src.screening.analysis.application.services.candidate_ranking_service import (
+    CandidateRanking,
+    CandidateRankingService,
+    RankedCandidate,
+)
 
-__all__ = ["AnalysisService"]
+__all__ = ["AnalysisService", "CandidateRanking", "CandidateRankingService", "RankedCandidate"]
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Optional, Protocol
+from typing import TYPE_CHECKING, Callable, Optional, Protocol, Sequence
 from uuid import uuid4
 
 from src.screening.analysis.domain.entities import ScreeningAnalysis
+from src.screening.analysis.domain.similarity import cosine_similarity, fit_scores
 from src.screening.analysis.application.ports import AnalysisRepository
 from src.screening.shared.domain import ApplicationId, AnalysisId, CallId
+from src.screening.shared.infrastructure import TtlLruCache
 from src.shared.domain.events import DomainEvent
 
 if TYPE_CHECKING:
+    from src.screening.analysis.domain.events import AnalysisCompleted
     from src.screening.applications.application.ports import ApplicationRepository
     from src.screening.applications.domain.entities import Candidate, JobOffer
     from src.screening.calls.application.ports import CallRepository
@@ -33,7 +37,7 @@ class EmbeddingsLookupPort(Protocol):
         self,
         candidate_id: str,
         job_offer_id: str,
-    ) -> tuple[Optional[list[float]], Optional[list[float]]]:
+    ) -> tuple[Optional[Sequence[float]], Optional[Sequence[float]]]:
         ...
 
 
@@ -47,52 +51,135 @@ class AnalysisService:
         get_embeddings: Optional[EmbeddingsLookupPort],
         analysis_repository: AnalysisRepository,
         event_publisher: Optional[EventPublisherPort] = None,
+        cache_size: int = 4096,
+        cache_ttl_seconds: Optional[float] = 300.0,
     ) -> None:
         self._get_call_repository = get_call_repository
         self._get_application_repository = get_application_repository
         self._get_embeddings = get_embeddings
         self._repository = analysis_repository
         self._event_publisher = event_publisher
+        # Applications are never deleted, so existence is cached without expiry. Finished
+        # analyses expire so a re-run on another worker is picked up eventually.
+        self._known_applications: Optional[TtlLruCache[str, bool]] = None
+        self._finished_analyses: Optional[TtlLruCache[str, ScreeningAnalysis]] = None
+        if cache_size > 0:
+            self._known_applications = TtlLruCache(max_size=cache_size)
+            self._finished_analyses = TtlLruCache(
+                max_size=cache_size, ttl_seconds=cache_ttl_seconds
+            )
+        # Long-poll waiters per application id; woken from whichever thread finishes the analysis.
+        self._waiters: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._waiters_lock = threading.Lock()
 
     async def get_analysis_for_application(
         self, application_id: ApplicationId
     ) -> GetAnalysisResult:
-        app_repo = self._get_application_repository()
-        if app_repo is None:
-            return GetAnalysisResult(found_application=False, analysis=None)
-        app = await app_repo.get_application(application_id)
-        if app is None:
-            return GetAnalysisResult(found_application=False, analysis=None)
-        analysis = await asyncio.to_thread(
-            self._repository.get_by_application,
-            application_id,
-        )
+        """
+        Read-through: finished (completed/failed) analyses are served from memory; a pending
+        poll for a known application costs only the analysis lookup.
+        """
+        key = str(application_id)
+        if self._finished_analyses is not None:
+            cached = self._finished_analyses.get(key)
+            if cached is not None:
+                return GetAnalysisResult(found_application=True, analysis=cached)
+        if self._known_applications is None or not self._known_applications.get(key):
+            app_repo = self._get_application_repository()
+            if app_repo is None:
+                return GetAnalysisResult(found_application=False, analysis=None)
+            app = await app_repo.get_application(application_id)
+            if app is None:
+                return GetAnalysisResult(found_application=False, analysis=None)
+            if self._known_applications is not None:
+                self._known_applications.set(key, True)
+        analysis = await self._repository.get_by_application_async(application_id)
+        if analysis is not None and self._finished_analyses is not None:
+            # A result written by run_analysis while we were reading is newer; keep it.
+            if self._finished_analyses.get(key) is None:
+                self._remember(analysis)
         return GetAnalysisResult(found_application=True, analysis=analysis)
 
+    async def wait_for_analysis(
+        self, application_id: ApplicationId, timeout_seconds: float
+    ) -> GetAnalysisResult:
+        """
+        Like get_analysis_for_application, but while the analysis is pending wait up to
+        ``timeout_seconds`` for it to land (AnalysisCompleted or a local failure) before
+        answering. Returns the pending result if the timeout expires first.
+        """
+        if timeout_seconds <= 0:
+            return await self.get_analysis_for_application(application_id)
+        key = str(application_id)
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        # Register before reading so a completion between the read and the wait is not lost.
+        with self._waiters_lock:
+            self._waiters.setdefault(key, set()).add(waiter)
+        try:
+            result = await self.get_analysis_for_application(application_id)
+            if not result.found_application or result.analysis is not None:
+                return result
+            try:
+                await asyncio.wait_for(waiter[1], timeout_seconds)
+            except asyncio.TimeoutError:
+                return result
+            return await self.get_analysis_for_application(application_id)
+        finally:
+            with self._waiters_lock:
+                waiters = self._waiters.get(key)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[key]
+
+    def on_analysis_completed(self, event: "AnalysisCompleted") -> None:
+        """Drop a cached analysis superseded by the one the event announces, then wake waiters."""
+        key = str(event.application_id)
+        if self._finished_analyses is not None:
+            cached = self._finished_analyses.get(key)
+            if cached is not None and cached.id != event.analysis_id:
+                self._finished_analyses.pop(key)
+        self._wake_waiters(key)
+
+    def _wake_waiters(self, key: str) -> None:
+        with self._waiters_lock:
+            waiters = list(self._waiters.get(key, ()))
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:  # loop already closed
+                pass
+
+    def _remember(self, analysis: ScreeningAnalysis) -> None:
+        if self._finished_analyses is None or analysis.status not in ("completed", "failed"):
+            return
+        self._finished_analyses.set(str(analysis.application_id), analysis)
+        if self._known_applications is not None:
+            self._known_applications.set(str(analysis.application_id), True)
+
+    def _persisted(self, analysis: ScreeningAnalysis) -> None:
+        self._remember(analysis)
+        self._wake_waiters(str(analysis.application_id))
+
     async def run_analysis(self, application_id: ApplicationId, call_id: CallId) -> None:
         repo = self._get_call_repository()
         if repo is None:
-            await asyncio.to_thread(_persist_default, self._repository, application_id)
+            self._persisted(await _persist_default(self._repository, application_id))
             return
-        call = await asyncio.to_thread(repo.get_call, call_id)
+        call = await repo.get_call_async(call_id)
         if call is None:
-            await asyncio.to_thread(_persist_default, self._repository, application_id)
+            self._persisted(await _persist_default(self._repository, application_id))
             return
         transcript = call.transcript or []
         app_repo = self._get_application_repository()
         candidate = None
         job_offer = None
         if app_repo is not None:
-            app = await app_repo.get_application(application_id)
-            if app is not None:
-                candidate = await asyncio.to_thread(
-                    app_repo.get_candidate,
-                    app.candidate_id,
-                )
-                job_offer = await asyncio.to_thread(
-                    app_repo.get_job_offer,
-                    app.job_offer_id,
-                )
+            graph = await app_repo.get_application_graph(application_id)
+            if graph is not None:
+                candidate = graph.candidate
+                job_offer = graph.job_offer
 
         fit_score, skills = await asyncio.to_thread(
             _compute_fit_score_and_skills,
@@ -109,7 +196,8 @@ class AnalysisService:
             completed_at=datetime.utcnow(),
             status="completed",
         )
-        await asyncio.to_thread(self._repository.upsert_by_application, analysis)
+        await self._repository.upsert_by_application_async(analysis)
+        self._persisted(analysis)
         if self._event_publisher is not None:
             from src.screening.analysis.domain.events import AnalysisCompleted
             await asyncio.to_thread(
@@ -131,18 +219,13 @@ class AnalysisService:
             completed_at=datetime.utcnow(),
             status="failed",
         )
-        await asyncio.to_thread(self._repository.upsert_by_application, analysis)
+        await self._repository.upsert_by_application_async(analysis)
+        self._persisted(analysis)
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    na = sum(x * x for x in a) ** 0.5
-    nb = sum(y * y for y in b) ** 0.5
-    if na == 0 or nb == 0:
-        return 0.0
-    return dot / (na * nb)
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
 
 
 def _compute_fit_score_and_skills(
@@ -172,10 +255,14 @@ def _compute_fit_score_and_skills(
 
     if get_embeddings and candidate and job_offer:
         cand_emb, job_emb = get_embeddings(str(candidate.id), str(job_offer.id))
-        if cand_emb and job_emb and len(cand_emb) == len(job_emb):
-            cos = _cosine_similarity(cand_emb, job_emb)
-            score = int(round((cos + 1.0) / 2.0 * 100))
-            return max(0, min(100, score)), skills
+        # Vectors may be NumPy arrays, whose truth value is ambiguous; test lengths instead.
+        if (
+            cand_emb is not None
+            and job_emb is not None
+            and len(cand_emb) > 0
+            and len(cand_emb) == len(job_emb)
+        ):
+            return int(fit_scores(cosine_similarity(cand_emb, job_emb))), skills
 
     if not transcript or len(transcript) < 2:
         return 0, skills
@@ -188,7 +275,9 @@ def _compute_fit_score_and_skills(
     return min(100, score), skills
 
 
-def _persist_default(repository: AnalysisRepository, application_id: ApplicationId) -> None:
+async def _persist_default(
+    repository: AnalysisRepository, application_id: ApplicationId
+) -> ScreeningAnalysis:
     analysis = ScreeningAnalysis(
         id=AnalysisId(uuid4()),
         application_id=application_id,
@@ -197,4 +286,5 @@ def _persist_default(repository: AnalysisRepository, application_id: Application
         completed_at=datetime.utcnow(),
         status="completed",
     )
-    repository.upsert_by_application(analysis)
+    await repository.upsert_by_application_async(analysis)
+    return analysis
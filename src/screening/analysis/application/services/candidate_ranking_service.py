@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.screening.analysis.application.ports import Applicant, CandidateRankingRepository
+from src.screening.analysis.domain.similarity import cosine_similarities, fit_scores
+
+
+@dataclass(frozen=True)
+class RankedCandidate:
+    applicant: Applicant
+    fit_score: int
+    similarity: float
+
+
+@dataclass
+class CandidateRanking:
+    """One page of a job offer's applicants, best fit first."""
+
+    total: int  # applicants with a usable embedding
+    unscored: int  # applicants without one (not ranked)
+    offset: int
+    items: list[RankedCandidate]
+
+
+class CandidateRankingService:
+    """Ranks a job offer's applicants by embedding fit score (see docs/fit-score-algorithm.md)."""
+
+    def __init__(self, repository: CandidateRankingRepository) -> None:
+        self._repository = repository
+
+    async def rank(
+        self, job_offer_external_id: str, k: int, offset: int = 0
+    ) -> Optional[CandidateRanking]:
+        """Top ``k`` applicants after ``offset``; None when the job offer is unknown."""
+        loaded = await self._repository.load_job_offer_applicants(job_offer_external_id)
+        if loaded is None:
+            return None
+        if loaded.job_offer_vector is None or not loaded.applicants:
+            return CandidateRanking(
+                total=len(loaded.applicants), unscored=loaded.unscored, offset=offset, items=[]
+            )
+        similarities = cosine_similarities(
+            loaded.job_offer_vector, loaded.candidate_vectors, loaded.candidate_norms
+        )
+        order = _top_indices(similarities, offset + k)[offset:]
+        scores = fit_scores(similarities[order])
+        return CandidateRanking(
+            total=len(loaded.applicants),
+            unscored=loaded.unscored,
+            offset=offset,
+            items=[
+                RankedCandidate(
+                    applicant=loaded.applicants[index],
+                    fit_score=int(score),
+                    similarity=float(similarities[index]),
+                )
+                for index, score in zip(order.tolist(), scores.tolist())
+            ],
+        )
+
+
+def _top_indices(similarities: np.ndarray, limit: int) -> np.ndarray:
+    """Indices of the ``limit`` highest similarities, best first; partial sort when limit < N."""
+    if limit <= 0:
+        return np.zeros(0, dtype=np.intp)
+    negated = -similarities
+    if limit < len(similarities):
+        candidates = np.argpartition(negated, limit - 1)[:limit]
+        return candidates[np.argsort(negated[candidates], kind="stable")]
+    return np.argsort(negated, kind="stable")
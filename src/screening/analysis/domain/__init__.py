@@ -1,4 +1,19 @@
 from src.screening.analysis.domain.entities import ScreeningAnalysis
+from src.screening.analysis.domain.similarity import (
+    cosine_similarities,
+    cosine_similarity,
+    fit_scores,
+    row_norms,
+    score_candidates,
+)
 from src.screening.analysis.domain.value_objects import FitAssessment
 
-__all__ = ["ScreeningAnalysis", "FitAssessment"]
+__all__ = [
+    "ScreeningAnalysis",
+    "FitAssessment",
+    "cosine_similarities",
+    "cosine_similarity",
+    "fit_scores",
+    "row_norms",
+    "score_candidates",
+]
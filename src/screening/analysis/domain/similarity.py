@@ -0,0 +1,56 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+Vector = Union[Sequence[float], np.ndarray]
+
+
+def cosine_similarity(a: Vector, b: Vector) -> float:
+    """Cosine of two equal-length vectors; 0.0 when either is empty, zero or the lengths differ."""
+    va = np.asarray(a, dtype=np.float32)
+    vb = np.asarray(b, dtype=np.float32)
+    if va.size == 0 or va.shape != vb.shape:
+        return 0.0
+    denominator = float(np.linalg.norm(va)) * float(np.linalg.norm(vb))
+    if denominator == 0.0:
+        return 0.0
+    return float(np.dot(va, vb)) / denominator
+
+
+def row_norms(matrix: np.ndarray) -> np.ndarray:
+    """L2 norm of each row without materialising ``matrix * matrix``."""
+    return np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+
+
+def cosine_similarities(
+    query: Vector,
+    matrix: Union[np.ndarray, Sequence[Vector]],
+    norms: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Cosine of ``query`` against every row of ``matrix`` (N x d) in one matrix-vector
+    product. Rows with zero norm, or a zero query, score 0.0. Pass precomputed ``norms``
+    (see row_norms) when scoring the same matrix repeatedly; they dominate the cost otherwise.
+    """
+    q = np.asarray(query, dtype=np.float32)
+    m = np.asarray(matrix, dtype=np.float32)
+    if m.ndim != 2:
+        return np.zeros(0, dtype=np.float32)
+    if q.ndim != 1 or q.size == 0 or m.shape[1] != q.shape[0]:
+        return np.zeros(m.shape[0], dtype=np.float32)
+    denominators = (row_norms(m) if norms is None else norms) * np.linalg.norm(q)
+    dots = m @ q
+    return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators > 0)
+
+
+def fit_scores(similarities: Union[float, np.ndarray]) -> np.ndarray:
+    """Map cosine in [-1, 1] to the 0–100 fit score (see docs/fit-score-algorithm.md)."""
+    scores = np.rint((np.asarray(similarities, dtype=np.float64) + 1.0) / 2.0 * 100.0)
+    return np.clip(scores, 0, 100).astype(np.int64)
+
+
+def score_candidates(
+    job_offer_vector: Vector, candidate_vectors: Union[np.ndarray, Sequence[Vector]]
+) -> np.ndarray:
+    """Fit scores (0–100) of N candidate vectors against one job offer, in input order."""
+    return fit_scores(cosine_similarities(job_offer_vector, candidate_vectors))
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from sqlalchemy import select
+
+from src.screening.analysis.domain.entities import ScreeningAnalysis
+from src.screening.analysis.infrastructure.adapters.postgres_analysis_repository import (
+    PostgresAnalysisRepository,
+    _analysis_to_row,
+    _row_to_analysis,
+    _upsert_analysis_stmt,
+)
+from src.screening.persistence import AsyncSessionProvider
+from src.screening.persistence.models import AnalysisModel
+from src.screening.shared.domain import ApplicationId
+
+
+class AsyncPostgresAnalysisRepository(PostgresAnalysisRepository):
+    """PostgresAnalysisRepository with native AsyncSession implementations of the async methods."""
+
+    def __init__(self, session_factory, async_sessions: AsyncSessionProvider) -> None:
+        super().__init__(session_factory)
+        self._async_sessions = async_sessions
+
+    async def save_async(self, analysis: ScreeningAnalysis) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().save_async(analysis)
+            return
+        async with async_session_factory() as session:
+            await session.merge(_analysis_to_row(analysis))
+            await session.commit()
+
+    async def get_by_application_async(
+        self, application_id: ApplicationId
+    ) -> Optional[ScreeningAnalysis]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().get_by_application_async(application_id)
+        async with async_session_factory() as session:
+            row = (
+                await session.execute(
+                    select(AnalysisModel).where(
+                        AnalysisModel.application_id == application_id.value
+                    )
+                )
+            ).scalars().first()
+            return _row_to_analysis(row) if row else None
+
+    async def upsert_by_application_async(self, analysis: ScreeningAnalysis) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().upsert_by_application_async(analysis)
+            return
+        async with async_session_factory() as session:
+            await session.execute(_upsert_analysis_stmt(analysis))
+            await session.commit()
@@ -0,0 +1,39 @@
+import asyncio
+from typing import Optional
+
+from src.screening.analysis.application.ports import JobOfferApplicants
+from src.screening.analysis.infrastructure.adapters.postgres_candidate_ranking_repository import (
+    PostgresCandidateRankingRepository,
+    _applicant_embeddings_stmt,
+    _job_offer_embedding_stmt,
+    _to_applicants,
+)
+from src.screening.persistence import AsyncSessionProvider
+
+
+class AsyncPostgresCandidateRankingRepository(PostgresCandidateRankingRepository):
+    """PostgresCandidateRankingRepository with a native AsyncSession load."""
+
+    def __init__(
+        self, session_factory, async_sessions: AsyncSessionProvider, storage: str = "float32"
+    ) -> None:
+        super().__init__(session_factory, storage)
+        self._async_sessions = async_sessions
+
+    async def load_job_offer_applicants(
+        self, job_offer_external_id: str
+    ) -> Optional[JobOfferApplicants]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().load_job_offer_applicants(job_offer_external_id)
+        async with async_session_factory() as session:
+            job_offer_row = (
+                await session.execute(_job_offer_embedding_stmt(self._storage, job_offer_external_id))
+            ).one_or_none()
+            if job_offer_row is None:
+                return None
+            applicant_rows = (
+                await session.execute(_applicant_embeddings_stmt(self._storage, job_offer_external_id))
+            ).all()
+        # Decoding and stacking N vectors is CPU work; keep it off the event loop.
+        return await asyncio.to_thread(_to_applicants, self._storage, job_offer_row, applicant_rows)
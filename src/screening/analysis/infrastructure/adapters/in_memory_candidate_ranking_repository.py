@@ -0,0 +1,59 @@
+import asyncio
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.screening.analysis.application.ports import (
+    Applicant,
+    CandidateRankingRepository,
+    JobOfferApplicants,
+)
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+
+EmbeddingLookup = Callable[[str], Optional[object]]
+
+
+def _as_vector(embedding) -> Optional[np.ndarray]:
+    if embedding is None or len(embedding) == 0:
+        return None
+    return np.asarray(embedding, dtype=np.float32)
+
+
+class InMemoryCandidateRankingRepository(CandidateRankingRepository):
+    def __init__(
+        self,
+        applications: InMemoryApplicationRepository,
+        get_candidate_embedding: EmbeddingLookup,
+        get_job_offer_embedding: EmbeddingLookup,
+    ) -> None:
+        self._applications = applications
+        self._get_candidate_embedding = get_candidate_embedding
+        self._get_job_offer_embedding = get_job_offer_embedding
+
+    async def load_job_offer_applicants(
+        self, job_offer_external_id: str
+    ) -> Optional[JobOfferApplicants]:
+        job_offer = await self._applications.find_job_offer_by_external_id(job_offer_external_id)
+        if job_offer is None:
+            return None
+        return await asyncio.to_thread(self._load, job_offer_external_id, job_offer)
+
+    def _load(self, job_offer_external_id: str, job_offer) -> JobOfferApplicants:
+        rows = [
+            (
+                Applicant(
+                    application_id=application.id,
+                    candidate_id=application.candidate_id,
+                    username=candidate.username if candidate else "",
+                    full_name=candidate.full_name if candidate else "",
+                ),
+                _as_vector(self._get_candidate_embedding(str(application.candidate_id))),
+            )
+            for application, candidate in self._applications.list_applications_for_job_offer(
+                job_offer_external_id
+            )
+        ]
+        job_offer_vector = _as_vector(self._get_job_offer_embedding(str(job_offer.id)))
+        return JobOfferApplicants.from_rows(job_offer.id, job_offer_vector, rows)
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.screening.analysis.application.ports import AnalysisRepository
 from src.screening.analysis.domain.entities import ScreeningAnalysis
@@ -20,21 +21,49 @@ def _row_to_analysis(row: AnalysisModel) -> ScreeningAnalysis:
     )
 
 
+def _analysis_to_row(analysis: ScreeningAnalysis) -> AnalysisModel:
+    return AnalysisModel(
+        id=analysis.id.value,
+        application_id=analysis.application_id.value,
+        fit_score=analysis.fit_score,
+        skills=analysis.skills,
+        completed_at=analysis.completed_at,
+        status=getattr(analysis, "status", "completed"),
+    )
+
+
+def _upsert_analysis_stmt(analysis: ScreeningAnalysis):
+    """
+    One-statement upsert keyed by application_id. The row takes the new analysis id too, so
+    the stored id always matches the latest AnalysisCompleted event.
+    """
+    stmt = pg_insert(AnalysisModel).values(
+        id=analysis.id.value,
+        application_id=analysis.application_id.value,
+        fit_score=analysis.fit_score,
+        skills=analysis.skills,
+        completed_at=analysis.completed_at,
+        status=getattr(analysis, "status", "completed"),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[AnalysisModel.application_id],
+        set_={
+            "id": stmt.excluded.id,
+            "fit_score": stmt.excluded.fit_score,
+            "skills": stmt.excluded.skills,
+            "completed_at": stmt.excluded.completed_at,
+            "status": stmt.excluded.status,
+        },
+    )
+
+
 class PostgresAnalysisRepository(AnalysisRepository):
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
 
     def save(self, analysis: ScreeningAnalysis) -> None:
         with self._session_factory() as session:
-            row = AnalysisModel(
-                id=analysis.id.value,
-                application_id=analysis.application_id.value,
-                fit_score=analysis.fit_score,
-                skills=analysis.skills,
-                completed_at=analysis.completed_at,
-                status=getattr(analysis, "status", "completed"),
-            )
-            session.merge(row)
+            session.merge(_analysis_to_row(analysis))
             session.commit()
 
     def get_by_application(self, application_id: ApplicationId) -> Optional[ScreeningAnalysis]:
@@ -52,29 +81,5 @@ class PostgresAnalysisRepository(AnalysisRepository):
 
     def upsert_by_application(self, analysis: ScreeningAnalysis) -> None:
         with self._session_factory() as session:
-            row = (
-                session.execute(
-                    select(AnalysisModel).where(
-                        AnalysisModel.application_id == analysis.application_id.value
-                    )
-                )
-                .scalars()
-                .first()
-            )
-            if row:
-                row.fit_score = analysis.fit_score
-                row.skills = analysis.skills
-                row.completed_at = analysis.completed_at
-                row.status = getattr(analysis, "status", "completed")
-            else:
-                session.add(
-                    AnalysisModel(
-                        id=analysis.id.value,
-                        application_id=analysis.application_id.value,
-                        fit_score=analysis.fit_score,
-                        skills=analysis.skills,
-                        completed_at=analysis.completed_at,
-                        status=getattr(analysis, "status", "completed"),
-                    )
-                )
+            session.execute(_upsert_analysis_stmt(analysis))
             session.commit()
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, select
+
+from src.screening.analysis.application.ports import (
+    Applicant,
+    CandidateRankingRepository,
+    JobOfferApplicants,
+)
+from src.screening.persistence.models import (
+    ApplicationModel,
+    CandidateModel,
+    JobOfferModel,
+    entity_embeddings,
+)
+from src.screening.persistence.vectors import decode_embedding
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+def _embedding_columns(storage: str) -> list:
+    columns = [entity_embeddings.c.embedding_f32, entity_embeddings.c.embedding]
+    if storage == "pgvector":
+        columns.append(entity_embeddings.c.embedding_vector)
+    return columns
+
+
+def _embedding_join(entity_type: str, entity_id_column):
+    return and_(
+        entity_embeddings.c.entity_type == entity_type,
+        entity_embeddings.c.entity_id == entity_id_column,
+    )
+
+
+def _job_offer_embedding_stmt(storage: str, external_id: str):
+    return (
+        select(JobOfferModel.id, *_embedding_columns(storage))
+        .outerjoin(entity_embeddings, _embedding_join("job_offer", JobOfferModel.id))
+        .where(JobOfferModel.external_id == external_id.strip())
+    )
+
+
+def _applicant_embeddings_stmt(storage: str, external_id: str):
+    return (
+        select(
+            ApplicationModel.id,
+            ApplicationModel.candidate_id,
+            CandidateModel.username,
+            CandidateModel.full_name,
+            *_embedding_columns(storage),
+        )
+        .join(JobOfferModel, JobOfferModel.id == ApplicationModel.job_offer_id)
+        .outerjoin(CandidateModel, CandidateModel.id == ApplicationModel.candidate_id)
+        .outerjoin(entity_embeddings, _embedding_join("candidate", ApplicationModel.candidate_id))
+        .where(JobOfferModel.external_id == external_id.strip())
+    )
+
+
+def _decode(storage: str, row: Any):
+    # Only pgvector selects embedding_vector; a missing-key lookup on a Row is slow, and
+    # this runs once per applicant.
+    vector = row.embedding_vector if storage == "pgvector" else None
+    return decode_embedding(storage, row.embedding_f32, row.embedding, vector)
+
+
+def _to_applicants(
+    storage: str, job_offer_row: Any, applicant_rows: Sequence[Any]
+) -> JobOfferApplicants:
+    return JobOfferApplicants.from_rows(
+        JobOfferId(job_offer_row.id),
+        _decode(storage, job_offer_row),
+        (
+            (
+                Applicant(
+                    application_id=ApplicationId(row.id),
+                    candidate_id=CandidateId(row.candidate_id),
+                    username=row.username or "",
+                    full_name=row.full_name or "",
+                ),
+                _decode(storage, row),
+            )
+            for row in applicant_rows
+        ),
+    )
+
+
+class PostgresCandidateRankingRepository(CandidateRankingRepository):
+    def __init__(self, session_factory, storage: str = "float32") -> None:
+        self._session_factory = session_factory
+        self._storage = storage
+
+    async def load_job_offer_applicants(
+        self, job_offer_external_id: str
+    ) -> Optional[JobOfferApplicants]:
+        return await asyncio.to_thread(self._load, job_offer_external_id)
+
+    def _load(self, job_offer_external_id: str) -> Optional[JobOfferApplicants]:
+        with self._session_factory() as session:
+            job_offer_row = session.execute(
+                _job_offer_embedding_stmt(self._storage, job_offer_external_id)
+            ).one_or_none()
+            if job_offer_row is None:
+                return None
+            applicant_rows = session.execute(
+                _applicant_embeddings_stmt(self._storage, job_offer_external_id)
+            ).all()
+        return _to_applicants(self._storage, job_offer_row, applicant_rows)
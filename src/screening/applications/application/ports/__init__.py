@@ -1,8 +1,23 @@
 from src.screening.applications.application.ports.application_repository import (
     ApplicationRepository,
 )
+from src.screening.applications.application.ports.embedding_cache_repository import (
+    EmbeddingCacheRepository,
+)
 from src.screening.applications.application.ports.embedding_repository import (
     EmbeddingRepository,
+    EmbeddingVector,
+)
+from src.screening.applications.application.ports.job_offer_similarity_index import (
+    JobOfferSimilarityIndex,
+    SimilarJobOffer,
 )
 
-__all__ = ["ApplicationRepository", "EmbeddingRepository"]
+__all__ = [
+    "ApplicationRepository",
+    "EmbeddingCacheRepository",
+    "EmbeddingRepository",
+    "EmbeddingVector",
+    "JobOfferSimilarityIndex",
+    "SimilarJobOffer",
+]
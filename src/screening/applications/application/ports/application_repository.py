@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.screening.applications.domain.entities import (
+    ApplicationGraph,
     Candidate,
     JobOffer,
     ScreeningApplication,
@@ -16,6 +17,20 @@ class ApplicationRepository(ABC):
     ) -> Optional[ScreeningApplication]:
         pass
 
+    @abstractmethod
+    async def find_applications_by_username_and_job_offers(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScreeningApplication]:
+        """
+        Look up many (username, job external_id) pairs at once. Result keys are normalized
+        (lowercased username, stripped job id); pairs without an application are absent.
+        """
+        pass
+
+    @abstractmethod
+    async def find_job_offer_by_external_id(self, external_id: str) -> Optional[JobOffer]:
+        pass
+
     @abstractmethod
     async def save_candidate(self, candidate: Candidate) -> CandidateId:
         pass
@@ -37,12 +52,34 @@ class ApplicationRepository(ABC):
         job_offer: JobOffer,
         application: ScreeningApplication,
     ) -> ApplicationId:
+        """
+        Atomically save the graph unless an application already exists for
+        (username, job external_id); returns the id of whichever application owns that key.
+        """
+        pass
+
+    @abstractmethod
+    async def save_application_graphs(
+        self,
+        graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    ) -> list[ApplicationId]:
+        """
+        Batch form of save_application_graph. Returns, per graph and in input order, the id of
+        the application owning its (username, job external_id) key. Keys must be distinct.
+        """
         pass
 
     @abstractmethod
     async def get_application(self, application_id: ApplicationId) -> Optional[ScreeningApplication]:
         pass
 
+    @abstractmethod
+    async def get_application_graph(
+        self, application_id: ApplicationId
+    ) -> Optional[ApplicationGraph]:
+        """The application with its candidate and job offer, in one round trip where possible."""
+        pass
+
     @abstractmethod
     def get_candidate(self, candidate_id: CandidateId) -> Optional[Candidate]:
         pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.screening.applications.application.ports.embedding_repository import EmbeddingVector
+
+
+class EmbeddingCacheRepository(ABC):
+    """Port for the durable tier of the embedding cache: vectors keyed by (model, sha256 of the text)."""
+
+    @abstractmethod
+    def get(self, model: str, text_sha256: str) -> Optional[EmbeddingVector]:
+        pass
+
+    @abstractmethod
+    def put(self, model: str, text_sha256: str, embedding: EmbeddingVector) -> None:
+        pass
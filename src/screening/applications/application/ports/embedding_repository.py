@@ -1,22 +1,48 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Adapters may hand back a float32 NumPy array (possibly a read-only view) instead of a list.
+EmbeddingVector = Union[List[float], np.ndarray]
 
 
 class EmbeddingRepository(ABC):
     """Port for persisting and retrieving embeddings for candidates and job offers (FR-2.1, FR-2.2)."""
 
     @abstractmethod
-    def get_candidate_embedding(self, candidate_id: str) -> Optional[List[float]]:
+    def get_candidate_embedding(self, candidate_id: str) -> Optional[EmbeddingVector]:
+        pass
+
+    @abstractmethod
+    def get_job_offer_embedding(self, job_offer_id: str) -> Optional[EmbeddingVector]:
         pass
 
     @abstractmethod
-    def get_job_offer_embedding(self, job_offer_id: str) -> Optional[List[float]]:
+    def save_candidate_embedding(self, candidate_id: str, embedding: EmbeddingVector) -> None:
         pass
 
     @abstractmethod
-    def save_candidate_embedding(self, candidate_id: str, embedding: List[float]) -> None:
+    def save_job_offer_embedding(self, job_offer_id: str, embedding: EmbeddingVector) -> None:
         pass
 
     @abstractmethod
-    def save_job_offer_embedding(self, job_offer_id: str, embedding: List[float]) -> None:
+    def list_job_offer_embeddings(self) -> Iterator[Tuple[str, EmbeddingVector]]:
+        """Every stored (job_offer_id, embedding), streamed; used to (re)build similarity indexes."""
         pass
+
+    # Async entry points for the request path. Defaults run the sync method in a worker
+    # thread; native-async adapters override them.
+
+    async def get_candidate_embedding_async(self, candidate_id: str) -> Optional[EmbeddingVector]:
+        return await asyncio.to_thread(self.get_candidate_embedding, candidate_id)
+
+    async def get_job_offer_embedding_async(self, job_offer_id: str) -> Optional[EmbeddingVector]:
+        return await asyncio.to_thread(self.get_job_offer_embedding, job_offer_id)
+
+    async def save_candidate_embedding_async(self, candidate_id: str, embedding: EmbeddingVector) -> None:
+        await asyncio.to_thread(self.save_candidate_embedding, candidate_id, embedding)
+
+    async def save_job_offer_embedding_async(self, job_offer_id: str, embedding: EmbeddingVector) -> None:
+        await asyncio.to_thread(self.save_job_offer_embedding, job_offer_id, embedding)
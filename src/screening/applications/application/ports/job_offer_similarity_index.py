@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SimilarJobOffer:
+    job_offer_id: str
+    similarity: float  # Cosine of the candidate and job offer embeddings, in [-1, 1]
+
+
+class JobOfferSimilarityIndex(ABC):
+    """Port for nearest-neighbour lookup of job offers by embedding similarity to a candidate."""
+
+    @abstractmethod
+    async def find_similar_job_offers(self, candidate_id: str, k: int) -> list[SimilarJobOffer]:
+        """Up to ``k`` job offers, most similar first; empty when the candidate has no embedding."""
+        pass
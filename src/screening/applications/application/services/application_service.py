@@ -1,5 +1,7 @@
 import asyncio
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
 from uuid import uuid4
 
 from src.screening.applications.domain.entities import (
@@ -8,13 +10,18 @@ from src.screening.applications.domain.entities import (
     ScreeningApplication,
 )
 from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.domain.value_objects import CandidateFromTorre
 from src.screening.applications.domain.ports import (
     EventPublisher,
+    EventPublishError,
     TorreBiosPort,
     TorreOpportunitiesPort,
 )
 from src.screening.applications.application.ports import ApplicationRepository
 from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+from src.screening.shared.infrastructure import KeyedLocks, SingleFlight
+
+T = TypeVar("T")
 
 
 class CreateApplicationResult:
@@ -23,6 +30,20 @@ class CreateApplicationResult:
         self.created = created
 
 
+class BatchItemResult:
+    """Outcome of one batch item: an application id, or the error the single-item path would raise."""
+
+    def __init__(
+        self,
+        application_id: Optional[ApplicationId] = None,
+        created: bool = False,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.application_id = application_id
+        self.created = created
+        self.error = error
+
+
 class ApplicationService:
     def __init__(
         self,
@@ -30,22 +51,77 @@ class ApplicationService:
         opportunities: TorreOpportunitiesPort,
         repository: ApplicationRepository,
         event_publisher: EventPublisher,
+        job_offer_freshness: timedelta = timedelta(hours=1),
+        batch_concurrency: int = 16,
     ) -> None:
         self._bios = bios
         self._opportunities = opportunities
         self._repository = repository
         self._event_publisher = event_publisher
-        self._create_locks: dict[tuple[str, str], asyncio.Lock] = {}
-        self._create_locks_guard = asyncio.Lock()
-
-    async def _get_create_lock(self, username: str, job_offer_id: str) -> asyncio.Lock:
-        key = (username.lower(), job_offer_id)
-        async with self._create_locks_guard:
-            lock = self._create_locks.get(key)
-            if lock is None:
-                lock = asyncio.Lock()
-                self._create_locks[key] = lock
-            return lock
+        self._job_offer_freshness = job_offer_freshness
+        self._job_offer_flight: SingleFlight[str, Optional[tuple[JobOffer, bool]]] = SingleFlight()
+        self._create_locks: KeyedLocks[tuple[str, str]] = KeyedLocks()
+        self._batch_concurrency = batch_concurrency
+
+    async def _resolve_job_offer(self, external_id: str) -> Optional[tuple[JobOffer, bool]]:
+        """
+        Reuse the stored job offer for ``external_id`` while it is fresh; otherwise refresh it
+        from Torre in place (same id, so its embedding stays keyed the same way).
+        Returns (job_offer, changed) or None when Torre has no such opportunity.
+        """
+        stored = await self._repository.find_job_offer_by_external_id(external_id)
+        now = datetime.utcnow()
+        if (
+            stored is not None
+            and stored.refreshed_at is not None
+            and now - stored.refreshed_at < self._job_offer_freshness
+        ):
+            return stored, False
+
+        opportunity = await self._opportunities.get_opportunity(external_id)
+        if opportunity is None:
+            return None
+        job_offer = JobOffer(
+            id=stored.id if stored is not None else JobOfferId(uuid4()),
+            external_id=opportunity.external_id,
+            objective=opportunity.objective,
+            strengths=opportunity.strengths,
+            responsibilities=opportunity.responsibilities,
+            refreshed_at=now,
+        )
+        changed = stored is None or _job_offer_content(stored) != _job_offer_content(job_offer)
+        # Persist here (once per single-flight) so concurrent graph saves only reference the row.
+        saved_id = await self._repository.save_job_offer(job_offer)
+        if saved_id != job_offer.id:
+            # Another worker stored this external id first; reference its row instead.
+            job_offer = replace(job_offer, id=saved_id)
+        return job_offer, changed
+
+    async def _fetch_candidate_and_job_offer(
+        self, username: str, job_offer_id: str
+    ) -> tuple[CandidateFromTorre, tuple[JobOffer, bool]]:
+        """Fetch bio and resolve the job offer concurrently; the first not-found or error cancels the other."""
+        bio_task = asyncio.create_task(self._bios.get_bio(username))
+        job_offer_task = asyncio.create_task(
+            self._job_offer_flight.do(job_offer_id, lambda: self._resolve_job_offer(job_offer_id))
+        )
+        not_found = {bio_task: "Candidate not found", job_offer_task: "Job offer not found"}
+        pending = {bio_task, job_offer_task}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Bio first, so failures landing together map as in the sequential flow.
+                for task in (bio_task, job_offer_task):
+                    if task in done and task.result() is None:
+                        raise TorreNotFoundError(not_found[task])
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return bio_task.result(), job_offer_task.result()
 
     async def create_application(
         self, username: str, job_offer_id: str
@@ -54,21 +130,18 @@ class ApplicationService:
         job_offer_id = (job_offer_id or "").strip()
         if not username or not job_offer_id:
             raise ValueError("username and job_offer_id are required")
-        create_lock = await self._get_create_lock(username, job_offer_id)
-        async with create_lock:
+        # The lock only spares duplicate Torre work within this process; the repository's
+        # unique (username, job) key is what keeps creation idempotent across workers.
+        async with self._create_locks.hold((username.lower(), job_offer_id)):
             existing = await self._repository.find_application_by_username_and_job_offer(
                 username, job_offer_id
             )
             if existing is not None:
                 return CreateApplicationResult(application_id=existing.id, created=False)
 
-            bio = await self._bios.get_bio(username)
-            if bio is None:
-                raise TorreNotFoundError("Candidate not found")
-
-            opportunity = await self._opportunities.get_opportunity(job_offer_id)
-            if opportunity is None:
-                raise TorreNotFoundError("Job offer not found")
+            bio, (job_offer, job_offer_changed) = await self._fetch_candidate_and_job_offer(
+                username, job_offer_id
+            )
 
             candidate_id = CandidateId(uuid4())
             candidate = Candidate(
@@ -79,39 +152,169 @@ class ApplicationService:
                 jobs=bio.jobs,
             )
 
-            job_offer_id_entity = JobOfferId(uuid4())
-            job_offer = JobOffer(
-                id=job_offer_id_entity,
-                external_id=opportunity.external_id,
-                objective=opportunity.objective,
-                strengths=opportunity.strengths,
-                responsibilities=opportunity.responsibilities,
-            )
-
             application_id = ApplicationId(uuid4())
             application = ScreeningApplication(
                 id=application_id,
                 candidate_id=candidate_id,
-                job_offer_id=job_offer_id_entity,
+                job_offer_id=job_offer.id,
                 created_at=datetime.utcnow(),
             )
-            await self._repository.save_application_graph(
+            saved_id = await self._repository.save_application_graph(
                 candidate=candidate,
                 job_offer=job_offer,
                 application=application,
             )
+            if saved_id != application_id:
+                # Lost a cross-process race; the repository's unique key picked the winner.
+                return CreateApplicationResult(application_id=saved_id, created=False)
 
             event = JobOfferApplied(
                 candidate_id=candidate_id,
-                job_offer_id=job_offer_id_entity,
+                job_offer_id=job_offer.id,
                 application_id=application_id,
                 occurred_at=datetime.utcnow(),
+                job_offer_changed=job_offer_changed,
             )
             # Publisher can do blocking IO (e.g. RabbitMQ BlockingConnection).
             await asyncio.to_thread(self._event_publisher.publish, event)
 
             return CreateApplicationResult(application_id=application_id, created=True)
 
+    async def create_applications(
+        self, items: Sequence[tuple[str, str]]
+    ) -> list[BatchItemResult]:
+        """
+        Create many applications with one Torre lookup per distinct username and job offer,
+        one existence query, one multi-row graph save and one event publish.
+        Results follow input order; repeated pairs share the same result.
+        """
+        results: list[Optional[BatchItemResult]] = [None] * len(items)
+        positions: dict[tuple[str, str], list[int]] = {}
+        usernames: dict[tuple[str, str], str] = {}
+        for index, (username, job_offer_id) in enumerate(items):
+            username = (username or "").strip()
+            job_offer_id = (job_offer_id or "").strip()
+            if not username or not job_offer_id:
+                results[index] = BatchItemResult(
+                    error=ValueError("username and job_offer_id are required")
+                )
+                continue
+            key = (username.lower(), job_offer_id)
+            positions.setdefault(key, []).append(index)
+            usernames.setdefault(key, username)
+
+        by_key: dict[tuple[str, str], BatchItemResult] = {}
+        existing = await self._repository.find_applications_by_username_and_job_offers(
+            list(positions)
+        )
+        for key, application in existing.items():
+            by_key[key] = BatchItemResult(application_id=application.id, created=False)
+        missing = [key for key in positions if key not in by_key]
+
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+        bios, job_offers = await asyncio.gather(
+            self._gather_bounded(
+                semaphore,
+                {usernames[key] for key in missing},
+                self._bios.get_bio,
+            ),
+            self._gather_bounded(
+                semaphore,
+                {job_offer_id for _, job_offer_id in missing},
+                lambda job_offer_id: self._job_offer_flight.do(
+                    job_offer_id, lambda: self._resolve_job_offer(job_offer_id)
+                ),
+            ),
+        )
+
+        graphs: list[tuple[Candidate, JobOffer, ScreeningApplication]] = []
+        graph_keys: list[tuple[str, str]] = []
+        job_offer_changed: dict[JobOfferId, bool] = {}
+        for key in missing:
+            bio = bios[usernames[key]]
+            resolved = job_offers[key[1]]
+            # Same precedence as the single-item path: candidate problems first.
+            for outcome, not_found in ((bio, "Candidate not found"), (resolved, "Job offer not found")):
+                if isinstance(outcome, Exception):
+                    by_key[key] = BatchItemResult(error=outcome)
+                    break
+                if outcome is None:
+                    by_key[key] = BatchItemResult(error=TorreNotFoundError(not_found))
+                    break
+            if key in by_key:
+                continue
+            job_offer, changed = resolved
+            job_offer_changed[job_offer.id] = changed
+            candidate = Candidate(
+                id=CandidateId(uuid4()),
+                username=bio.username,
+                full_name=bio.full_name,
+                skills=bio.skills,
+                jobs=bio.jobs,
+            )
+            application = ScreeningApplication(
+                id=ApplicationId(uuid4()),
+                candidate_id=candidate.id,
+                job_offer_id=job_offer.id,
+                created_at=datetime.utcnow(),
+            )
+            graphs.append((candidate, job_offer, application))
+            graph_keys.append(key)
+
+        events: list[JobOfferApplied] = []
+        created_keys: list[tuple[str, str]] = []
+        saved_ids = await self._repository.save_application_graphs(graphs) if graphs else []
+        for (candidate, job_offer, application), key, saved_id in zip(graphs, graph_keys, saved_ids):
+            created = saved_id == application.id
+            by_key[key] = BatchItemResult(application_id=saved_id, created=created)
+            if created:
+                created_keys.append(key)
+                events.append(
+                    JobOfferApplied(
+                        candidate_id=candidate.id,
+                        job_offer_id=job_offer.id,
+                        application_id=application.id,
+                        occurred_at=datetime.utcnow(),
+                        job_offer_changed=job_offer_changed[job_offer.id],
+                    )
+                )
+                # The first event re-embeds a changed offer; later ones in the batch need not.
+                job_offer_changed[job_offer.id] = False
+
+        if events:
+            try:
+                await asyncio.to_thread(self._event_publisher.publish_many, events)
+            except EventPublishError as exc:
+                # Mirrors the single-item path: saved, but the caller is told publishing failed.
+                for key in created_keys:
+                    by_key[key].error = exc
+
+        for key, indexes in positions.items():
+            for index in indexes:
+                results[index] = by_key[key]
+        return results
+
+    @staticmethod
+    async def _gather_bounded(
+        semaphore: asyncio.Semaphore,
+        keys: set[str],
+        fetch: Callable[[str], Awaitable[T]],
+    ) -> dict[str, "T | Exception"]:
+        async def run(key: str):
+            async with semaphore:
+                return await fetch(key)
+
+        ordered = list(keys)
+        outcomes = await asyncio.gather(*(run(key) for key in ordered), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        return dict(zip(ordered, outcomes))
+
+
+def _job_offer_content(job_offer: JobOffer) -> tuple:
+    return (job_offer.objective, job_offer.strengths, job_offer.responsibilities)
+
 
 class TorreNotFoundError(Exception):
     pass
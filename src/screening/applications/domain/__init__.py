@@ -1,4 +1,5 @@
 from src.screening.applications.domain.entities import (
+    ApplicationGraph,
     Candidate,
     JobOffer,
     ScreeningApplication,
@@ -6,6 +7,7 @@ from src.screening.applications.domain.entities import (
 from src.screening.applications.domain.events import JobOfferApplied
 
 __all__ = [
+    "ApplicationGraph",
     "Candidate",
     "JobOffer",
     "ScreeningApplication",
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
 
@@ -28,3 +29,13 @@ class JobOffer:
     objective: str
     strengths: list[str]
     responsibilities: list[str]
+    refreshed_at: Optional[datetime] = None  # Last time the content was fetched from Torre
+
+
+@dataclass
+class ApplicationGraph:
+    """An application with its candidate and job offer, loaded together."""
+
+    application: ScreeningApplication
+    candidate: Optional[Candidate]
+    job_offer: Optional[JobOffer]
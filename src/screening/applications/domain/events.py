@@ -10,3 +10,5 @@ class JobOfferApplied(DomainEvent):
     candidate_id: CandidateId
     job_offer_id: JobOfferId
     application_id: ApplicationId
+    # False when the application reused a stored job offer as-is (its embedding is still valid).
+    job_offer_changed: bool = True
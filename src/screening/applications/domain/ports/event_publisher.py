@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Sequence
 
 from src.shared.domain.events import DomainEvent
 
@@ -16,3 +16,8 @@ class EventPublisher(ABC):
     @abstractmethod
     def publish(self, event: DomainEvent) -> None:
         pass
+
+    def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Publish several events; adapters override this to batch their IO."""
+        for event in events:
+            self.publish(event)
@@ -0,0 +1,208 @@
+from typing import Optional, Sequence
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.screening.applications.domain.entities import (
+    ApplicationGraph,
+    Candidate,
+    JobOffer,
+    ScreeningApplication,
+)
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    PostgresApplicationRepository,
+    _application_graph_stmt,
+    _application_row,
+    _application_to_entity,
+    _candidate_row,
+    _graph_application_rows,
+    _graph_to_entity,
+    _insert_applications_stmt,
+    _insert_job_offers_stmt,
+    _job_offer_ids_stmt,
+    _job_offer_to_entity,
+    _upsert_job_offers_stmt,
+    _username_key,
+)
+from src.screening.persistence import AsyncSessionProvider
+from src.screening.persistence.models import (
+    ApplicationModel,
+    CandidateModel,
+    JobOfferModel,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+class AsyncPostgresApplicationRepository(PostgresApplicationRepository):
+    """
+    PostgresApplicationRepository whose async methods run on an AsyncSession (asyncpg)
+    instead of a worker thread. Sync methods, and async calls made outside the loop the
+    provider is bound to, use the inherited sync path.
+    """
+
+    def __init__(self, session_factory, async_sessions: AsyncSessionProvider) -> None:
+        super().__init__(session_factory)
+        self._async_sessions = async_sessions
+
+    async def find_application_by_username_and_job_offer(
+        self, username: str, job_offer_id: str
+    ) -> Optional[ScreeningApplication]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().find_application_by_username_and_job_offer(username, job_offer_id)
+        async with async_session_factory() as session:
+            row = (
+                await session.execute(
+                    select(ApplicationModel).where(
+                        ApplicationModel.username_key == _username_key(username),
+                        ApplicationModel.job_external_id == job_offer_id.strip(),
+                    )
+                )
+            ).scalars().first()
+            return _application_to_entity(row, None, None) if row else None
+
+    async def find_applications_by_username_and_job_offers(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScreeningApplication]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().find_applications_by_username_and_job_offers(keys)
+        normalized = list({(_username_key(u), j.strip()) for u, j in keys})
+        if not normalized:
+            return {}
+        async with async_session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(ApplicationModel).where(
+                        tuple_(ApplicationModel.username_key, ApplicationModel.job_external_id).in_(
+                            normalized
+                        )
+                    )
+                )
+            ).scalars().all()
+            return {
+                (row.username_key, row.job_external_id): _application_to_entity(row, None, None)
+                for row in rows
+            }
+
+    async def find_job_offer_by_external_id(self, external_id: str) -> Optional[JobOffer]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().find_job_offer_by_external_id(external_id)
+        async with async_session_factory() as session:
+            row = (
+                await session.execute(
+                    select(JobOfferModel).where(JobOfferModel.external_id == external_id.strip())
+                )
+            ).scalar_one_or_none()
+            return _job_offer_to_entity(row) if row else None
+
+    async def save_candidate(self, candidate: Candidate) -> CandidateId:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().save_candidate(candidate)
+        async with async_session_factory() as session:
+            await session.merge(CandidateModel(**_candidate_row(candidate)))
+            await session.commit()
+        return candidate.id
+
+    async def save_job_offer(self, job_offer: JobOffer) -> JobOfferId:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().save_job_offer(job_offer)
+        async with async_session_factory() as session:
+            saved_id = (
+                await session.execute(_upsert_job_offers_stmt([job_offer]))
+            ).one().id
+            await session.commit()
+        return JobOfferId(saved_id)
+
+    async def save_application(self, application: ScreeningApplication) -> ApplicationId:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().save_application(application)
+        async with async_session_factory() as session:
+            candidate = await session.get(CandidateModel, application.candidate_id.value)
+            job_offer = await session.get(JobOfferModel, application.job_offer_id.value)
+            await session.merge(
+                ApplicationModel(
+                    **_application_row(
+                        application,
+                        username_key=_username_key(candidate.username) if candidate else None,
+                        job_external_id=job_offer.external_id.strip() if job_offer else None,
+                    )
+                )
+            )
+            await session.commit()
+        return application.id
+
+    async def save_application_graph(
+        self,
+        candidate: Candidate,
+        job_offer: JobOffer,
+        application: ScreeningApplication,
+    ) -> ApplicationId:
+        if self._async_sessions.current() is None:
+            return await super().save_application_graph(candidate, job_offer, application)
+        saved_ids = await self.save_application_graphs([(candidate, job_offer, application)])
+        return saved_ids[0]
+
+    async def save_application_graphs(
+        self,
+        graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    ) -> list[ApplicationId]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().save_application_graphs(graphs)
+        if not graphs:
+            return []
+        keys = [
+            (_username_key(candidate.username), job_offer.external_id.strip())
+            for candidate, job_offer, _ in graphs
+        ]
+        async with async_session_factory() as session:
+            job_offers = [job_offer for _, job_offer, _ in graphs]
+            await session.execute(_insert_job_offers_stmt(job_offers))
+            job_offer_ids = {
+                row.external_id: row.id
+                for row in await session.execute(_job_offer_ids_stmt(job_offers))
+            }
+            returned = (
+                await session.execute(
+                    _insert_applications_stmt(
+                        _graph_application_rows(graphs, keys, job_offer_ids)
+                    )
+                )
+            ).all()
+            owners = {(row.username_key, row.job_external_id): row.id for row in returned}
+            winners = [
+                candidate
+                for (candidate, _, application), key in zip(graphs, keys)
+                if owners[key] == application.id.value
+            ]
+            if winners:
+                await session.execute(
+                    pg_insert(CandidateModel).values(
+                        [_candidate_row(candidate) for candidate in winners]
+                    )
+                )
+            await session.commit()
+        return [ApplicationId(owners[key]) for key in keys]
+
+    async def get_application(self, application_id: ApplicationId) -> Optional[ScreeningApplication]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().get_application(application_id)
+        async with async_session_factory() as session:
+            row = await session.get(ApplicationModel, application_id.value)
+            return _application_to_entity(row, None, None) if row else None
+
+    async def get_application_graph(
+        self, application_id: ApplicationId
+    ) -> Optional[ApplicationGraph]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().get_application_graph(application_id)
+        async with async_session_factory() as session:
+            row = (await session.execute(_application_graph_stmt(application_id))).first()
+            return _graph_to_entity(row) if row else None
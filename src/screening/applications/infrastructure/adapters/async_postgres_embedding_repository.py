@@ -0,0 +1,50 @@
+from uuid import UUID
+
+import numpy as np
+
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+    _row_to_vector,
+    _select_embedding_stmt,
+    _upsert_embedding_stmt,
+)
+from src.screening.persistence import AsyncSessionProvider
+
+
+class AsyncPostgresEmbeddingRepository(PostgresEmbeddingRepository):
+    """PostgresEmbeddingRepository with native AsyncSession implementations of the async methods."""
+
+    def __init__(
+        self, session_factory, async_sessions: AsyncSessionProvider, storage: str = "float32"
+    ) -> None:
+        super().__init__(session_factory, storage)
+        self._async_sessions = async_sessions
+
+    async def _get_embedding_async(self, entity_type: str, entity_id: str) -> np.ndarray | None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super()._get_embedding_async(entity_type, entity_id)
+        try:
+            uid = UUID(entity_id)
+        except (ValueError, TypeError):
+            return None
+        async with async_session_factory() as session:
+            row = (
+                await session.execute(_select_embedding_stmt(self._storage, entity_type, uid))
+            ).first()
+            return _row_to_vector(self._storage, row)
+
+    async def _save_embedding_async(
+        self, entity_type: str, entity_id: str, embedding: list[float]
+    ) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super()._save_embedding_async(entity_type, entity_id, embedding)
+            return
+        try:
+            uid = UUID(entity_id)
+        except (ValueError, TypeError):
+            return
+        async with async_session_factory() as session:
+            await session.execute(_upsert_embedding_stmt(self._storage, entity_type, uid, embedding))
+            await session.commit()
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from src.screening.applications.domain.ports import TorreOpportunitiesPort
+from src.screening.applications.domain.value_objects import JobOfferFromTorre
+from src.screening.shared.infrastructure import TtlLruCache
+
+
+class CachedTorreOpportunitiesAdapter(TorreOpportunitiesPort):
+    """
+    Read-through cache in front of a TorreOpportunitiesPort, keyed by external job offer id.
+
+    Found opportunities live for ``ttl_seconds``; 404s are cached for ``negative_ttl_seconds``.
+    Upstream errors are never cached.
+    """
+
+    def __init__(
+        self,
+        delegate: TorreOpportunitiesPort,
+        max_size: int = 1024,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        cache: Optional[TtlLruCache[str, Optional[JobOfferFromTorre]]] = None,
+    ) -> None:
+        self._delegate = delegate
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._cache = (
+            cache if cache is not None else TtlLruCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        )
+
+    async def get_opportunity(self, job_offer_id: str) -> Optional[JobOfferFromTorre]:
+        found, cached = self._cache.lookup(job_offer_id)
+        if found:
+            return cached
+        opportunity = await self._delegate.get_opportunity(job_offer_id)
+        if opportunity is None:
+            self._cache.set(job_offer_id, None, ttl_seconds=self._negative_ttl_seconds)
+        else:
+            self._cache.set(job_offer_id, opportunity)
+        return opportunity
+
+    def invalidate(self, job_offer_id: str) -> None:
+        self._cache.pop(job_offer_id)
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
@@ -0,0 +1,88 @@
+import logging
+import threading
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EmbedMany = Callable[[List[str]], List[Optional[List[float]]]]
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.slots: dict[str, int] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: list[Optional[List[float]]] = []
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces embedding requests from concurrent threads into one ``embed_many`` call.
+
+    The first caller into an empty batch becomes its leader: it waits up to
+    ``window_seconds`` (less if ``max_batch_size`` texts arrive first), closes the batch,
+    sends it and hands each caller its own result. Duplicate texts in a batch are sent once.
+    If ``embed_many`` raises or returns the wrong number of results, every caller in the
+    batch gets None, as a failed single request would.
+    """
+
+    def __init__(
+        self,
+        embed_many: EmbedMany,
+        max_batch_size: int = 32,
+        window_seconds: float = 0.01,
+    ) -> None:
+        self._embed_many = embed_many
+        self._max_batch_size = max(1, max_batch_size)
+        self._window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._open: Optional[_Batch] = None
+        self.batches = 0
+        self.texts = 0
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            slot = batch.slots.get(text)
+            if slot is None:
+                slot = batch.slots[text] = len(batch.texts)
+                batch.texts.append(text)
+            if len(batch.texts) >= self._max_batch_size:
+                self._open = None
+                batch.full.set()
+        if leader:
+            batch.full.wait(self._window_seconds)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            self._send(batch)
+        else:
+            batch.done.wait()
+        return batch.results[slot]
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "texts": self.texts,
+                "mean_batch_size": self.texts / self.batches if self.batches else 0.0,
+            }
+
+    def _send(self, batch: _Batch) -> None:
+        try:
+            results = self._embed_many(batch.texts)
+            if len(results) != len(batch.texts):
+                raise ValueError(f"expected {len(batch.texts)} embeddings, got {len(results)}")
+            batch.results = list(results)
+        except Exception as e:
+            logger.warning("Embedding batch of %s failed: %s", len(batch.texts), e)
+            batch.results = [None] * len(batch.texts)
+        finally:
+            with self._lock:
+                self.batches += 1
+                self.texts += len(batch.texts)
+            batch.done.set()
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from src.screening.applications.application.ports import EmbeddingCacheRepository, EmbeddingVector
+from src.screening.persistence.vectors import FLOAT32
+from src.screening.shared.infrastructure import TtlLruCache
+
+logger = logging.getLogger(__name__)
+
+MAX_EMBED_TEXT_LENGTH = 8000
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Collapse whitespace and truncate; this is both what gets embedded and what gets hashed."""
+    return " ".join((text or "").split())[:MAX_EMBED_TEXT_LENGTH]
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of embeddings keyed by (model, sha256 of the normalised text), checked
+    before calling the embedding model.
+
+    The first tier is a bounded in-process LRU of float32 arrays (4 bytes per dimension,
+    where a list of Python floats costs about 32); the optional second tier is an
+    EmbeddingCacheRepository shared by every process. Second-tier hits are promoted into
+    the LRU. ``get`` returns a list, converted on the way out. Second-tier failures are
+    logged and treated as misses, never raised.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[EmbeddingCacheRepository] = None,
+        max_size: int = 4096,
+    ) -> None:
+        self._repository = repository
+        self._memory: TtlLruCache[tuple[str, str], np.ndarray] = TtlLruCache(max_size=max_size)
+        self._lock = threading.Lock()
+        self._store_hits = 0
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = (model, text_sha256(text))
+        found, embedding = self._memory.lookup(key)
+        if found:
+            return embedding.tolist()
+        if self._repository is not None:
+            try:
+                stored = self._repository.get(*key)
+            except Exception as e:
+                logger.warning("Embedding cache lookup failed: %s", e)
+                stored = None
+            if stored is not None and len(stored) > 0:
+                embedding = np.asarray(stored, dtype=FLOAT32)
+                self._memory.set(key, embedding)
+                with self._lock:
+                    self._store_hits += 1
+                return embedding.tolist()
+        return None
+
+    def put(self, model: str, text: str, embedding: EmbeddingVector) -> None:
+        key = (model, text_sha256(text))
+        self._memory.set(key, np.asarray(embedding, dtype=FLOAT32))
+        if self._repository is not None:
+            try:
+                self._repository.put(*key, embedding)
+            except Exception as e:
+                logger.warning("Embedding cache write failed: %s", e)
+
+    def stats(self) -> dict[str, float]:
+        """Hit counters; every hit is an embed call that was not made."""
+        memory = self._memory.stats()
+        with self._lock:
+            store_hits = self._store_hits
+        # Every lookup reaches the memory tier; its misses are store hits or full misses.
+        misses = memory["misses"] - store_hits
+        hits = memory["hits"] + store_hits
+        lookups = hits + misses
+        return {
+            "memory_hits": memory["hits"],
+            "store_hits": store_hits,
+            "misses": misses,
+            "embed_calls_avoided": hits,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_size": memory["size"],
+            "memory_evictions": memory["evictions"],
+        }
@@ -24,6 +24,7 @@ def event_to_envelope(event: DomainEvent) -> dict[str, Any]:
                 "candidate_id": str(event.candidate_id),
                 "job_offer_id": str(event.job_offer_id),
                 "application_id": str(event.application_id),
+                "job_offer_changed": event.job_offer_changed,
             },
         }
     if isinstance(event, CallFinished):
@@ -59,6 +60,7 @@ def envelope_to_event(envelope: Mapping[str, Any]) -> DomainEvent:
             candidate_id=CandidateId(str(payload["candidate_id"])),
             job_offer_id=JobOfferId(str(payload["job_offer_id"])),
             application_id=ApplicationId(str(payload["application_id"])),
+            job_offer_changed=bool(payload.get("job_offer_changed", True)),
         )
     if event_type == "CallFinished":
         return CallFinished(
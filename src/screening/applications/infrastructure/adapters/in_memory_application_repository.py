@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.screening.applications.domain.entities import (
+    ApplicationGraph,
     Candidate,
     JobOffer,
     ScreeningApplication,
@@ -15,6 +16,7 @@ class InMemoryApplicationRepository(ApplicationRepository):
         self._job_offers = {}
         self._applications = {}
         self._username_job_index = {}
+        self._job_offer_external_index = {}
 
     async def find_application_by_username_and_job_offer(
         self, username: str, job_offer_id: str
@@ -25,12 +27,30 @@ class InMemoryApplicationRepository(ApplicationRepository):
             return None
         return self._applications.get(str(app_id))
 
+    async def find_applications_by_username_and_job_offers(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScreeningApplication]:
+        found = {}
+        for username, job_offer_id in keys:
+            key = (username.strip().lower(), job_offer_id.strip())
+            app_id = self._username_job_index.get(key)
+            if app_id is not None:
+                found[key] = self._applications[str(app_id)]
+        return found
+
+    async def find_job_offer_by_external_id(self, external_id: str) -> Optional[JobOffer]:
+        job_offer_id = self._job_offer_external_index.get(external_id.strip())
+        if job_offer_id is None:
+            return None
+        return self._job_offers.get(str(job_offer_id))
+
     async def save_candidate(self, candidate: Candidate) -> CandidateId:
         self._candidates[str(candidate.id)] = candidate
         return candidate.id
 
     async def save_job_offer(self, job_offer: JobOffer) -> JobOfferId:
         self._job_offers[str(job_offer.id)] = job_offer
+        self._job_offer_external_index[job_offer.external_id.strip()] = job_offer.id
         return job_offer.id
 
     async def save_application(
@@ -41,7 +61,7 @@ class InMemoryApplicationRepository(ApplicationRepository):
         if candidate:
             job_offer = self._job_offers.get(str(application.job_offer_id))
             if job_offer:
-                key = (candidate.username.lower(), job_offer.external_id)
+                key = (candidate.username.strip().lower(), job_offer.external_id.strip())
                 self._username_job_index[key] = application.id
         return application.id
 
@@ -51,13 +71,54 @@ class InMemoryApplicationRepository(ApplicationRepository):
         job_offer: JobOffer,
         application: ScreeningApplication,
     ) -> ApplicationId:
+        existing_id = self._username_job_index.get(
+            (candidate.username.strip().lower(), job_offer.external_id.strip())
+        )
+        if existing_id is not None:
+            return existing_id
         await self.save_candidate(candidate)
         await self.save_job_offer(job_offer)
         return await self.save_application(application)
 
+    async def save_application_graphs(
+        self,
+        graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    ) -> list[ApplicationId]:
+        return [
+            await self.save_application_graph(candidate, job_offer, application)
+            for candidate, job_offer, application in graphs
+        ]
+
     async def get_application(self, application_id: ApplicationId) -> Optional[ScreeningApplication]:
         return self._applications.get(str(application_id))
 
+    async def get_application_graph(
+        self, application_id: ApplicationId
+    ) -> Optional[ApplicationGraph]:
+        application = self._applications.get(str(application_id))
+        if application is None:
+            return None
+        return ApplicationGraph(
+            application=application,
+            candidate=self._candidates.get(str(application.candidate_id)),
+            job_offer=self._job_offers.get(str(application.job_offer_id)),
+        )
+
+    def list_applications_for_job_offer(
+        self, external_id: str
+    ) -> list[tuple[ScreeningApplication, Optional[Candidate]]]:
+        """Applications to any stored job offer with this Torre id, with their candidates."""
+        job_offer_ids = {
+            str(job_offer.id)
+            for job_offer in self._job_offers.values()
+            if job_offer.external_id.strip() == external_id.strip()
+        }
+        return [
+            (application, self._candidates.get(str(application.candidate_id)))
+            for application in self._applications.values()
+            if str(application.job_offer_id) in job_offer_ids
+        ]
+
     def get_candidate(self, candidate_id: CandidateId) -> Optional[Candidate]:
         return self._candidates.get(str(candidate_id))
 
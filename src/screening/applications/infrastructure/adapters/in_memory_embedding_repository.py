@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from src.screening.applications.application.ports import EmbeddingRepository
 
 
@@ -16,3 +18,9 @@ class InMemoryEmbeddingRepository(EmbeddingRepository):
 
     def save_job_offer_embedding(self, job_offer_id: str, embedding: list[float]) -> None:
         self._store[f"job_offer:{job_offer_id}"] = embedding
+
+    def list_job_offer_embeddings(self) -> Iterator[tuple[str, list[float]]]:
+        prefix = "job_offer:"
+        for key, embedding in list(self._store.items()):
+            if key.startswith(prefix):
+                yield key[len(prefix):], embedding
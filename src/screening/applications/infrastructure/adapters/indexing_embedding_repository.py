@@ -0,0 +1,48 @@
+import asyncio
+from typing import Iterator, Optional
+
+from src.screening.applications.application.ports import EmbeddingRepository, EmbeddingVector
+from src.screening.applications.infrastructure.adapters.ivf_job_offer_index import (
+    IvfJobOfferIndex,
+)
+
+
+class IndexingEmbeddingRepository(EmbeddingRepository):
+    """
+    EmbeddingRepository decorator that adds each saved job offer embedding to an
+    IvfJobOfferIndex once the delegate has stored it. Reads go straight to the delegate.
+    """
+
+    def __init__(self, delegate: EmbeddingRepository, index: IvfJobOfferIndex) -> None:
+        self._delegate = delegate
+        self._index = index
+
+    def get_candidate_embedding(self, candidate_id: str) -> Optional[EmbeddingVector]:
+        return self._delegate.get_candidate_embedding(candidate_id)
+
+    def get_job_offer_embedding(self, job_offer_id: str) -> Optional[EmbeddingVector]:
+        return self._delegate.get_job_offer_embedding(job_offer_id)
+
+    def save_candidate_embedding(self, candidate_id: str, embedding: EmbeddingVector) -> None:
+        self._delegate.save_candidate_embedding(candidate_id, embedding)
+
+    def save_job_offer_embedding(self, job_offer_id: str, embedding: EmbeddingVector) -> None:
+        self._delegate.save_job_offer_embedding(job_offer_id, embedding)
+        self._index.add_job_offer(job_offer_id, embedding)
+
+    def list_job_offer_embeddings(self) -> Iterator[tuple[str, EmbeddingVector]]:
+        return self._delegate.list_job_offer_embeddings()
+
+    async def get_candidate_embedding_async(self, candidate_id: str) -> Optional[EmbeddingVector]:
+        return await self._delegate.get_candidate_embedding_async(candidate_id)
+
+    async def get_job_offer_embedding_async(self, job_offer_id: str) -> Optional[EmbeddingVector]:
+        return await self._delegate.get_job_offer_embedding_async(job_offer_id)
+
+    async def save_candidate_embedding_async(self, candidate_id: str, embedding: EmbeddingVector) -> None:
+        await self._delegate.save_candidate_embedding_async(candidate_id, embedding)
+
+    async def save_job_offer_embedding_async(self, job_offer_id: str, embedding: EmbeddingVector) -> None:
+        await self._delegate.save_job_offer_embedding_async(job_offer_id, embedding)
+        # An upsert can retrain the IVF centroids; keep that off the event loop.
+        await asyncio.to_thread(self._index.add_job_offer, job_offer_id, embedding)
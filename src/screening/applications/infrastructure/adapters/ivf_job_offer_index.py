@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+from src.screening.applications.application.ports import (
+    EmbeddingRepository,
+    EmbeddingVector,
+    JobOfferSimilarityIndex,
+    SimilarJobOffer,
+)
+from src.screening.shared.infrastructure import IvfIndex
+
+logger = logging.getLogger(__name__)
+
+
+class IvfJobOfferIndex(JobOfferSimilarityIndex):
+    """
+    JobOfferSimilarityIndex over an in-process IvfIndex of job offer embeddings.
+
+    ``open`` memory-maps the snapshot at ``snapshot_path`` when there is one;
+    ``sync_from_repository`` then adds whatever the repository has that the snapshot lacks
+    (or builds the index from scratch). Saves of job offer embeddings reach the index through
+    IndexingEmbeddingRepository. The index is per process, so saves made by other workers
+    only appear after the next sync; ``start_sync`` can repeat it periodically for that.
+    """
+
+    def __init__(
+        self,
+        embeddings: EmbeddingRepository,
+        index: Optional[IvfIndex] = None,
+        snapshot_path: str = "",
+    ) -> None:
+        self._embeddings = embeddings
+        self._index = index if index is not None else IvfIndex()
+        self._snapshot_path = snapshot_path
+        self._stop_sync = threading.Event()
+
+    @classmethod
+    def open(
+        cls, embeddings: EmbeddingRepository, snapshot_path: str = "", nprobe: int = 8
+    ) -> "IvfJobOfferIndex":
+        index = None
+        if snapshot_path:
+            try:
+                index = IvfIndex.load(snapshot_path, nprobe=nprobe)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Ignoring unreadable job offer index snapshot %s: %s", snapshot_path, e)
+        if index is not None:
+            logger.info("Loaded job offer index snapshot (%s vectors)", len(index))
+        return cls(embeddings, index if index is not None else IvfIndex(nprobe=nprobe), snapshot_path)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add_job_offer(self, job_offer_id: str, embedding: EmbeddingVector) -> None:
+        if not self._index.upsert(job_offer_id, embedding):
+            logger.warning("Job offer %s embedding not indexed (empty or wrong dimensions)", job_offer_id)
+
+    def sync_from_repository(self) -> int:
+        """Upsert every stored job offer embedding; unchanged vectors are no-ops. Returns the count seen."""
+        count = 0
+        for job_offer_id, embedding in self._embeddings.list_job_offer_embeddings():
+            self._index.upsert(job_offer_id, embedding)
+            count += 1
+        return count
+
+    def start_sync(self, refresh_seconds: float = 0.0) -> threading.Thread:
+        """
+        Run sync_from_repository in a daemon thread, then again every ``refresh_seconds``
+        (0 syncs once) until ``stop_sync``. Searches keep being served meanwhile.
+        """
+        self._stop_sync.clear()
+
+        def run() -> None:
+            while True:
+                try:
+                    count = self.sync_from_repository()
+                    logger.info("Job offer index synced (%s embeddings)", count)
+                except Exception as e:
+                    logger.warning("Job offer index sync failed: %s", e)
+                if refresh_seconds <= 0 or self._stop_sync.wait(refresh_seconds):
+                    return
+
+        thread = threading.Thread(target=run, name="job-offer-index-sync", daemon=True)
+        thread.start()
+        return thread
+
+    def stop_sync(self) -> None:
+        self._stop_sync.set()
+
+    def save(self) -> None:
+        if self._snapshot_path:
+            self._index.save(self._snapshot_path)
+
+    async def find_similar_job_offers(self, candidate_id: str, k: int) -> list[SimilarJobOffer]:
+        candidate = await self._embeddings.get_candidate_embedding_async(candidate_id)
+        if candidate is None or len(candidate) == 0:
+            return []
+        # Off the event loop: the scan is CPU-bound and waits on the index lock while an
+        # upsert retrains it.
+        found = await asyncio.to_thread(self._index.search, candidate, k)
+        return [
+            SimilarJobOffer(job_offer_id=job_offer_id, similarity=similarity)
+            for job_offer_id, similarity in found
+        ]
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
 
@@ -20,6 +20,10 @@ class OutboxRepository(ABC):
     def save_pending(self, event_type: str, payload: dict[str, Any]) -> UUID:
         pass
 
+    def save_pending_many(self, items: Sequence[tuple[str, dict[str, Any]]]) -> list[UUID]:
+        """Persist several (event_type, payload) rows; adapters override this with one write."""
+        return [self.save_pending(event_type, payload) for event_type, payload in items]
+
     @abstractmethod
     def list_pending(self, limit: int = 100) -> list[OutboxEventRecord]:
         pass
@@ -31,3 +35,13 @@ class OutboxRepository(ABC):
     @abstractmethod
     def mark_failed_attempt(self, event_id: UUID, error: str) -> None:
         pass
+
+    def mark_published_many(self, event_ids: Sequence[UUID]) -> None:
+        """Mark several rows published; adapters override this with one write."""
+        for event_id in event_ids:
+            self.mark_published(event_id)
+
+    def mark_failed_attempts(self, event_ids: Sequence[UUID], error: str) -> None:
+        """Record one failed attempt on several rows; adapters override this with one write."""
+        for event_id in event_ids:
+            self.mark_failed_attempt(event_id, error)
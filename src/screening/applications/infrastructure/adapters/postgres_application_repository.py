@@ -1,11 +1,13 @@
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.screening.applications.application.ports import ApplicationRepository
 from src.screening.applications.domain.entities import (
+    ApplicationGraph,
     Candidate,
     JobOffer,
     ScreeningApplication,
@@ -35,6 +37,7 @@ def _job_offer_to_entity(row: JobOfferModel) -> JobOffer:
         objective=row.objective,
         strengths=row.strengths if isinstance(row.strengths, list) else [],
         responsibilities=row.responsibilities if isinstance(row.responsibilities, list) else [],
+        refreshed_at=row.refreshed_at,
     )
 
 
@@ -47,6 +50,141 @@ def _application_to_entity(row: ApplicationModel, candidate: Optional[Candidate]
     )
 
 
+def _username_key(username: str) -> str:
+    return username.strip().lower()
+
+
+def _application_row(
+    application: ScreeningApplication, username_key: str, job_external_id: str
+) -> dict:
+    return {
+        "id": application.id.value,
+        "candidate_id": application.candidate_id.value,
+        "job_offer_id": application.job_offer_id.value,
+        "created_at": application.created_at,
+        "username_key": username_key,
+        "job_external_id": job_external_id,
+    }
+
+
+def _insert_applications_stmt(rows: Sequence[dict]):
+    """
+    Multi-row INSERT ... ON CONFLICT on the idempotency key. RETURNING yields, per key,
+    the winning row's id (ours or the pre-existing one).
+    """
+    stmt = pg_insert(ApplicationModel).values(list(rows))
+    # DO UPDATE (a no-op write) rather than DO NOTHING so RETURNING also reports the existing row.
+    return stmt.on_conflict_do_update(
+        index_elements=[ApplicationModel.username_key, ApplicationModel.job_external_id],
+        set_={"username_key": stmt.excluded.username_key},
+    ).returning(ApplicationModel.id, ApplicationModel.username_key, ApplicationModel.job_external_id)
+
+
+def _insert_application_stmt(
+    application: ScreeningApplication, username_key: str, job_external_id: str
+):
+    return _insert_applications_stmt([_application_row(application, username_key, job_external_id)])
+
+
+def _graph_application_rows(
+    graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    keys: Sequence[tuple[str, str]],
+    job_offer_ids: dict,
+) -> list[dict]:
+    """Application rows for a batch, each pointing at the stored job offer for its external id."""
+    rows = []
+    for (_, job_offer, application), key in zip(graphs, keys):
+        row = _application_row(application, *key)
+        row["job_offer_id"] = job_offer_ids[job_offer.external_id.strip()]
+        rows.append(row)
+    return rows
+
+
+def _candidate_row(candidate: Candidate) -> dict:
+    return {
+        "id": candidate.id.value,
+        "username": candidate.username,
+        "full_name": candidate.full_name,
+        "skills": candidate.skills,
+        "jobs": candidate.jobs,
+    }
+
+
+def _job_offer_row(job_offer: JobOffer) -> dict:
+    return {
+        "id": job_offer.id.value,
+        "external_id": job_offer.external_id.strip(),
+        "objective": job_offer.objective,
+        "strengths": job_offer.strengths,
+        "responsibilities": job_offer.responsibilities,
+        "refreshed_at": job_offer.refreshed_at,
+    }
+
+
+def _unique_job_offers(job_offers: Sequence[JobOffer]) -> list[JobOffer]:
+    """
+    One job offer per stripped external id, in external id order so concurrent batches touching
+    overlapping offers insert them in the same order.
+    """
+    unique = {job_offer.external_id.strip(): job_offer for job_offer in job_offers}
+    return [unique[external_id] for external_id in sorted(unique)]
+
+
+def _insert_job_offers_stmt(job_offers: Sequence[JobOffer]):
+    """
+    Multi-row INSERT ... ON CONFLICT (external_id) DO NOTHING: stores the offers that are not
+    stored yet. A stored offer is neither written nor locked; read ids with _job_offer_ids_stmt.
+    """
+    stmt = pg_insert(JobOfferModel).values(
+        [_job_offer_row(job_offer) for job_offer in _unique_job_offers(job_offers)]
+    )
+    return stmt.on_conflict_do_nothing(index_elements=[JobOfferModel.external_id])
+
+
+def _job_offer_ids_stmt(job_offers: Sequence[JobOffer]):
+    """The stored id per external id of ``job_offers``."""
+    return select(JobOfferModel.id, JobOfferModel.external_id).where(
+        JobOfferModel.external_id.in_(sorted({job_offer.external_id.strip() for job_offer in job_offers}))
+    )
+
+
+def _upsert_job_offers_stmt(job_offers: Sequence[JobOffer]):
+    """
+    Multi-row INSERT ... ON CONFLICT on ``external_id``: one row per Torre job offer, keeping
+    the id of whichever insert got there first and overwriting the stored content.
+    RETURNING yields the stored id per external_id.
+    """
+    stmt = pg_insert(JobOfferModel).values(
+        [_job_offer_row(job_offer) for job_offer in _unique_job_offers(job_offers)]
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[JobOfferModel.external_id],
+        set_={
+            field: stmt.excluded[field]
+            for field in ("objective", "strengths", "responsibilities", "refreshed_at")
+        },
+    ).returning(JobOfferModel.id, JobOfferModel.external_id)
+
+
+def _application_graph_stmt(application_id: ApplicationId):
+    """Application plus candidate and job offer in one round trip (outer joins: either may be missing)."""
+    return (
+        select(ApplicationModel, CandidateModel, JobOfferModel)
+        .outerjoin(CandidateModel, CandidateModel.id == ApplicationModel.candidate_id)
+        .outerjoin(JobOfferModel, JobOfferModel.id == ApplicationModel.job_offer_id)
+        .where(ApplicationModel.id == application_id.value)
+    )
+
+
+def _graph_to_entity(row) -> ApplicationGraph:
+    app_row, candidate_row, job_offer_row = row
+    return ApplicationGraph(
+        application=_application_to_entity(app_row, None, None),
+        candidate=_candidate_to_entity(candidate_row) if candidate_row else None,
+        job_offer=_job_offer_to_entity(job_offer_row) if job_offer_row else None,
+    )
+
+
 class PostgresApplicationRepository(ApplicationRepository):
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
@@ -54,17 +192,12 @@ class PostgresApplicationRepository(ApplicationRepository):
     def _find_application_by_username_and_job_offer_sync(
         self, username: str, job_offer_id: str
     ) -> Optional[ScreeningApplication]:
-        key_username = username.strip().lower()
-        key_job = job_offer_id.strip()
         with self._session_factory() as session:
             app_row = (
                 session.execute(
-                    select(ApplicationModel)
-                    .join(CandidateModel, ApplicationModel.candidate_id == CandidateModel.id)
-                    .join(JobOfferModel, ApplicationModel.job_offer_id == JobOfferModel.id)
-                    .where(
-                        func.lower(CandidateModel.username) == key_username,
-                        JobOfferModel.external_id == key_job,
+                    select(ApplicationModel).where(
+                        ApplicationModel.username_key == _username_key(username),
+                        ApplicationModel.job_external_id == job_offer_id.strip(),
                     )
                 )
                 .scalars()
@@ -72,13 +205,7 @@ class PostgresApplicationRepository(ApplicationRepository):
             )
             if app_row is None:
                 return None
-            cand = session.get(CandidateModel, app_row.candidate_id)
-            job = session.get(JobOfferModel, app_row.job_offer_id)
-            return _application_to_entity(
-                app_row,
-                _candidate_to_entity(cand) if cand else None,
-                _job_offer_to_entity(job) if job else None,
-            )
+            return _application_to_entity(app_row, None, None)
 
     async def find_application_by_username_and_job_offer(
         self, username: str, job_offer_id: str
@@ -87,6 +214,46 @@ class PostgresApplicationRepository(ApplicationRepository):
             self._find_application_by_username_and_job_offer_sync, username, job_offer_id
         )
 
+    def _find_applications_by_username_and_job_offers_sync(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScreeningApplication]:
+        normalized = list({(_username_key(u), j.strip()) for u, j in keys})
+        if not normalized:
+            return {}
+        with self._session_factory() as session:
+            rows = (
+                session.execute(
+                    select(ApplicationModel).where(
+                        tuple_(ApplicationModel.username_key, ApplicationModel.job_external_id).in_(
+                            normalized
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            return {
+                (row.username_key, row.job_external_id): _application_to_entity(row, None, None)
+                for row in rows
+            }
+
+    async def find_applications_by_username_and_job_offers(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScreeningApplication]:
+        return await asyncio.to_thread(
+            self._find_applications_by_username_and_job_offers_sync, keys
+        )
+
+    def _find_job_offer_by_external_id_sync(self, external_id: str) -> Optional[JobOffer]:
+        with self._session_factory() as session:
+            row = session.execute(
+                select(JobOfferModel).where(JobOfferModel.external_id == external_id.strip())
+            ).scalar_one_or_none()
+            return _job_offer_to_entity(row) if row else None
+
+    async def find_job_offer_by_external_id(self, external_id: str) -> Optional[JobOffer]:
+        return await asyncio.to_thread(self._find_job_offer_by_external_id_sync, external_id)
+
     def _save_candidate_sync(self, candidate: Candidate) -> CandidateId:
         with self._session_factory() as session:
             row = CandidateModel(
@@ -105,27 +272,24 @@ class PostgresApplicationRepository(ApplicationRepository):
 
     def _save_job_offer_sync(self, job_offer: JobOffer) -> JobOfferId:
         with self._session_factory() as session:
-            row = JobOfferModel(
-                id=job_offer.id.value,
-                external_id=job_offer.external_id,
-                objective=job_offer.objective,
-                strengths=job_offer.strengths,
-                responsibilities=job_offer.responsibilities,
-            )
-            session.merge(row)
+            saved_id = session.execute(_upsert_job_offers_stmt([job_offer])).one().id
             session.commit()
-        return job_offer.id
+        return JobOfferId(saved_id)
 
     async def save_job_offer(self, job_offer: JobOffer) -> JobOfferId:
         return await asyncio.to_thread(self._save_job_offer_sync, job_offer)
 
     def _save_application_sync(self, application: ScreeningApplication) -> ApplicationId:
         with self._session_factory() as session:
+            candidate = session.get(CandidateModel, application.candidate_id.value)
+            job_offer = session.get(JobOfferModel, application.job_offer_id.value)
             row = ApplicationModel(
                 id=application.id.value,
                 candidate_id=application.candidate_id.value,
                 job_offer_id=application.job_offer_id.value,
                 created_at=application.created_at,
+                username_key=_username_key(candidate.username) if candidate else None,
+                job_external_id=job_offer.external_id.strip() if job_offer else None,
             )
             session.merge(row)
             session.commit()
@@ -143,6 +307,21 @@ class PostgresApplicationRepository(ApplicationRepository):
         application: ScreeningApplication,
     ) -> ApplicationId:
         with self._session_factory() as session:
+            # The offer is normally stored already (ApplicationService resolves it first);
+            # DO NOTHING then leaves its row untouched instead of locking it per application.
+            session.execute(_insert_job_offers_stmt([job_offer]))
+            job_offer_id = session.execute(_job_offer_ids_stmt([job_offer])).one().id
+            row = _application_row(
+                application,
+                username_key=_username_key(candidate.username),
+                job_external_id=job_offer.external_id.strip(),
+            )
+            row["job_offer_id"] = job_offer_id
+            saved_id = session.execute(_insert_applications_stmt([row])).one().id
+            if saved_id != application.id.value:
+                # Another request (possibly another worker) already owns this key.
+                session.rollback()
+                return ApplicationId(saved_id)
             session.merge(
                 CandidateModel(
                     id=candidate.id.value,
@@ -152,23 +331,6 @@ class PostgresApplicationRepository(ApplicationRepository):
                     jobs=candidate.jobs,
                 )
             )
-            session.merge(
-                JobOfferModel(
-                    id=job_offer.id.value,
-                    external_id=job_offer.external_id,
-                    objective=job_offer.objective,
-                    strengths=job_offer.strengths,
-                    responsibilities=job_offer.responsibilities,
-                )
-            )
-            session.merge(
-                ApplicationModel(
-                    id=application.id.value,
-                    candidate_id=application.candidate_id.value,
-                    job_offer_id=application.job_offer_id.value,
-                    created_at=application.created_at,
-                )
-            )
             session.commit()
         return application.id
 
@@ -185,22 +347,70 @@ class PostgresApplicationRepository(ApplicationRepository):
             application,
         )
 
+    def _save_application_graphs_sync(
+        self,
+        graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    ) -> list[ApplicationId]:
+        if not graphs:
+            return []
+        keys = [
+            (_username_key(candidate.username), job_offer.external_id.strip())
+            for candidate, job_offer, _ in graphs
+        ]
+        with self._session_factory() as session:
+            # Four statements for the whole batch: the missing job offers (stored rows are left
+            # untouched), their ids, applications pointing at them (deciding winners), then the
+            # winners' candidates, all in one transaction.
+            job_offers = [job_offer for _, job_offer, _ in graphs]
+            session.execute(_insert_job_offers_stmt(job_offers))
+            job_offer_ids = {
+                row.external_id: row.id for row in session.execute(_job_offer_ids_stmt(job_offers))
+            }
+            returned = session.execute(
+                _insert_applications_stmt(
+                    _graph_application_rows(graphs, keys, job_offer_ids)
+                )
+            ).all()
+            # RETURNING order is not guaranteed to follow VALUES order; match on the key.
+            owners = {(row.username_key, row.job_external_id): row.id for row in returned}
+            winners = [
+                candidate
+                for (candidate, _, application), key in zip(graphs, keys)
+                if owners[key] == application.id.value
+            ]
+            if winners:
+                session.execute(
+                    pg_insert(CandidateModel).values(
+                        [_candidate_row(candidate) for candidate in winners]
+                    )
+                )
+            session.commit()
+        return [ApplicationId(owners[key]) for key in keys]
+
+    async def save_application_graphs(
+        self,
+        graphs: Sequence[tuple[Candidate, JobOffer, ScreeningApplication]],
+    ) -> list[ApplicationId]:
+        return await asyncio.to_thread(self._save_application_graphs_sync, graphs)
+
     def _get_application_sync(self, application_id: ApplicationId) -> Optional[ScreeningApplication]:
         with self._session_factory() as session:
             row = session.get(ApplicationModel, application_id.value)
-            if row is None:
-                return None
-            cand = session.get(CandidateModel, row.candidate_id)
-            job = session.get(JobOfferModel, row.job_offer_id)
-            return _application_to_entity(
-                row,
-                _candidate_to_entity(cand) if cand else None,
-                _job_offer_to_entity(job) if job else None,
-            )
+            return _application_to_entity(row, None, None) if row else None
 
     async def get_application(self, application_id: ApplicationId) -> Optional[ScreeningApplication]:
         return await asyncio.to_thread(self._get_application_sync, application_id)
 
+    def _get_application_graph_sync(self, application_id: ApplicationId) -> Optional[ApplicationGraph]:
+        with self._session_factory() as session:
+            row = session.execute(_application_graph_stmt(application_id)).first()
+            return _graph_to_entity(row) if row else None
+
+    async def get_application_graph(
+        self, application_id: ApplicationId
+    ) -> Optional[ApplicationGraph]:
+        return await asyncio.to_thread(self._get_application_graph_sync, application_id)
+
     def get_candidate(self, candidate_id: CandidateId) -> Optional[Candidate]:
         with self._session_factory() as session:
             row = session.get(CandidateModel, candidate_id.value)
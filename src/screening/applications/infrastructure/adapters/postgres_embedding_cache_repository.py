@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.screening.applications.application.ports import EmbeddingCacheRepository, EmbeddingVector
+from src.screening.persistence.models import EmbeddingCacheModel
+from src.screening.persistence.vectors import pack_float32, unpack_float32
+
+
+class PostgresEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """Cached embeddings as packed float32 rows; concurrent writers of the same key keep the first."""
+
+    def __init__(self, session_factory) -> None:
+        self._session_factory = session_factory
+
+    def get(self, model: str, text_sha256: str) -> Optional[np.ndarray]:
+        with self._session_factory() as session:
+            packed = session.scalar(
+                select(EmbeddingCacheModel.embedding_f32).where(
+                    EmbeddingCacheModel.model == model,
+                    EmbeddingCacheModel.text_sha256 == text_sha256,
+                )
+            )
+        return unpack_float32(packed) if packed else None
+
+    def put(self, model: str, text_sha256: str, embedding: EmbeddingVector) -> None:
+        stmt = pg_insert(EmbeddingCacheModel).values(
+            model=model,
+            text_sha256=text_sha256,
+            embedding_f32=pack_float32(embedding),
+            created_at=datetime.utcnow(),
+        )
+        with self._session_factory() as session:
+            session.execute(stmt.on_conflict_do_nothing(index_elements=["model", "text_sha256"]))
+            session.commit()
@@ -1,37 +1,93 @@
+import asyncio
+from typing import Any, Iterator, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.screening.applications.application.ports import EmbeddingRepository
-from src.screening.persistence.models import EntityEmbeddingModel
+from src.screening.persistence.models import entity_embeddings
+from src.screening.persistence.vectors import (
+    EMBEDDING_STORAGE_MODES,
+    decode_embedding,
+    pack_float32,
+)
+
+
+def _select_embedding_stmt(storage: str, entity_type: str, entity_id: UUID):
+    columns = [entity_embeddings.c.embedding_f32, entity_embeddings.c.embedding]
+    if storage == "pgvector":
+        columns.append(entity_embeddings.c.embedding_vector)
+    return select(*columns).where(
+        entity_embeddings.c.entity_type == entity_type,
+        entity_embeddings.c.entity_id == entity_id,
+    )
+
+
+def _list_embeddings_stmt(storage: str, entity_type: str):
+    columns = [
+        entity_embeddings.c.entity_id,
+        entity_embeddings.c.embedding_f32,
+        entity_embeddings.c.embedding,
+    ]
+    if storage == "pgvector":
+        columns.append(entity_embeddings.c.embedding_vector)
+    return select(*columns).where(entity_embeddings.c.entity_type == entity_type)
+
+
+def _row_to_vector(storage: str, row: Any) -> Optional[np.ndarray]:
+    if row is None:
+        return None
+    return decode_embedding(
+        storage, row.embedding_f32, row.embedding, getattr(row, "embedding_vector", None)
+    )
+
+
+def _upsert_embedding_stmt(storage: str, entity_type: str, entity_id: UUID, embedding):
+    values: dict[str, Any] = {
+        "id": uuid4(),
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "embedding_f32": null(),
+        "embedding": null(),
+    }
+    if storage == "float32":
+        values["embedding_f32"] = pack_float32(embedding)
+    elif storage == "pgvector":
+        values["embedding_vector"] = embedding
+    else:
+        values["embedding"] = [float(x) for x in embedding]
+    stmt = pg_insert(entity_embeddings).values(values)
+    stored = [name for name in values if name not in ("id", "entity_type", "entity_id")]
+    return stmt.on_conflict_do_update(
+        index_elements=["entity_type", "entity_id"],
+        set_={name: stmt.excluded[name] for name in stored},
+    )
 
 
 class PostgresEmbeddingRepository(EmbeddingRepository):
-    def __init__(self, session_factory) -> None:
+    """
+    Embeddings are written in ``storage`` format (packed float32 ``bytea`` by default) and
+    read back as float32 NumPy arrays; float32 rows are zero-copy views over the fetched bytes.
+    """
+
+    def __init__(self, session_factory, storage: str = "float32") -> None:
+        if storage not in EMBEDDING_STORAGE_MODES:
+            raise ValueError(f"Unknown embedding storage {storage!r}")
         self._session_factory = session_factory
+        self._storage = storage
 
-    def _get_embedding(self, entity_type: str, entity_id: str) -> list[float] | None:
+    def _get_embedding(self, entity_type: str, entity_id: str) -> np.ndarray | None:
         try:
             uid = UUID(entity_id)
         except (ValueError, TypeError):
             return None
         with self._session_factory() as session:
-            row = (
-                session.execute(
-                    select(EntityEmbeddingModel).where(
-                        EntityEmbeddingModel.entity_type == entity_type,
-                        EntityEmbeddingModel.entity_id == uid,
-                    )
-                )
-                .scalars()
-                .first()
-            )
-            if row is None:
-                return None
-            emb = row.embedding if hasattr(row, "embedding") else None
-            if isinstance(emb, list):
-                return [float(x) for x in emb]
-            return None
+            row = session.execute(
+                _select_embedding_stmt(self._storage, entity_type, uid)
+            ).first()
+            return _row_to_vector(self._storage, row)
 
     def _save_embedding(self, entity_type: str, entity_id: str, embedding: list[float]) -> None:
         try:
@@ -39,33 +95,26 @@ class PostgresEmbeddingRepository(EmbeddingRepository):
         except (ValueError, TypeError):
             return
         with self._session_factory() as session:
-            row = (
-                session.execute(
-                    select(EntityEmbeddingModel).where(
-                        EntityEmbeddingModel.entity_type == entity_type,
-                        EntityEmbeddingModel.entity_id == uid,
-                    )
-                )
-                .scalars()
-                .first()
-            )
-            if row is not None:
-                row.embedding = embedding
-            else:
-                session.add(
-                    EntityEmbeddingModel(
-                        id=uuid4(),
-                        entity_type=entity_type,
-                        entity_id=uid,
-                        embedding=embedding,
-                    )
-                )
+            session.execute(_upsert_embedding_stmt(self._storage, entity_type, uid, embedding))
             session.commit()
 
-    def get_candidate_embedding(self, candidate_id: str) -> list[float] | None:
+    def _list_embeddings(
+        self, entity_type: str, batch_size: int = 1000
+    ) -> Iterator[tuple[str, np.ndarray]]:
+        with self._session_factory() as session:
+            result = session.execute(
+                _list_embeddings_stmt(self._storage, entity_type),
+                execution_options={"yield_per": batch_size},
+            )
+            for row in result:
+                vector = _row_to_vector(self._storage, row)
+                if vector is not None:
+                    yield str(row.entity_id), vector
+
+    def get_candidate_embedding(self, candidate_id: str) -> np.ndarray | None:
         return self._get_embedding("candidate", candidate_id)
 
-    def get_job_offer_embedding(self, job_offer_id: str) -> list[float] | None:
+    def get_job_offer_embedding(self, job_offer_id: str) -> np.ndarray | None:
         return self._get_embedding("job_offer", job_offer_id)
 
     def save_candidate_embedding(self, candidate_id: str, embedding: list[float]) -> None:
@@ -73,3 +122,26 @@ class PostgresEmbeddingRepository(EmbeddingRepository):
 
     def save_job_offer_embedding(self, job_offer_id: str, embedding: list[float]) -> None:
         self._save_embedding("job_offer", job_offer_id, embedding)
+
+    def list_job_offer_embeddings(self) -> Iterator[tuple[str, np.ndarray]]:
+        return self._list_embeddings("job_offer")
+
+    async def _get_embedding_async(self, entity_type: str, entity_id: str) -> np.ndarray | None:
+        return await asyncio.to_thread(self._get_embedding, entity_type, entity_id)
+
+    async def _save_embedding_async(
+        self, entity_type: str, entity_id: str, embedding: list[float]
+    ) -> None:
+        await asyncio.to_thread(self._save_embedding, entity_type, entity_id, embedding)
+
+    async def get_candidate_embedding_async(self, candidate_id: str) -> np.ndarray | None:
+        return await self._get_embedding_async("candidate", candidate_id)
+
+    async def get_job_offer_embedding_async(self, job_offer_id: str) -> np.ndarray | None:
+        return await self._get_embedding_async("job_offer", job_offer_id)
+
+    async def save_candidate_embedding_async(self, candidate_id: str, embedding: list[float]) -> None:
+        await self._save_embedding_async("candidate", candidate_id, embedding)
+
+    async def save_job_offer_embedding_async(self, job_offer_id: str, embedding: list[float]) -> None:
+        await self._save_embedding_async("job_offer", job_offer_id, embedding)
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Sequence
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from src.screening.applications.infrastructure.adapters.outbox_repository import (
     OutboxEventRecord,
@@ -22,6 +23,22 @@ def _to_record(row: OutboxEventModel) -> OutboxEventRecord:
     )
 
 
+def _mark_published_stmt(event_ids: Sequence[UUID]):
+    return (
+        update(OutboxEventModel)
+        .where(OutboxEventModel.id.in_(list(event_ids)))
+        .values(published_at=datetime.utcnow(), last_error=None)
+    )
+
+
+def _mark_failed_attempts_stmt(event_ids: Sequence[UUID], error: str):
+    return (
+        update(OutboxEventModel)
+        .where(OutboxEventModel.id.in_(list(event_ids)))
+        .values(attempts=OutboxEventModel.attempts + 1, last_error=(error or "")[:1000] or None)
+    )
+
+
 class PostgresOutboxRepository(OutboxRepository):
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
@@ -42,6 +59,25 @@ class PostgresOutboxRepository(OutboxRepository):
             session.commit()
             return event_id
 
+    def save_pending_many(self, items) -> list[UUID]:
+        now = datetime.utcnow()
+        rows = [
+            OutboxEventModel(
+                id=uuid4(),
+                event_type=event_type,
+                payload=payload,
+                attempts=0,
+                created_at=now,
+                published_at=None,
+                last_error=None,
+            )
+            for event_type, payload in items
+        ]
+        with self._session_factory() as session:
+            session.add_all(rows)
+            session.commit()
+        return [row.id for row in rows]
+
     def list_pending(self, limit: int = 100) -> list[OutboxEventRecord]:
         with self._session_factory() as session:
             rows = (
@@ -57,19 +93,21 @@ class PostgresOutboxRepository(OutboxRepository):
             return [_to_record(r) for r in rows]
 
     def mark_published(self, event_id: UUID) -> None:
+        self.mark_published_many([event_id])
+
+    def mark_failed_attempt(self, event_id: UUID, error: str) -> None:
+        self.mark_failed_attempts([event_id], error)
+
+    def mark_published_many(self, event_ids: Sequence[UUID]) -> None:
+        if not event_ids:
+            return
         with self._session_factory() as session:
-            row = session.get(OutboxEventModel, event_id)
-            if row is None:
-                return
-            row.published_at = datetime.utcnow()
-            row.last_error = None
+            session.execute(_mark_published_stmt(event_ids))
             session.commit()
 
-    def mark_failed_attempt(self, event_id: UUID, error: str) -> None:
+    def mark_failed_attempts(self, event_ids: Sequence[UUID], error: str) -> None:
+        if not event_ids:
+            return
         with self._session_factory() as session:
-            row = session.get(OutboxEventModel, event_id)
-            if row is None:
-                return
-            row.attempts = int(row.attempts or 0) + 1
-            row.last_error = (error or "")[:1000] or None
+            session.execute(_mark_failed_attempts_stmt(event_ids, error))
             session.commit()
@@ -1,6 +1,6 @@
 import logging
 import threading
-from typing import Callable
+from typing import Callable, Sequence
 
 import pika
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
@@ -32,18 +32,24 @@ class RabbitMQEventPublisher(EventPublisher):
         self._handlers.append(handler)
 
     def publish(self, event: DomainEvent) -> None:
-        body = serialize_event(event)
+        self.publish_many([event])
+
+    def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        bodies = [serialize_event(event) for event in events]
         try:
             params = pika.URLParameters(self._broker_url)
             conn = pika.BlockingConnection(params)
             ch = conn.channel()
             ch.queue_declare(queue=QUEUE_NAME, durable=True)
-            ch.basic_publish(
-                exchange="",
-                routing_key=QUEUE_NAME,
-                body=body,
-                properties=pika.BasicProperties(delivery_mode=2),
-            )
+            for body in bodies:
+                ch.basic_publish(
+                    exchange="",
+                    routing_key=QUEUE_NAME,
+                    body=body,
+                    properties=pika.BasicProperties(delivery_mode=2),
+                )
             conn.close()
         except (AMQPConnectionError, AMQPChannelError, OSError) as e:
             logger.exception("RabbitMQ publish failed: %s", e)
@@ -1,6 +1,6 @@
 import logging
 import threading
-from typing import Callable
+from typing import Callable, Sequence
 
 from src.screening.applications.domain.ports import EventPublisher
 from src.screening.applications.infrastructure.adapters.event_codec import (
@@ -58,6 +58,26 @@ class ReliableEventPublisher(EventPublisher):
         self._outbox.mark_published(outbox_id)
         self._drain_pending_once(limit=100)
 
+    def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        envelopes = [event_to_envelope(event) for event in events]
+        outbox_ids = self._outbox.save_pending_many(
+            [
+                (str(envelope.get("type", type(event).__name__)), envelope)
+                for event, envelope in zip(events, envelopes)
+            ]
+        )
+
+        try:
+            self._delegate.publish_many(events)
+        except Exception as exc:
+            self._outbox.mark_failed_attempts(outbox_ids, str(exc))
+            raise
+
+        self._outbox.mark_published_many(outbox_ids)
+        self._drain_pending_once(limit=100)
+
     def start_relay(self) -> None:
         if self._relay_thread is not None and self._relay_thread.is_alive():
             return
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from src.screening.applications.domain.ports import TorreBiosPort, TorreOpportunitiesPort
+from src.screening.applications.domain.value_objects import (
+    CandidateFromTorre,
+    JobOfferFromTorre,
+)
+from src.screening.shared.infrastructure import SingleFlight
+
+
+class SingleFlightTorreBiosAdapter(TorreBiosPort):
+    """Concurrent get_bio calls for the same username share one upstream request."""
+
+    def __init__(self, delegate: TorreBiosPort) -> None:
+        self._delegate = delegate
+        self._flight: SingleFlight[str, Optional[CandidateFromTorre]] = SingleFlight()
+
+    async def get_bio(self, username: str) -> Optional[CandidateFromTorre]:
+        return await self._flight.do(username, lambda: self._delegate.get_bio(username))
+
+    def stats(self) -> dict[str, int]:
+        return self._flight.stats()
+
+
+class SingleFlightTorreOpportunitiesAdapter(TorreOpportunitiesPort):
+    """Concurrent get_opportunity calls for the same job offer share one upstream request."""
+
+    def __init__(self, delegate: TorreOpportunitiesPort) -> None:
+        self._delegate = delegate
+        self._flight: SingleFlight[str, Optional[JobOfferFromTorre]] = SingleFlight()
+
+    async def get_opportunity(self, job_offer_id: str) -> Optional[JobOfferFromTorre]:
+        return await self._flight.do(
+            job_offer_id, lambda: self._delegate.get_opportunity(job_offer_id)
+        )
+
+    def stats(self) -> dict[str, int]:
+        return self._flight.stats()
@@ -5,6 +5,10 @@ import httpx
 
 from src.screening.applications.domain.ports import TorreBiosPort
 from src.screening.applications.domain.value_objects import CandidateFromTorre
+from src.screening.applications.infrastructure.adapters.torre_http_client import (
+    TorreClientProvider,
+    torre_get,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +19,24 @@ class TorreBiosAdapter(TorreBiosPort):
         base_url: str = "https://torre.ai",
         timeout: float = 5.0,
         retries: int = 1,
+        get_client: Optional[TorreClientProvider] = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._retries = retries
+        self._get_client = get_client
 
     async def get_bio(self, username: str) -> Optional[CandidateFromTorre]:
         url = f"{self._base_url}/api/genome/bios/{username}"
         last_exc: Optional[Exception] = None
         for attempt in range(self._retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=self._timeout) as client:
-                    response = await client.get(url)
-                    if response.status_code == 404:
-                        return None
-                    response.raise_for_status()
-                    data = response.json()
-                    return self._parse_bio(username, data)
+                response = await torre_get(url, self._timeout, self._get_client)
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                data = response.json()
+                return self._parse_bio(username, data)
             except httpx.HTTPStatusError as e:
                 last_exc = e
                 if e.response.status_code == 404:
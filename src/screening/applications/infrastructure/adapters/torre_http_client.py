@@ -0,0 +1,44 @@
+import importlib.util
+import logging
+from typing import Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TorreClientProvider = Callable[[], Optional[httpx.AsyncClient]]
+
+
+def create_torre_http_client(
+    timeout: float = 5.0,
+    http2: bool = True,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+) -> httpx.AsyncClient:
+    """App-scoped pooled client shared by the Torre adapters (keep-alive, HTTP/2 when available)."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("h2 is not installed; Torre HTTP client falls back to HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+async def torre_get(
+    url: str,
+    timeout: float,
+    get_client: Optional[TorreClientProvider] = None,
+) -> httpx.Response:
+    """GET through the shared client when one is open; otherwise use a short-lived client."""
+    client = get_client() if get_client is not None else None
+    if client is not None and not client.is_closed:
+        return await client.get(url, timeout=timeout)
+    async with httpx.AsyncClient(timeout=timeout) as one_off:
+        return await one_off.get(url)
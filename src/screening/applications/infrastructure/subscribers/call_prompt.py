@@ -1,77 +1,81 @@
 import asyncio
 import logging
-import time
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import Future
 from typing import Optional
 
 from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.shared.domain import ApplicationId
+from src.screening.shared.infrastructure import EventLoopThread, ThreadSingleFlight
 
 logger = logging.getLogger(__name__)
 
-_call_prompts = {}
 _PROMPT_RETRIES = 3
 _PROMPT_BACKOFF_BASE = 0.5
-_ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="call_prompt_async")
+_GRAPH_LOAD_TIMEOUT = 15.0
 
 
-def _run_async(coro):
-    """Run an async coroutine from sync context in a dedicated thread with its own event loop."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+async def _open_loop_database() -> None:
+    from src.wiring import open_async_database
+
+    open_async_database("async_subscriber")
+
 
+async def _close_loop_database() -> None:
+    from src.wiring import close_async_database
 
-@dataclass
-class CallPromptData:
-    prepared_questions: list
-    role_context: str
+    await close_async_database()
 
 
-_DEFAULT_PROMPT = CallPromptData(
-    prepared_questions=["Tell me about your background."],
-    role_context="Screening call.",
+# Generations run as coroutines on one long-lived loop with its own async engine (in async
+# database mode), so repository calls are native awaits rather than worker-thread hops.
+_SUBSCRIBER_LOOP = EventLoopThread(
+    "call_prompt_loop", on_start=_open_loop_database, on_stop=_close_loop_database
 )
+# One generation per application at a time, whether started by the JobOfferApplied
+# subscriber or on demand when a call starts before the subscriber has finished.
+_generations: ThreadSingleFlight[str, Optional[CallPrompt]] = ThreadSingleFlight()
+
+
+_DEFAULT_QUESTIONS = ["Tell me about your background."]
+_DEFAULT_ROLE_CONTEXT = "Screening call."
+
 
+def _call_prompt_repository():
+    from src.wiring import get_call_prompt_repository
 
-def get_call_prompt(application_id: str) -> Optional[CallPromptData]:
-    return _call_prompts.get(application_id)
+    return get_call_prompt_repository()
 
 
-def _minimal_prompt_for_application(application_id: str) -> None:
+def get_call_prompt(application_id: str) -> Optional[CallPrompt]:
+    return _call_prompt_repository().get_prompt(application_id)
+
+
+async def _minimal_prompt_for_application(application_id: str) -> CallPrompt:
     """Ensure a minimal prompt is stored so the call can start."""
-    _call_prompts[application_id] = CallPromptData(
-        prepared_questions=_DEFAULT_PROMPT.prepared_questions,
-        role_context=_DEFAULT_PROMPT.role_context,
-    )
+    prompt = CallPrompt(prepared_questions=list(_DEFAULT_QUESTIONS), role_context=_DEFAULT_ROLE_CONTEXT)
+    await _call_prompt_repository().save_prompt_async(application_id, prompt)
+    return prompt
 
 
-def _generate_call_prompt_once(event: JobOfferApplied) -> None:
+async def _generate_call_prompt_once(application_id: ApplicationId) -> Optional[CallPrompt]:
     from src.screening.applications.application.ports import ApplicationRepository
     from src.wiring import get_application_repository
 
     repo: ApplicationRepository = get_application_repository()
-    future = _ASYNC_EXECUTOR.submit(
-        _run_async, repo.get_application(event.application_id)
-    )
     try:
-        app = future.result(timeout=15.0)
+        graph = await asyncio.wait_for(
+            repo.get_application_graph(application_id), _GRAPH_LOAD_TIMEOUT
+        )
     except Exception as e:
         logger.warning("Failed to load application for call prompt: %s", e)
-        _minimal_prompt_for_application(str(event.application_id))
-        return
-    if app is None:
-        return
-    if not hasattr(repo, "get_job_offer") or not hasattr(repo, "get_candidate"):
-        _minimal_prompt_for_application(str(event.application_id))
-        return
-    job_offer = repo.get_job_offer(event.job_offer_id)
-    candidate = repo.get_candidate(event.candidate_id)
+        return await _minimal_prompt_for_application(str(application_id))
+    if graph is None:
+        return None
+    job_offer = graph.job_offer
+    candidate = graph.candidate
     if job_offer is None:
-        _minimal_prompt_for_application(str(event.application_id))
-        return
+        return await _minimal_prompt_for_application(str(application_id))
     role_context = (
         f"Objective: {job_offer.objective}\n"
         f"Strengths: {', '.join(job_offer.strengths[:5])}\n"
@@ -85,29 +89,72 @@ def _generate_call_prompt_once(event: JobOfferApplied) -> None:
     if candidate and candidate.skills:
         skills_preview = ", ".join(candidate.skills[:3])
         questions.insert(1, f"How have you applied {skills_preview} in your work?")
-    _call_prompts[str(event.application_id)] = CallPromptData(
-        prepared_questions=questions,
-        role_context=role_context,
+    prompt = CallPrompt(prepared_questions=questions, role_context=role_context)
+    await _call_prompt_repository().save_prompt_async(str(application_id), prompt)
+    return prompt
+
+
+def generate_call_prompt(event: JobOfferApplied) -> "Future[Optional[CallPrompt]]":
+    """
+    Subscriber entry point: the generation for this application, joined if one is already
+    in flight. Returns without waiting; the future resolves once the prompt is stored.
+    """
+    return _generations.share(
+        str(event.application_id),
+        lambda: _SUBSCRIBER_LOOP.submit(_generate_call_prompt_with_retry(event.application_id)),
     )
 
 
-def generate_call_prompt(event: JobOfferApplied) -> None:
-    app_id_str = str(event.application_id)
+def start_call_prompt(application_id: str) -> "Future[Optional[CallPrompt]]":
+    """
+    The prompt generation in flight for ``application_id``, or a new one started in the
+    background. Resolves to the stored prompt (tailored, or the minimal default on failure),
+    or to None without storing anything when there is no such application.
+    """
+
+    async def generate() -> Optional[CallPrompt]:
+        # The subscriber may have finished between the caller's read and this start.
+        existing = await _call_prompt_repository().get_prompt_async(application_id)
+        if existing is not None:
+            return existing
+        return await _generate_call_prompt_with_retry(
+            ApplicationId(application_id), missing_is_final=True
+        )
+
+    return _generations.share(application_id, lambda: _SUBSCRIBER_LOOP.submit(generate()))
+
+
+async def _generate_call_prompt_with_retry(
+    application_id: ApplicationId, missing_is_final: bool = False
+) -> Optional[CallPrompt]:
+    """
+    Generate and store the prompt, retrying with backoff, then fall back to the minimal
+    default. With ``missing_is_final`` an unknown application ends it at once with None.
+    """
+    app_id_str = str(application_id)
     last_error = None
     for attempt in range(_PROMPT_RETRIES):
         try:
-            _generate_call_prompt_once(event)
-            if get_call_prompt(app_id_str) is not None:
-                return
+            prompt = await _generate_call_prompt_once(application_id)
+            if prompt is not None:
+                return prompt
+            if missing_is_final:
+                logger.warning("No application %s; call prompt not generated", app_id_str)
+                return None
         except Exception as e:
             last_error = e
             logger.warning("Call prompt attempt %s failed: %s", attempt + 1, e)
             if attempt < _PROMPT_RETRIES - 1:
-                time.sleep(_PROMPT_BACKOFF_BASE * (2 ** attempt))
+                await asyncio.sleep(_PROMPT_BACKOFF_BASE * (2 ** attempt))
     logger.warning(
         "Call prompt failed after %s attempts; using minimal default for application %s",
         _PROMPT_RETRIES,
         app_id_str,
         exc_info=last_error,
     )
-    _minimal_prompt_for_application(app_id_str)
+    return await _minimal_prompt_for_application(app_id_str)
+
+
+def stop_subscriber_loop() -> None:
+    """Cancel generations still running, dispose the loop's async engine and join its thread."""
+    _SUBSCRIBER_LOOP.stop()
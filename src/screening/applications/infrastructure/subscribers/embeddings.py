@@ -6,12 +6,14 @@ from typing import List, Optional
 import httpx
 
 from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.infrastructure.adapters.embedding_cache import (
+    normalize_embedding_text,
+)
 from src.wiring import get_settings
 
 logger = logging.getLogger(__name__)
 
 _embeddings_store: dict[str, list[float]] = {}
-_MAX_TEXT_LENGTH = 8000
 _EMBED_RETRIES = 3
 _EMBED_BACKOFF_BASE = 1.0
 
@@ -30,42 +32,73 @@ def _embed_stub(text: str) -> list[float]:
     return [((h >> i) % 1000) / 1000.0 for i in range(0, 64, 2)]
 
 
-def _embed_one_attempt(text: str) -> Optional[List[float]]:
-    """Single attempt at Ollama /api/embed. Returns embedding list or None on failure."""
+def _embed_batch_attempt(texts: List[str]) -> List[Optional[List[float]]]:
+    """Single Ollama /api/embed request for a list of inputs. Results are in input order; None where empty."""
     settings = get_settings()
     base = (settings.ollama_base_url or "").strip().rstrip("/")
     if not base:
-        return None
+        return [None] * len(texts)
     url = f"{base}/api/embed"
-    payload_text = (text or "").strip()[: _MAX_TEXT_LENGTH]
-    if not payload_text:
-        return None
     with httpx.Client(timeout=settings.ollama_timeout) as client:
         r = client.post(
             url,
-            json={"model": settings.ollama_embed_model, "input": payload_text},
+            json={"model": settings.ollama_embed_model, "input": texts},
         )
         r.raise_for_status()
         data = r.json()
     emb_list = data.get("embeddings") or []
-    embeddings = emb_list[0] if emb_list else []
-    if isinstance(embeddings, list) and len(embeddings) > 0:
-        return [float(x) for x in embeddings]
-    return None
+    if len(emb_list) != len(texts):
+        raise ValueError(f"Ollama returned {len(emb_list)} embeddings for {len(texts)} inputs")
+    return [
+        [float(x) for x in embedding] if isinstance(embedding, list) and len(embedding) > 0 else None
+        for embedding in emb_list
+    ]
 
 
-def _embed_with_retry(text: str) -> Optional[List[float]]:
-    """Retry embedding 2-3 times with exponential backoff. Returns None on final failure."""
+def _embed_batch_with_retry(texts: List[str]) -> List[Optional[List[float]]]:
+    """Retry the inputs still missing 2-3 times with exponential backoff. None where all attempts failed."""
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    pending = list(range(len(texts)))
     for attempt in range(_EMBED_RETRIES):
         try:
-            result = _embed_one_attempt(text)
-            if result is not None:
-                return result
+            embedded = _embed_batch_attempt([texts[i] for i in pending])
+            for i, embedding in zip(pending, embedded):
+                results[i] = embedding
+            pending = [i for i in pending if results[i] is None]
+            if not pending:
+                return results
         except Exception as e:
-            logger.warning("Embed attempt %s failed: %s", attempt + 1, e)
+            logger.warning("Embed attempt %s for %s inputs failed: %s", attempt + 1, len(pending), e)
         if attempt < _EMBED_RETRIES - 1:
             time.sleep(_EMBED_BACKOFF_BASE * (2 ** attempt))
-    return None
+    return results
+
+
+def _embed_with_retry(text: str) -> Optional[List[float]]:
+    """
+    Serve from the embedding cache when this text was embedded before. Otherwise embed it,
+    through the shared batcher when enabled so concurrent handlers share one Ollama request,
+    with retries. Returns None on final failure.
+    """
+    from src.wiring import get_embedding_batcher, get_embedding_cache
+
+    model = get_settings().ollama_embed_model
+    text = normalize_embedding_text(text)
+    if not text:
+        return None
+    cache = get_embedding_cache()
+    if cache is not None:
+        cached = cache.get(model, text)
+        if cached is not None:
+            return cached
+    batcher = get_embedding_batcher()
+    if batcher is not None:
+        result = batcher.embed(text)
+    else:
+        result = _embed_batch_with_retry([text])[0]
+    if result is not None and cache is not None:
+        cache.put(model, text, result)
+    return result
 
 
 def _embed(text: str) -> list[float]:
@@ -125,10 +158,24 @@ def generate_candidate_embeddings(event: JobOfferApplied) -> None:
         logger.warning("Failed to persist candidate embedding: %s", e)
 
 
+def _job_offer_embedding_exists(job_offer_id: str) -> bool:
+    if get_job_offer_embeddings(job_offer_id) is not None:
+        return True
+    try:
+        from src.wiring import get_embedding_repository
+        return get_embedding_repository().get_job_offer_embedding(job_offer_id) is not None
+    except Exception as e:
+        logger.warning("Failed to look up job offer embedding: %s", e)
+        return False
+
+
 def generate_job_offer_embeddings(event: JobOfferApplied) -> None:
     from src.screening.applications.application.ports import ApplicationRepository
     from src.wiring import get_application_repository
 
+    # Job offers are shared across applications; only re-embed when the content was (re)written.
+    if not event.job_offer_changed and _job_offer_embedding_exists(str(event.job_offer_id)):
+        return
     repo: ApplicationRepository = get_application_repository()
     if not hasattr(repo, "get_job_offer"):
         return
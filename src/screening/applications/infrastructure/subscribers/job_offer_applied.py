@@ -1,17 +1,41 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
 
 from src.screening.applications.domain.events import JobOfferApplied
-
-if TYPE_CHECKING:
-    pass
+from src.screening.shared.infrastructure import StageTracker
 
 logger = logging.getLogger(__name__)
+
+CANDIDATE_EMBEDDINGS = "candidate_embeddings"
+JOB_OFFER_EMBEDDINGS = "job_offer_embeddings"
+CALL_PROMPT = "call_prompt"
+# Embeddings run on stage threads; the call prompt is a coroutine on its own event loop.
+_THREAD_STAGES = (CANDIDATE_EMBEDDINGS, JOB_OFFER_EMBEDDINGS)
+_STAGES = (*_THREAD_STAGES, CALL_PROMPT)
+
+_BACKGROUND_WORKERS = 3
+
 _BACKGROUND_SUBSCRIBERS = ThreadPoolExecutor(
-    max_workers=3,
+    max_workers=_BACKGROUND_WORKERS,
     thread_name_prefix="job_offer_applied",
 )
+# Every event fans out into its thread stages here; sized for all background events plus
+# the RabbitMQ consumer running them at once.
+_SUBSCRIBER_STAGES = ThreadPoolExecutor(
+    max_workers=(_BACKGROUND_WORKERS + 1) * len(_THREAD_STAGES),
+    thread_name_prefix="job_offer_applied_stage",
+)
+
+_readiness = StageTracker(max_keys=4096)
+
+
+def get_application_readiness(application_id: str) -> Optional[dict[str, Any]]:
+    """
+    Stage states (pending/done/failed) and seconds-to-finish for an application's
+    JobOfferApplied run; None if the run did not happen in this process (or was evicted).
+    """
+    return _readiness.status(application_id)
 
 
 def on_job_offer_applied(event: JobOfferApplied) -> None:
@@ -34,36 +58,73 @@ def on_job_offer_applied(event: JobOfferApplied) -> None:
 
 
 def _run_subscribers(event: JobOfferApplied) -> None:
-    _generate_candidate_embeddings(event)
-    _generate_job_offer_embeddings(event)
-    _generate_call_prompt(event)
+    """Run the three stages concurrently and return once all have finished."""
+    application_id = str(event.application_id)
+    stages: list[tuple[str, str, Callable[[JobOfferApplied], None]]] = [
+        (CANDIDATE_EMBEDDINGS, "GenerateCandidateEmbeddings", _generate_candidate_embeddings),
+        (JOB_OFFER_EMBEDDINGS, "GenerateJobOfferEmbeddings", _generate_job_offer_embeddings),
+    ]
+    _readiness.start(application_id, _STAGES)
+    call_prompt_stage = _start_call_prompt_stage(application_id, event)
+    wait(
+        [
+            _SUBSCRIBER_STAGES.submit(_run_stage, application_id, stage, label, handler, event)
+            for stage, label, handler in stages
+        ]
+        + [call_prompt_stage]
+    )
 
 
-def _generate_candidate_embeddings(event: JobOfferApplied) -> None:
+def _run_stage(
+    application_id: str,
+    stage: str,
+    label: str,
+    handler: Callable[[JobOfferApplied], None],
+    event: JobOfferApplied,
+) -> None:
+    # A failing stage is logged and marked failed; it never affects the other stages.
     try:
-        from src.screening.applications.infrastructure.subscribers.embeddings import (
-            generate_candidate_embeddings,
-        )
-        generate_candidate_embeddings(event)
+        handler(event)
     except Exception as e:
-        logger.exception("GenerateCandidateEmbeddings failed: %s", e)
+        logger.exception("%s failed: %s", label, e)
+        _readiness.finish(application_id, stage, ok=False)
+        return
+    _readiness.finish(application_id, stage)
+
+
+def _generate_candidate_embeddings(event: JobOfferApplied) -> None:
+    from src.screening.applications.infrastructure.subscribers.embeddings import (
+        generate_candidate_embeddings,
+    )
+    generate_candidate_embeddings(event)
 
 
 def _generate_job_offer_embeddings(event: JobOfferApplied) -> None:
-    try:
-        from src.screening.applications.infrastructure.subscribers.embeddings import (
-            generate_job_offer_embeddings,
-        )
-        generate_job_offer_embeddings(event)
-    except Exception as e:
-        logger.exception("GenerateJobOfferEmbeddings failed: %s", e)
+    from src.screening.applications.infrastructure.subscribers.embeddings import (
+        generate_job_offer_embeddings,
+    )
+    generate_job_offer_embeddings(event)
+
+
+def _start_call_prompt_stage(application_id: str, event: JobOfferApplied) -> Future:
+    """Resolves once the call prompt stage is recorded; no stage thread waits on the generation."""
+    from src.screening.applications.infrastructure.subscribers.call_prompt import (
+        generate_call_prompt,
+    )
+
+    stage_done: Future = Future()
 
+    def finish(generation: Future) -> None:
+        error = "cancelled" if generation.cancelled() else generation.exception()
+        if error is not None:
+            logger.error("GenerateCallPrompt failed: %s", error)
+        _readiness.finish(application_id, CALL_PROMPT, ok=error is None)
+        stage_done.set_result(None)
 
-def _generate_call_prompt(event: JobOfferApplied) -> None:
     try:
-        from src.screening.applications.infrastructure.subscribers.call_prompt import (
-            generate_call_prompt,
-        )
-        generate_call_prompt(event)
+        generate_call_prompt(event).add_done_callback(finish)
     except Exception as e:
         logger.exception("GenerateCallPrompt failed: %s", e)
+        _readiness.finish(application_id, CALL_PROMPT, ok=False)
+        stage_done.set_result(None)
+    return stage_done
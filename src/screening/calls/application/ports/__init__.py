@@ -1,3 +1,4 @@
+from src.screening.calls.application.ports.call_prompt_repository import CallPromptRepository
 from src.screening.calls.application.ports.call_repository import CallRepository
 
-__all__ = ["CallRepository"]
+__all__ = ["CallPromptRepository", "CallRepository"]
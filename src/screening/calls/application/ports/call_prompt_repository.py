@@ -0,0 +1,26 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.screening.calls.domain.value_objects import CallPrompt
+
+
+class CallPromptRepository(ABC):
+    """Port for the prompt prepared for each application's call, keyed by application id."""
+
+    @abstractmethod
+    def save_prompt(self, application_id: str, prompt: CallPrompt) -> None:
+        pass
+
+    @abstractmethod
+    def get_prompt(self, application_id: str) -> Optional[CallPrompt]:
+        pass
+
+    # Async entry points for the request path. Defaults run the sync method in a worker
+    # thread; native-async adapters override them.
+
+    async def save_prompt_async(self, application_id: str, prompt: CallPrompt) -> None:
+        await asyncio.to_thread(self.save_prompt, application_id, prompt)
+
+    async def get_prompt_async(self, application_id: str) -> Optional[CallPrompt]:
+        return await asyncio.to_thread(self.get_prompt, application_id)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -23,3 +24,20 @@ class CallRepository(ABC):
     @abstractmethod
     def mark_call_completed(self, call_id: CallId) -> None:
         pass
+
+    # Async entry points for the request path. Defaults run the sync method in a worker
+    # thread; native-async adapters override them.
+
+    async def save_call_async(self, call: ScreeningCall) -> None:
+        await asyncio.to_thread(self.save_call, call)
+
+    async def get_call_async(self, call_id: CallId) -> Optional[ScreeningCall]:
+        return await asyncio.to_thread(self.get_call, call_id)
+
+    async def update_call_transcript_async(
+        self, call_id: CallId, transcript: list[TranscriptSegment]
+    ) -> None:
+        await asyncio.to_thread(self.update_call_transcript, call_id, transcript)
+
+    async def mark_call_completed_async(self, call_id: CallId) -> None:
+        await asyncio.to_thread(self.mark_call_completed, call_id)
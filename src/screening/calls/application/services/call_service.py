@@ -1,41 +1,44 @@
+import asyncio
+import logging
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Callable, Optional, Protocol
+from typing import Awaitable, Callable, Optional
 from uuid import uuid4
 
 from src.screening.applications.domain.ports import EventPublisher
-from src.screening.calls.application.ports import CallRepository
+from src.screening.calls.application.ports import CallPromptRepository, CallRepository
 from src.screening.calls.domain.entities import (
     ScreeningCall,
     TranscriptSegment,
 )
-from src.screening.calls.domain.value_objects import CallStatus
+from src.screening.calls.domain.value_objects import CallPrompt, CallStatus
 from src.screening.calls.domain.events import CallFinished
 from src.screening.shared.domain import ApplicationId, CallId
 
-
-class CallPrompt:
-    def __init__(
-        self,
-        prepared_questions: list[str],
-        role_context: str,
-    ) -> None:
-        self.prepared_questions = prepared_questions
-        self.role_context = role_context
+logger = logging.getLogger(__name__)
 
 
-class CallPromptProviderResult(Protocol):
-    prepared_questions: list[str]
-    role_context: str
+def _default_prompt() -> CallPrompt:
+    return CallPrompt(
+        prepared_questions=["Tell me about your background."],
+        role_context="Screening call.",
+    )
 
 
 class CallService:
     def __init__(
         self,
-        get_call_prompt: Callable[[str], Optional[CallPromptProviderResult]],
+        get_call_prompt_repository: Callable[[], Optional[CallPromptRepository]],
         get_event_publisher: Callable[[], EventPublisher],
         get_call_repository: Callable[[], Optional[CallRepository]],
+        start_prompt_generation: Optional[Callable[[str], "Future[Optional[CallPrompt]]"]] = None,
+        prompt_wait_seconds: float = 5.0,
+        application_exists: Optional[Callable[[ApplicationId], Awaitable[bool]]] = None,
     ) -> None:
-        self._get_call_prompt = get_call_prompt
+        self._get_call_prompt_repository = get_call_prompt_repository
+        self._application_exists = application_exists
+        self._start_prompt_generation = start_prompt_generation
+        self._prompt_wait_seconds = prompt_wait_seconds
         self._get_event_publisher = get_event_publisher
         self._get_call_repository = get_call_repository
         self._active_calls: dict[str, CallId] = {}
@@ -49,32 +52,75 @@ class CallService:
     def unregister_active_call(self, application_id: ApplicationId) -> None:
         self._active_calls.pop(str(application_id), None)
 
-    def get_prompt_for_application(self, application_id: ApplicationId) -> Optional[CallPrompt]:
-        prompt = self._get_call_prompt(str(application_id))
-        if prompt is None:
-            return CallPrompt(
-                prepared_questions=["Tell me about your background."],
-                role_context="Screening call.",
+    async def application_exists_async(self, application_id: ApplicationId) -> bool:
+        """Whether a call may start for this application; True when no check is configured."""
+        if self._application_exists is None:
+            return True
+        return await self._application_exists(application_id)
+
+    def get_prompt_for_application(self, application_id: ApplicationId) -> CallPrompt:
+        repo = self._get_call_prompt_repository()
+        prompt = repo.get_prompt(str(application_id)) if repo else None
+        return prompt if prompt is not None else _default_prompt()
+
+    async def get_prompt_for_application_async(self, application_id: ApplicationId) -> CallPrompt:
+        """
+        The stored prompt; if there is none yet, wait up to ``prompt_wait_seconds`` for the
+        generation in flight for this application (starting one if none is), then fall back
+        to the generic default.
+        """
+        repo = self._get_call_prompt_repository()
+        prompt = await repo.get_prompt_async(str(application_id)) if repo else None
+        if prompt is None and self._start_prompt_generation is not None:
+            prompt = await self._await_prompt_generation(str(application_id))
+        return prompt if prompt is not None else _default_prompt()
+
+    async def _await_prompt_generation(self, application_id: str) -> Optional[CallPrompt]:
+        try:
+            future = self._start_prompt_generation(application_id)
+            # Shielded: timing out here must not cancel the generation other callers share.
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), timeout=self._prompt_wait_seconds
             )
-        return CallPrompt(
-            prepared_questions=prompt.prepared_questions,
-            role_context=prompt.role_context,
-        )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Call prompt for application %s not ready after %.1fs; using the default",
+                application_id,
+                self._prompt_wait_seconds,
+            )
+        except Exception as e:
+            logger.warning("Call prompt generation for application %s failed: %s", application_id, e)
+        return None
 
-    def start_call(self, application_id: ApplicationId) -> ScreeningCall:
-        call_id = CallId(uuid4())
-        call = ScreeningCall(
-            id=call_id,
+    def _new_call(self, application_id: ApplicationId) -> ScreeningCall:
+        return ScreeningCall(
+            id=CallId(uuid4()),
             application_id=application_id,
             status=CallStatus.IN_PROGRESS,
             started_at=datetime.utcnow(),
             ended_at=None,
             transcript=[],
         )
+
+    def start_call(self, application_id: ApplicationId) -> ScreeningCall:
+        call = self._new_call(application_id)
         repo = self._get_call_repository()
         if repo:
             repo.save_call(call)
-        self.register_active_call(application_id, call_id)
+        self.register_active_call(application_id, call.id)
+        return call
+
+    async def start_call_async(self, application_id: ApplicationId) -> ScreeningCall:
+        call = self._new_call(application_id)
+        # Register before the first await so a concurrent duplicate check sees this call.
+        self.register_active_call(application_id, call.id)
+        repo = self._get_call_repository()
+        if repo:
+            try:
+                await repo.save_call_async(call)
+            except Exception:
+                self.unregister_active_call(application_id)
+                raise
         return call
 
     def end_call(
@@ -95,3 +141,22 @@ class CallService:
         )
         publisher = self._get_event_publisher()
         publisher.publish(event)
+
+    async def end_call_async(
+        self,
+        application_id: ApplicationId,
+        call_id: CallId,
+        transcript: list[TranscriptSegment],
+    ) -> None:
+        self.unregister_active_call(application_id)
+        repo = self._get_call_repository()
+        if repo:
+            await repo.update_call_transcript_async(call_id, transcript)
+            await repo.mark_call_completed_async(call_id)
+        event = CallFinished(
+            application_id=application_id,
+            call_id=call_id,
+            occurred_at=datetime.utcnow(),
+        )
+        # Publishing may block (RabbitMQ) and in-process subscribers run analysis synchronously.
+        await asyncio.to_thread(self._get_event_publisher().publish, event)
@@ -2,12 +2,13 @@ from src.screening.calls.domain.entities import (
     ScreeningCall,
     TranscriptSegment,
 )
-from src.screening.calls.domain.value_objects import CallStatus
+from src.screening.calls.domain.value_objects import CallPrompt, CallStatus
 from src.screening.calls.domain.events import CallFinished
 
 __all__ = [
     "ScreeningCall",
     "TranscriptSegment",
+    "CallPrompt",
     "CallStatus",
     "CallFinished",
 ]
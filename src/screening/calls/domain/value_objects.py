@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -5,3 +6,11 @@ class CallStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+@dataclass
+class CallPrompt:
+    """Questions and role context Emma uses for an application's screening call."""
+
+    prepared_questions: list[str]
+    role_context: str
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.calls.infrastructure.adapters.postgres_call_prompt_repository import (
+    PostgresCallPromptRepository,
+    _parse_application_id,
+    _row_to_prompt,
+    _select_prompt_stmt,
+    _upsert_prompt_stmt,
+)
+from src.screening.persistence import AsyncSessionProvider
+
+
+class AsyncPostgresCallPromptRepository(PostgresCallPromptRepository):
+    """PostgresCallPromptRepository with native AsyncSession implementations of the async methods."""
+
+    def __init__(self, session_factory, async_sessions: AsyncSessionProvider) -> None:
+        super().__init__(session_factory)
+        self._async_sessions = async_sessions
+
+    async def save_prompt_async(self, application_id: str, prompt: CallPrompt) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().save_prompt_async(application_id, prompt)
+            return
+        uid = _parse_application_id(application_id)
+        if uid is None:
+            return
+        async with async_session_factory() as session:
+            await session.execute(_upsert_prompt_stmt(uid, prompt))
+            await session.commit()
+
+    async def get_prompt_async(self, application_id: str) -> Optional[CallPrompt]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().get_prompt_async(application_id)
+        uid = _parse_application_id(application_id)
+        if uid is None:
+            return None
+        async with async_session_factory() as session:
+            return _row_to_prompt((await session.execute(_select_prompt_stmt(uid))).first())
@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Optional
+
+from src.screening.calls.domain.entities import ScreeningCall, TranscriptSegment
+from src.screening.calls.domain.value_objects import CallStatus
+from src.screening.calls.infrastructure.adapters.postgres_call_repository import (
+    PostgresCallRepository,
+    _call_to_row,
+    _row_to_call,
+    _segment_to_dict,
+)
+from src.screening.persistence import AsyncSessionProvider
+from src.screening.persistence.models import CallModel
+from src.screening.shared.domain import CallId
+
+
+class AsyncPostgresCallRepository(PostgresCallRepository):
+    """PostgresCallRepository with native AsyncSession implementations of the async methods."""
+
+    def __init__(self, session_factory, async_sessions: AsyncSessionProvider) -> None:
+        super().__init__(session_factory)
+        self._async_sessions = async_sessions
+
+    async def save_call_async(self, call: ScreeningCall) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().save_call_async(call)
+            return
+        async with async_session_factory() as session:
+            await session.merge(_call_to_row(call))
+            await session.commit()
+
+    async def get_call_async(self, call_id: CallId) -> Optional[ScreeningCall]:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            return await super().get_call_async(call_id)
+        async with async_session_factory() as session:
+            row = await session.get(CallModel, call_id.value)
+            return _row_to_call(row) if row else None
+
+    async def update_call_transcript_async(
+        self, call_id: CallId, transcript: list[TranscriptSegment]
+    ) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().update_call_transcript_async(call_id, transcript)
+            return
+        async with async_session_factory() as session:
+            row = await session.get(CallModel, call_id.value)
+            if row:
+                row.transcript = [_segment_to_dict(s) for s in transcript]
+                await session.commit()
+
+    async def mark_call_completed_async(self, call_id: CallId) -> None:
+        async_session_factory = self._async_sessions.current()
+        if async_session_factory is None:
+            await super().mark_call_completed_async(call_id)
+            return
+        async with async_session_factory() as session:
+            row = await session.get(CallModel, call_id.value)
+            if row:
+                row.status = CallStatus.COMPLETED.value
+                row.ended_at = datetime.utcnow()
+                await session.commit()
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from src.screening.calls.application.ports import CallPromptRepository
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.shared.infrastructure import TtlLruCache
+
+
+class CachedCallPromptRepository(CallPromptRepository):
+    """
+    Bounded LRU in front of a shared CallPromptRepository: reads through, writes through.
+
+    Misses are not cached, so a prompt saved by another worker is found on the next read.
+    """
+
+    def __init__(
+        self,
+        delegate: CallPromptRepository,
+        max_size: int = 4096,
+        ttl_seconds: Optional[float] = 300.0,
+    ) -> None:
+        self._delegate = delegate
+        self._cache: TtlLruCache[str, CallPrompt] = TtlLruCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    def save_prompt(self, application_id: str, prompt: CallPrompt) -> None:
+        self._delegate.save_prompt(application_id, prompt)
+        self._cache.set(application_id, prompt)
+
+    def get_prompt(self, application_id: str) -> Optional[CallPrompt]:
+        prompt = self._cache.get(application_id)
+        if prompt is None:
+            prompt = self._delegate.get_prompt(application_id)
+            if prompt is not None:
+                self._cache.set(application_id, prompt)
+        return prompt
+
+    async def save_prompt_async(self, application_id: str, prompt: CallPrompt) -> None:
+        await self._delegate.save_prompt_async(application_id, prompt)
+        self._cache.set(application_id, prompt)
+
+    async def get_prompt_async(self, application_id: str) -> Optional[CallPrompt]:
+        prompt = self._cache.get(application_id)
+        if prompt is None:
+            prompt = await self._delegate.get_prompt_async(application_id)
+            if prompt is not None:
+                self._cache.set(application_id, prompt)
+        return prompt
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
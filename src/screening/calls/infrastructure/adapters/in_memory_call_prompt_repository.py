@@ -0,0 +1,24 @@
+from typing import Optional
+
+from src.screening.calls.application.ports import CallPromptRepository
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.shared.infrastructure import TtlLruCache
+
+
+class InMemoryCallPromptRepository(CallPromptRepository):
+    """Process-local prompts, capped at ``max_size``; the least recently used are dropped first."""
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self._prompts: TtlLruCache[str, CallPrompt] = TtlLruCache(max_size=max_size)
+
+    def save_prompt(self, application_id: str, prompt: CallPrompt) -> None:
+        self._prompts.set(application_id, prompt)
+
+    def get_prompt(self, application_id: str) -> Optional[CallPrompt]:
+        return self._prompts.get(application_id)
+
+    async def save_prompt_async(self, application_id: str, prompt: CallPrompt) -> None:
+        self.save_prompt(application_id, prompt)
+
+    async def get_prompt_async(self, application_id: str) -> Optional[CallPrompt]:
+        return self.get_prompt(application_id)
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.screening.calls.application.ports import CallPromptRepository
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.persistence.models import CallPromptModel
+
+
+def _parse_application_id(application_id: str) -> Optional[UUID]:
+    try:
+        return UUID(application_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def _select_prompt_stmt(application_id: UUID):
+    return select(CallPromptModel.prepared_questions, CallPromptModel.role_context).where(
+        CallPromptModel.application_id == application_id
+    )
+
+
+def _upsert_prompt_stmt(application_id: UUID, prompt: CallPrompt):
+    stmt = pg_insert(CallPromptModel).values(
+        application_id=application_id,
+        prepared_questions=list(prompt.prepared_questions),
+        role_context=prompt.role_context,
+        created_at=datetime.utcnow(),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["application_id"],
+        set_={
+            "prepared_questions": stmt.excluded.prepared_questions,
+            "role_context": stmt.excluded.role_context,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+
+
+def _row_to_prompt(row) -> Optional[CallPrompt]:
+    if row is None:
+        return None
+    return CallPrompt(prepared_questions=list(row.prepared_questions), role_context=row.role_context)
+
+
+class PostgresCallPromptRepository(CallPromptRepository):
+    def __init__(self, session_factory) -> None:
+        self._session_factory = session_factory
+
+    def save_prompt(self, application_id: str, prompt: CallPrompt) -> None:
+        uid = _parse_application_id(application_id)
+        if uid is None:
+            return
+        with self._session_factory() as session:
+            session.execute(_upsert_prompt_stmt(uid, prompt))
+            session.commit()
+
+    def get_prompt(self, application_id: str) -> Optional[CallPrompt]:
+        uid = _parse_application_id(application_id)
+        if uid is None:
+            return None
+        with self._session_factory() as session:
+            return _row_to_prompt(session.execute(_select_prompt_stmt(uid)).first())
@@ -31,21 +31,24 @@ def _row_to_call(row: CallModel) -> ScreeningCall:
     )
 
 
+def _call_to_row(call: ScreeningCall) -> CallModel:
+    return CallModel(
+        id=call.id.value,
+        application_id=call.application_id.value,
+        status=call.status.value,
+        started_at=call.started_at,
+        ended_at=call.ended_at,
+        transcript=[_segment_to_dict(s) for s in call.transcript],
+    )
+
+
 class PostgresCallRepository(CallRepository):
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
 
     def save_call(self, call: ScreeningCall) -> None:
         with self._session_factory() as session:
-            row = CallModel(
-                id=call.id.value,
-                application_id=call.application_id.value,
-                status=call.status.value,
-                started_at=call.started_at,
-                ended_at=call.ended_at,
-                transcript=[_segment_to_dict(s) for s in call.transcript],
-            )
-            session.merge(row)
+            session.merge(_call_to_row(call))
             session.commit()
 
     def get_call(self, call_id: CallId) -> ScreeningCall | None:
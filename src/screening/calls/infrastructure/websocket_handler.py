@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_UNKNOWN_APPLICATION_CLOSE_CODE = 4404
 _DUPLICATE_CALL_CLOSE_CODE = 4409
 _DEFAULT_READY_TIMEOUT_BASE_SECONDS = 5.0
 _DEFAULT_READY_TIMEOUT_MAX_SECONDS = 20.0
@@ -57,6 +58,10 @@ async def handle_call_websocket(
     audio_transcriber = get_audio_transcriber() if get_audio_transcriber else _transcribe_audio_stub
 
     call_service = get_call_service()
+    if not await call_service.application_exists_async(application_id):
+        await websocket.close(code=_UNKNOWN_APPLICATION_CLOSE_CODE, reason="Application not found")
+        return
+    # No await between the duplicate check and start_call_async registering the call.
     if call_service.is_application_in_call(application_id):
         await websocket.close(
             code=_DUPLICATE_CALL_CLOSE_CODE,
@@ -64,7 +69,7 @@ async def handle_call_websocket(
         )
         return
 
-    call = call_service.start_call(application_id)
+    call = await call_service.start_call_async(application_id)
     transcript: list[TranscriptSegment] = []
     start_time = time.monotonic()
 
@@ -78,7 +83,7 @@ async def handle_call_websocket(
     try:
         await websocket.accept()
 
-        prompt = call_service.get_prompt_for_application(application_id)
+        prompt = await call_service.get_prompt_for_application_async(application_id)
         emma = get_emma_service()
 
         greeting = await emma.greeting(prompt.role_context)
@@ -144,12 +149,7 @@ async def handle_call_websocket(
         pass
     finally:
         try:
-            await asyncio.to_thread(
-                call_service.end_call,
-                application_id,
-                call.id,
-                transcript,
-            )
+            await call_service.end_call_async(application_id, call.id, transcript)
         except Exception as exc:
             logger.exception("Failed to finalize call %s: %s", call.id, exc)
 
@@ -1,3 +1,24 @@
-from src.screening.persistence.models import Base, create_engine_from_url, get_session_factory
+from src.screening.persistence.async_sessions import AsyncSessionProvider
+from src.screening.persistence.models import (
+    Base,
+    create_async_engine_from_url,
+    create_engine_from_url,
+    ensure_schema,
+    get_async_session_factory,
+    get_session_factory,
+    to_async_database_url,
+)
+from src.screening.persistence.pool import PoolMetrics, PoolSettings
 
-__all__ = ["Base", "create_engine_from_url", "get_session_factory"]
+__all__ = [
+    "AsyncSessionProvider",
+    "Base",
+    "create_async_engine_from_url",
+    "create_engine_from_url",
+    "ensure_schema",
+    "get_async_session_factory",
+    "get_session_factory",
+    "PoolMetrics",
+    "PoolSettings",
+    "to_async_database_url",
+]
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from typing import Any, Optional
+
+from src.screening.persistence.models import (
+    create_async_engine_from_url,
+    get_async_session_factory,
+)
+from src.screening.persistence.pool import PoolMetrics, PoolSettings
+
+
+class AsyncSessionProvider:
+    """
+    AsyncSession factories, one async engine per event loop that asked for one.
+
+    asyncpg connections cannot be shared across event loops, so each loop that queries
+    natively binds its own engine with open(): the serving loop in the app lifespan, the
+    call prompt subscriber loop when it starts. Code running on any other loop (asyncio.run
+    in workers) or before open() gets None from current() and should use the sync
+    repository path instead.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_settings: Optional[PoolSettings] = None,
+        metrics: Optional[PoolMetrics] = None,
+    ) -> None:
+        self._database_url = database_url
+        self._pool_settings = pool_settings
+        self._metrics = metrics
+        self._bindings: dict[asyncio.AbstractEventLoop, tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def open(self, metrics: Optional[PoolMetrics] = None) -> None:
+        """
+        Create an async engine for the running loop; call from inside it. ``metrics``
+        (one PoolMetrics per engine) defaults to the provider's.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop in self._bindings:
+                return
+            engine = create_async_engine_from_url(
+                self._database_url, self._pool_settings, metrics or self._metrics
+            )
+            self._bindings[loop] = (engine, get_async_session_factory(engine))
+
+    async def close(self) -> None:
+        """Dispose the running loop's engine."""
+        with self._lock:
+            binding = self._bindings.pop(asyncio.get_running_loop(), None)
+        if binding is not None:
+            await binding[0].dispose()
+
+    def current(self) -> Any:
+        """The session factory bound to the running loop; None otherwise."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        binding = self._bindings.get(loop)
+        return binding[1] if binding is not None else None
@@ -0,0 +1,86 @@
+"""
+Backfill binary embeddings from legacy JSONB rows.
+
+    SCREENING_DATABASE_URL=postgresql://... python -m src.screening.persistence.embedding_migration [--batch-size 500]
+
+Safe to run against a live database and to re-run: it walks entity_embeddings by id in
+batches, converts rows that only hold JSONB into the configured storage
+(SCREENING_EMBEDDING_STORAGE), clears the JSONB and commits per batch. Repositories read
+either format, so serving continues while it runs.
+"""
+import argparse
+from typing import Any, Optional
+
+from sqlalchemy import bindparam, null, select, update
+
+from src.screening.persistence.models import entity_embeddings
+from src.screening.persistence.vectors import pack_float32, vector_from_json
+
+
+def migrate_jsonb_embeddings(session_factory, storage: str = "float32", batch_size: int = 500) -> int:
+    """Convert JSONB-only rows to ``storage`` (float32 or pgvector). Returns rows converted."""
+    if storage not in ("float32", "pgvector"):
+        raise ValueError(f"Cannot migrate JSONB embeddings to {storage!r}")
+    target = "embedding_f32" if storage == "float32" else "embedding_vector"
+    converted = 0
+    last_id: Optional[Any] = None
+    while True:
+        query = (
+            select(entity_embeddings.c.id, entity_embeddings.c.embedding)
+            .where(
+                entity_embeddings.c.embedding.is_not(None),
+                entity_embeddings.c[target].is_(None),
+            )
+            .order_by(entity_embeddings.c.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.where(entity_embeddings.c.id > last_id)
+        with session_factory() as session:
+            rows = session.execute(query).all()
+            if not rows:
+                return converted
+            last_id = rows[-1].id
+            params = []
+            for row in rows:
+                vector = vector_from_json(row.embedding)
+                if vector is None:
+                    continue  # malformed legacy row; left as is
+                value = pack_float32(vector) if storage == "float32" else vector
+                params.append({"row_id": row.id, target: value})
+            if params:
+                session.execute(
+                    update(entity_embeddings)
+                    .where(entity_embeddings.c.id == bindparam("row_id"))
+                    .values({"embedding": null()}),
+                    params,
+                )
+                session.commit()
+                converted += len(params)
+
+
+def main() -> None:
+    from src.config import Settings
+    from src.screening.persistence.models import (
+        create_engine_from_url,
+        ensure_schema,
+        get_session_factory,
+    )
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    settings = Settings()
+    if not settings.database_url:
+        raise SystemExit("SCREENING_DATABASE_URL is not set")
+    engine = create_engine_from_url(settings.database_url)
+    ensure_schema(engine, settings.embedding_storage)
+    converted = migrate_jsonb_embeddings(
+        get_session_factory(engine), settings.embedding_storage, args.batch_size
+    )
+    print(f"Converted {converted} embeddings to {settings.embedding_storage}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,15 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import create_engine, UniqueConstraint
+from sqlalchemy import LargeBinary, column, create_engine, event, table, text, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 from sqlalchemy.types import DateTime
 
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.screening.persistence.pool import PoolMetrics, PoolSettings, timed_pool_class
+from src.screening.persistence.vectors import PgVector
 
 
 class Base(DeclarativeBase):
@@ -29,10 +33,13 @@ class CandidateModel(Base):
 class JobOfferModel(Base):
     __tablename__ = "job_offers"
     id: Mapped[UUID] = _uuid_col(primary_key=True)
-    external_id: Mapped[str] = mapped_column(nullable=False, index=True)
+    # Torre job id; one row per job offer, shared by every application to it.
+    external_id: Mapped[str] = mapped_column(nullable=False)
     objective: Mapped[str] = mapped_column(nullable=False)
     strengths: Mapped[dict] = mapped_column(JSONB, nullable=False)
     responsibilities: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    refreshed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=False), nullable=True)
+    __table_args__ = (UniqueConstraint("external_id", name="uq_job_offers_external_id"),)
 
 
 class ApplicationModel(Base):
@@ -41,6 +48,12 @@ class ApplicationModel(Base):
     candidate_id: Mapped[UUID] = _uuid_col(nullable=False, index=True)
     job_offer_id: Mapped[UUID] = _uuid_col(nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+    # Idempotency key: lower(trim(username)) + Torre job id. Nullable only for legacy duplicates.
+    username_key: Mapped[Optional[str]] = mapped_column(nullable=True)
+    job_external_id: Mapped[Optional[str]] = mapped_column(nullable=True)
+    __table_args__ = (
+        UniqueConstraint("username_key", "job_external_id", name="uq_applications_username_job"),
+    )
 
 
 class CallModel(Base):
@@ -53,6 +66,16 @@ class CallModel(Base):
     transcript: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
 
+class CallPromptModel(Base):
+    """Prepared questions and role context per application, shared by every worker."""
+
+    __tablename__ = "call_prompts"
+    application_id: Mapped[UUID] = _uuid_col(primary_key=True)
+    prepared_questions: Mapped[list] = mapped_column(JSONB, nullable=False)  # list[str]
+    role_context: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+
+
 class AnalysisModel(Base):
     __tablename__ = "analyses"
     id: Mapped[UUID] = _uuid_col(primary_key=True)
@@ -69,10 +92,33 @@ class EntityEmbeddingModel(Base):
     id: Mapped[UUID] = _uuid_col(primary_key=True)
     entity_type: Mapped[str] = mapped_column(nullable=False, index=True)  # "candidate" | "job_offer"
     entity_id: Mapped[UUID] = _uuid_col(nullable=False, index=True)
-    embedding: Mapped[dict] = mapped_column(JSONB, nullable=False)  # list[float] as JSON
+    # Packed little-endian float32 (see persistence.vectors). ``embedding`` holds rows written
+    # before binary storage, or by SCREENING_EMBEDDING_STORAGE=jsonb; new float32 rows leave it
+    # NULL. The optional pgvector column (embedding_vector) is not mapped here because it only
+    # exists where the extension is installed.
+    embedding_f32: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    embedding: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)  # list[float] as JSON
     __table_args__ = (UniqueConstraint("entity_type", "entity_id", name="uq_entity_embeddings_entity"),)
 
 
+# entity_embeddings including the pgvector column, for Core statements that may touch it.
+entity_embeddings = table(
+    "entity_embeddings",
+    *(column(c.name, c.type) for c in EntityEmbeddingModel.__table__.c),
+    column("embedding_vector", PgVector()),
+)
+
+
+class EmbeddingCacheModel(Base):
+    """Embeddings by (model, sha256 of the normalised input text), so identical text is embedded once."""
+
+    __tablename__ = "embedding_cache"
+    model: Mapped[str] = mapped_column(primary_key=True)
+    text_sha256: Mapped[str] = mapped_column(primary_key=True)
+    embedding_f32: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+
+
 class OutboxEventModel(Base):
     """Durable outbox for at-least-once event publishing."""
 
@@ -86,9 +132,197 @@ class OutboxEventModel(Base):
     last_error: Mapped[Optional[str]] = mapped_column(nullable=True)
 
 
-def create_engine_from_url(database_url: str):
-    return create_engine(database_url, pool_pre_ping=True)
+class SchemaUpgradeModel(Base):
+    """One row per schema upgrade applied to this database (see ``_SCHEMA_UPGRADES``)."""
+
+    __tablename__ = "schema_upgrades"
+    name: Mapped[str] = mapped_column(primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+
+
+# DDL and backfills for databases created before a column/index existed. create_all() only
+# creates missing tables, so new columns on existing tables go here. Each named upgrade runs
+# once per database (recorded in schema_upgrades); append new ones, never rename or reorder.
+_SCHEMA_UPGRADES: list[tuple[str, list[str]]] = [
+    (
+        "job_offers_refreshed_at",
+        ["ALTER TABLE job_offers ADD COLUMN IF NOT EXISTS refreshed_at TIMESTAMP WITHOUT TIME ZONE"],
+    ),
+    (
+        "applications_idempotency_key",
+        [
+            "ALTER TABLE applications ADD COLUMN IF NOT EXISTS username_key VARCHAR",
+            "ALTER TABLE applications ADD COLUMN IF NOT EXISTS job_external_id VARCHAR",
+            # Backfill the idempotency key on the oldest application per (username, job); later
+            # legacy duplicates keep NULL keys so the unique index can still be created.
+            """
+            UPDATE applications AS a
+            SET username_key = k.username_key, job_external_id = k.job_external_id
+            FROM (
+                SELECT DISTINCT ON (lower(trim(c.username)), trim(j.external_id))
+                    a2.id, lower(trim(c.username)) AS username_key, trim(j.external_id) AS job_external_id
+                FROM applications AS a2
+                JOIN candidates AS c ON c.id = a2.candidate_id
+                JOIN job_offers AS j ON j.id = a2.job_offer_id
+                WHERE a2.username_key IS NULL
+                ORDER BY lower(trim(c.username)), trim(j.external_id), a2.created_at
+            ) AS k
+            WHERE a.id = k.id
+              AND NOT EXISTS (
+                SELECT 1 FROM applications AS e
+                WHERE e.username_key = k.username_key AND e.job_external_id = k.job_external_id
+              )
+            """,
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_applications_username_job"
+            " ON applications (username_key, job_external_id)",
+        ],
+    ),
+    (
+        "entity_embeddings_float32",
+        [
+            "ALTER TABLE entity_embeddings ADD COLUMN IF NOT EXISTS embedding_f32 BYTEA",
+            "ALTER TABLE entity_embeddings ALTER COLUMN embedding DROP NOT NULL",
+        ],
+    ),
+    (
+        "job_offers_unique_external_id",
+        [
+            # Collapse duplicate job offers per external id onto the most recently refreshed
+            # row (repointing applications, dropping the duplicates' embeddings) so the unique
+            # index can be created.
+            """
+            CREATE TEMPORARY TABLE job_offer_duplicates ON COMMIT DROP AS
+            SELECT id, keep_id FROM (
+                SELECT id, first_value(id) OVER (
+                    PARTITION BY external_id ORDER BY refreshed_at DESC NULLS LAST, id
+                ) AS keep_id
+                FROM job_offers
+            ) AS ranked
+            WHERE id <> keep_id
+            """,
+            """
+            UPDATE applications AS a SET job_offer_id = d.keep_id
+            FROM job_offer_duplicates AS d WHERE a.job_offer_id = d.id
+            """,
+            """
+            DELETE FROM entity_embeddings AS e USING job_offer_duplicates AS d
+            WHERE e.entity_type = 'job_offer' AND e.entity_id = d.id
+            """,
+            "DELETE FROM job_offers AS j USING job_offer_duplicates AS d WHERE j.id = d.id",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_job_offers_external_id ON job_offers (external_id)",
+            "DROP INDEX IF EXISTS ix_job_offers_external_id",
+        ],
+    ),
+]
+
+# Only applied with SCREENING_EMBEDDING_STORAGE=pgvector; needs the vector extension available.
+_PGVECTOR_UPGRADES: list[tuple[str, list[str]]] = [
+    (
+        "pgvector_embedding_vector",
+        [
+            "CREATE EXTENSION IF NOT EXISTS vector",
+            "ALTER TABLE entity_embeddings ADD COLUMN IF NOT EXISTS embedding_vector vector",
+        ],
+    ),
+]
+
+# pg_advisory_xact_lock key held while upgrading, so workers booting together take turns.
+_SCHEMA_UPGRADE_LOCK_KEY = 0x5C8EE11
+
+
+def _pending_schema_upgrades(
+    applied: set[str], embedding_storage: str = "float32"
+) -> list[tuple[str, list[str]]]:
+    upgrades = list(_SCHEMA_UPGRADES)
+    if embedding_storage == "pgvector":
+        upgrades += _PGVECTOR_UPGRADES
+    return [(name, statements) for name, statements in upgrades if name not in applied]
+
+
+def ensure_schema(engine, embedding_storage: str = "float32") -> None:
+    Base.metadata.create_all(engine)
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_UPGRADE_LOCK_KEY})
+        applied = set(conn.execute(text("SELECT name FROM schema_upgrades")).scalars())
+        for name, statements in _pending_schema_upgrades(applied, embedding_storage):
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(
+                text("INSERT INTO schema_upgrades (name, applied_at) VALUES (:name, :applied_at)"),
+                {"name": name, "applied_at": datetime.utcnow()},
+            )
+
+
+def _engine_kwargs(
+    database_url: str,
+    pool_settings: Optional[PoolSettings],
+    metrics: Optional[PoolMetrics],
+    pool_class: type,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"pool_pre_ping": True}
+    if pool_settings is not None:
+        kwargs.update(pool_settings.engine_kwargs())
+        kwargs["connect_args"] = pool_settings.connect_args(database_url)
+    if metrics is not None:
+        kwargs["poolclass"] = timed_pool_class(pool_class, metrics)
+    return kwargs
+
+
+def create_engine_from_url(
+    database_url: str,
+    pool_settings: Optional[PoolSettings] = None,
+    metrics: Optional[PoolMetrics] = None,
+):
+    engine = create_engine(
+        database_url, **_engine_kwargs(database_url, pool_settings, metrics, QueuePool)
+    )
+    if metrics is not None:
+        metrics.bind(engine.pool)
+    if (
+        pool_settings is not None
+        and pool_settings.prepared_statement_cache_size > 0
+        and engine.dialect.driver == "psycopg"
+    ):
+        cache_size = pool_settings.prepared_statement_cache_size
+
+        @event.listens_for(engine, "connect")
+        def _set_prepared_max(dbapi_connection, connection_record):
+            dbapi_connection.prepared_max = cache_size
+
+    return engine
 
 
 def get_session_factory(engine):
     return sessionmaker(engine, class_=Session, expire_on_commit=False)
+
+
+def to_async_database_url(database_url: str) -> str:
+    """Point a postgresql:// (or +psycopg/+psycopg2) URL at the asyncpg driver."""
+    scheme, sep, rest = database_url.partition("://")
+    if scheme.split("+", 1)[0] in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return database_url
+
+
+def create_async_engine_from_url(
+    database_url: str,
+    pool_settings: Optional[PoolSettings] = None,
+    metrics: Optional[PoolMetrics] = None,
+):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_url = to_async_database_url(database_url)
+    engine = create_async_engine(
+        async_url, **_engine_kwargs(async_url, pool_settings, metrics, AsyncAdaptedQueuePool)
+    )
+    if metrics is not None:
+        metrics.bind(engine.pool)
+    return engine
+
+
+def get_async_session_factory(engine):
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
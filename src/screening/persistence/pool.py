@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import Pool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool and per-connection tuning shared by the sync and async engines."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    statement_timeout_ms: int = 0  # 0 keeps the server default
+    prepared_statement_cache_size: int = 100  # 0 disables client-side prepared statements
+
+    def engine_kwargs(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+        }
+
+    def connect_args(self, database_url: str) -> dict[str, Any]:
+        """Driver-specific connect() arguments for the statement timeout and statement cache."""
+        driver = make_url(database_url).get_dialect().driver
+        args: dict[str, Any] = {}
+        if driver == "asyncpg":
+            if self.statement_timeout_ms > 0:
+                args["server_settings"] = {"statement_timeout": str(self.statement_timeout_ms)}
+            # SQLAlchemy's adapter cache and asyncpg's own cache; both must be 0 behind PgBouncer.
+            args["prepared_statement_cache_size"] = self.prepared_statement_cache_size
+            args["statement_cache_size"] = self.prepared_statement_cache_size
+            return args
+        if driver in ("psycopg", "psycopg2") and self.statement_timeout_ms > 0:
+            args["options"] = f"-c statement_timeout={self.statement_timeout_ms}"
+        if driver == "psycopg" and self.prepared_statement_cache_size <= 0:
+            args["prepare_threshold"] = None
+        return args
+
+
+class PoolMetrics:
+    """Checkout-wait statistics for one engine's pool; gauges are read from the pool itself."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._recent_waits: deque[float] = deque(maxlen=window)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._pool: Optional[Pool] = None
+
+    def bind(self, pool: Pool) -> None:
+        self._pool = pool
+
+    def record_checkout(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+                return
+            self._checkouts += 1
+            self._wait_total += wait_seconds
+            self._wait_max = max(self._wait_max, wait_seconds)
+            self._recent_waits.append(wait_seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            stats: dict[str, float] = {
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._timeouts,
+                "checkout_wait_seconds_total": self._wait_total,
+                "checkout_wait_seconds_max": self._wait_max,
+                "checkout_wait_seconds_p50": _percentile(recent, 0.50),
+                "checkout_wait_seconds_p99": _percentile(recent, 0.99),
+            }
+        pool = self._pool
+        if pool is not None and hasattr(pool, "checkedout"):
+            stats.update(
+                {
+                    "size": pool.size(),
+                    "in_use": pool.checkedout(),
+                    "idle": pool.checkedin(),
+                    "overflow": max(0, pool.overflow()),
+                }
+            )
+        return stats
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def timed_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Subclass of ``base`` that records how long each checkout waited (queueing, new
+    connections and pre-ping included). Pool.recreate() reuses the class, so the metrics
+    survive disposal and reconnects.
+    """
+
+    def connect(self):
+        metrics.bind(self)
+        start = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except exc.TimeoutError:
+            metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
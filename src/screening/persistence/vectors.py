@@ -0,0 +1,82 @@
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+from sqlalchemy import Text, cast
+from sqlalchemy.types import UserDefinedType
+
+# How entity embeddings are written. Reads accept every format, so switching modes (or
+# running the JSONB migration) never makes existing rows unreadable.
+EMBEDDING_STORAGE_MODES = ("float32", "pgvector", "jsonb")
+
+# Little-endian float32 so np.frombuffer can view the stored bytes without copying.
+FLOAT32 = np.dtype("<f4")
+
+
+def pack_float32(values: Union[Sequence[float], np.ndarray]) -> bytes:
+    return np.asarray(values, dtype=FLOAT32).tobytes()
+
+
+def unpack_float32(buffer: Union[bytes, memoryview]) -> np.ndarray:
+    """Read-only float32 view over ``buffer``; no per-element conversion."""
+    return np.frombuffer(buffer, dtype=FLOAT32)
+
+
+def vector_from_json(values: Any) -> Optional[np.ndarray]:
+    if not isinstance(values, list) or not values:
+        return None
+    return np.asarray(values, dtype=FLOAT32)
+
+
+def decode_embedding(
+    storage: str,
+    packed: Optional[bytes],
+    json_values: Any,
+    vector: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """Decode whichever stored format is present, preferring the one ``storage`` writes."""
+    # Decoded lazily: ranking calls this once per applicant, and the JSONB fallback is a
+    # per-element conversion that is wasted whenever the packed form is there.
+    for mode in (storage, *EMBEDDING_STORAGE_MODES):
+        if mode == "float32" and packed:
+            return unpack_float32(packed)
+        if mode == "pgvector" and vector is not None and len(vector):
+            return vector
+        if mode == "jsonb":
+            decoded = vector_from_json(json_values)
+            if decoded is not None:
+                return decoded
+    return None
+
+
+class PgVector(UserDefinedType):
+    """
+    pgvector's ``vector`` column, exchanged as its text form so it needs neither the
+    pgvector Python package nor a driver codec (asyncpg has none for ``vector``).
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "vector"
+
+    def bind_expression(self, bindvalue):
+        return cast(cast(bindvalue, Text), self)
+
+    def column_expression(self, col):
+        return cast(col, Text)
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            return "[" + ",".join(repr(float(x)) for x in np.asarray(value, dtype=FLOAT32)) + "]"
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            return np.array(value.strip("[]").split(","), dtype=FLOAT32)
+
+        return process
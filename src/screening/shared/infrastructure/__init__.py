@@ -0,0 +1,17 @@
+from src.screening.shared.infrastructure.event_loop_thread import EventLoopThread
+from src.screening.shared.infrastructure.ivf_index import IvfIndex
+from src.screening.shared.infrastructure.keyed_locks import KeyedLocks
+from src.screening.shared.infrastructure.single_flight import SingleFlight
+from src.screening.shared.infrastructure.stage_tracker import StageTracker
+from src.screening.shared.infrastructure.thread_single_flight import ThreadSingleFlight
+from src.screening.shared.infrastructure.ttl_lru_cache import TtlLruCache
+
+__all__ = [
+    "EventLoopThread",
+    "IvfIndex",
+    "KeyedLocks",
+    "SingleFlight",
+    "StageTracker",
+    "ThreadSingleFlight",
+    "TtlLruCache",
+]
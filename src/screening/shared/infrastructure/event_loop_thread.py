@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """
+    One long-lived asyncio event loop on a daemon thread, for sync code (worker threads,
+    the RabbitMQ consumer) that needs to run coroutines.
+
+    ``submit`` schedules a coroutine on the loop and returns a ``concurrent.futures.Future``.
+    Coroutines from every caller share the loop, so awaiting I/O does not hold a thread per
+    call. The loop starts on first use, running ``on_start`` on it before anything else
+    (e.g. to bind loop-local resources such as an async engine); ``stop`` cancels what is
+    still running, awaits ``on_stop`` on the loop and joins the thread.
+    """
+
+    def __init__(
+        self,
+        name: str = "event_loop",
+        on_start: Optional[Callable[[], Awaitable[None]]] = None,
+        on_stop: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        self._name = name
+        self._on_start = on_start
+        self._on_stop = on_stop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def stop(self, timeout: float = 10.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("%s: shutdown did not finish cleanly: %s", self._name, e)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._on_stop is not None:
+            await self._on_stop()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    if self._on_start is not None:
+                        try:
+                            loop.run_until_complete(self._on_start())
+                        except Exception as e:
+                            logger.warning("%s: start hook failed: %s", self._name, e)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=serve, name=self._name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
@@ -0,0 +1,243 @@
+import fcntl
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+Vector = Union[Sequence[float], np.ndarray]
+
+
+class IvfIndex:
+    """
+    Inverted-file (IVF) approximate nearest-neighbour index over cosine similarity, on NumPy.
+
+    Vectors are L2-normalised on insert, so similarity is a dot product. Below
+    ``train_threshold`` vectors, or before the first training, search is an exact scan.
+    Once trained, vectors are bucketed under ``sqrt(N)`` spherical k-means centroids and a
+    query scans only the ``nprobe`` closest buckets. Inserts are incremental (assigned to
+    the nearest centroid); the centroids are retrained when the index doubles in size.
+
+    ``save``/``load`` persist to a directory of .npy files; ``load`` memory-maps the vectors,
+    so a restart does no training and pages vectors in on demand. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        dimensions: Optional[int] = None,
+        nprobe: int = 8,
+        train_threshold: int = 1024,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+    ) -> None:
+        self._dimensions = dimensions
+        self._nprobe = max(1, nprobe)
+        self._train_threshold = max(1, train_threshold)
+        self._kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._vectors = np.zeros((0, dimensions or 0), dtype=np.float32)
+        self._size = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._buckets: list[list[int]] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        return self._dimensions
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def upsert(self, key: str, vector: Vector) -> bool:
+        """Insert or replace ``key``. Returns False (and skips it) for empty, zero or wrong-size vectors."""
+        unit = self._normalise(vector)
+        if unit is None:
+            return False
+        with self._lock:
+            if self._dimensions is None:
+                self._dimensions = unit.shape[0]
+                self._vectors = np.zeros((0, self._dimensions), dtype=np.float32)
+            if unit.shape[0] != self._dimensions:
+                return False
+            row = self._rows.get(key)
+            if row is not None:
+                if np.array_equal(self._vectors[row], unit):
+                    return True
+                self._writable()
+                self._vectors[row] = unit
+                if self._centroids is not None:
+                    self._buckets[self._assignments[row]].remove(row)
+                    self._assign(row)
+                return True
+            self._reserve(self._size + 1)
+            row = self._size
+            self._vectors[row] = unit
+            self._ids.append(key)
+            self._rows[key] = row
+            self._size += 1
+            if self._centroids is not None:
+                self._assign(row)
+            if self._size >= self._train_threshold and self._size >= 2 * self._trained_size:
+                self.train()
+            return True
+
+    def search(self, query: Vector, k: int) -> list[tuple[str, float]]:
+        """Up to ``k`` (key, cosine similarity) pairs, most similar first."""
+        unit = self._normalise(query)
+        with self._lock:
+            if unit is None or k <= 0 or self._size == 0 or unit.shape[0] != self._dimensions:
+                return []
+            if self._centroids is None:
+                rows = np.arange(self._size)
+            else:
+                closest = np.argsort(-(self._centroids @ unit))[: self._nprobe]
+                rows = np.fromiter(
+                    (row for bucket in closest for row in self._buckets[bucket]), dtype=np.intp
+                )
+                if rows.size == 0:
+                    return []
+            scores = self._vectors[rows] @ unit
+            if k < rows.size:
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+            else:
+                top = np.argsort(-scores, kind="stable")
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def train(self) -> None:
+        """(Re)compute centroids with spherical k-means and rebucket every vector."""
+        with self._lock:
+            if self._size == 0:
+                return
+            self._writable()
+            vectors = self._vectors[: self._size]
+            count = max(1, int(np.sqrt(self._size)))
+            sample_size = min(self._size, max(64 * count, 4096), 65536)
+            sample = vectors[self._rng.choice(self._size, sample_size, replace=False)]
+            centroids = sample[self._rng.choice(sample_size, count, replace=False)].copy()
+            for _ in range(self._kmeans_iterations):
+                labels = self._nearest(sample, centroids)
+                for c in range(count):
+                    members = sample[labels == c]
+                    if len(members) == 0:
+                        centroids[c] = sample[self._rng.integers(sample_size)]
+                        continue
+                    mean = members.sum(axis=0)
+                    norm = np.linalg.norm(mean)
+                    centroids[c] = mean / norm if norm > 0 else centroids[c]
+            self._centroids = centroids.astype(np.float32)
+            self._assignments = np.zeros(max(len(self._vectors), self._size), dtype=np.int32)
+            self._assignments[: self._size] = self._nearest(vectors, self._centroids)
+            self._buckets = [[] for _ in range(count)]
+            for row, bucket in enumerate(self._assignments[: self._size].tolist()):
+                self._buckets[bucket].append(row)
+            self._trained_size = self._size
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """
+        Write a snapshot to a uniquely named sibling directory, then swap it in. Several
+        processes may save the same path: each stages separately, and the swap runs under
+        an exclusive lock on ``<directory>.lock``.
+        """
+        target = Path(directory)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f"{target.name}.tmp-", dir=target.parent))
+        previous = staging.with_name(staging.name + ".old")
+        try:
+            self._write_snapshot(staging)
+            with open(target.with_name(target.name + ".lock"), "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                if target.exists():
+                    os.replace(target, previous)
+                os.replace(staging, target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def _write_snapshot(self, staging: Path) -> None:
+        with self._lock:
+            np.save(staging / "vectors.npy", np.ascontiguousarray(self._vectors[: self._size]))
+            np.save(staging / "ids.npy", np.array(self._ids, dtype=np.str_))
+            if self._centroids is not None:
+                np.save(staging / "centroids.npy", self._centroids)
+                np.save(staging / "assignments.npy", self._assignments[: self._size])
+            (staging / "meta.json").write_text(
+                json.dumps({"dimensions": self._dimensions, "trained_size": self._trained_size})
+            )
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], **kwargs) -> Optional["IvfIndex"]:
+        """Open a snapshot written by ``save``; None if there is none."""
+        source = Path(directory)
+        if not (source / "meta.json").exists():
+            return None
+        meta = json.loads((source / "meta.json").read_text())
+        index = cls(dimensions=meta["dimensions"], **kwargs)
+        vectors = np.load(source / "vectors.npy", mmap_mode="r")
+        index._ids = np.load(source / "ids.npy").tolist()
+        index._rows = {key: row for row, key in enumerate(index._ids)}
+        index._vectors = vectors
+        index._size = len(index._ids)
+        index._trained_size = meta["trained_size"]
+        if (source / "centroids.npy").exists():
+            index._centroids = np.load(source / "centroids.npy")
+            index._assignments = np.array(np.load(source / "assignments.npy"), dtype=np.int32)
+            index._buckets = [[] for _ in range(len(index._centroids))]
+            for row, bucket in enumerate(index._assignments.tolist()):
+                index._buckets[bucket].append(row)
+        return index
+
+    def _normalise(self, vector: Vector) -> Optional[np.ndarray]:
+        if vector is None:
+            return None
+        array = np.asarray(vector, dtype=np.float32)
+        if array.ndim != 1 or array.size == 0:
+            return None
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0:
+            return None
+        return array / norm
+
+    def _nearest(self, vectors: np.ndarray, centroids: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        labels = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk):
+            labels[start : start + chunk] = np.argmax(vectors[start : start + chunk] @ centroids.T, axis=1)
+        return labels
+
+    def _assign(self, row: int) -> None:
+        bucket = int(np.argmax(self._centroids @ self._vectors[row]))
+        self._assignments[row] = bucket
+        self._buckets[bucket].append(row)
+
+    def _writable(self) -> None:
+        # A loaded snapshot is a read-only memmap; copy into RAM before the first write.
+        if not self._vectors.flags.writeable:
+            self._vectors = np.array(self._vectors[: self._size], dtype=np.float32)
+
+    def _reserve(self, size: int) -> None:
+        self._writable()
+        if size <= len(self._vectors):
+            return
+        capacity = max(size, 2 * len(self._vectors), 64)
+        grown = np.zeros((capacity, self._dimensions), dtype=np.float32)
+        grown[: self._size] = self._vectors[: self._size]
+        self._vectors = grown
+        if self._centroids is not None:
+            assignments = np.zeros(capacity, dtype=np.int32)
+            assignments[: self._size] = self._assignments[: self._size]
+            self._assignments = assignments
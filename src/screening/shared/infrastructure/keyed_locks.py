@@ -0,0 +1,44 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class _KeyedLockEntry:
+    __slots__ = ("lock", "refs")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.refs = 0
+
+
+class KeyedLocks(Generic[K]):
+    """
+    Per-key asyncio locks that exist only while someone holds or waits on them.
+
+    Entries are refcounted and dropped when the last holder leaves, so the table is bounded
+    by in-flight keys rather than keys ever seen. Lookups need no global guard: there is no
+    await between reading and updating the table (event-loop local).
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[K, _KeyedLockEntry] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: K) -> AsyncIterator[None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _KeyedLockEntry()
+            self._entries[key] = entry
+        entry.refs += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.refs -= 1
+            if entry.refs == 0:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
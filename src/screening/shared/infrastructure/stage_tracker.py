@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class _Run:
+    __slots__ = ("started_at", "stages", "finished_after")
+
+    def __init__(self, started_at: float, stages: Iterable[str]) -> None:
+        self.started_at = started_at
+        self.stages = {stage: PENDING for stage in stages}
+        self.finished_after: dict[str, float] = {}
+
+
+class StageTracker:
+    """
+    Per-key progress of a multi-stage pipeline (pending / done / failed per stage, and
+    seconds from start to each finish).
+
+    Keeps the ``max_keys`` most recently started keys. Thread-safe: stages finish on
+    worker threads while callers read the status elsewhere.
+    """
+
+    def __init__(self, max_keys: int = 4096, clock: Callable[[], float] = time.monotonic) -> None:
+        self._max_keys = max(1, max_keys)
+        self._clock = clock
+        self._runs: OrderedDict[Hashable, _Run] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, key: Hashable, stages: Iterable[str]) -> None:
+        with self._lock:
+            self._runs[key] = _Run(self._clock(), stages)
+            self._runs.move_to_end(key)
+            while len(self._runs) > self._max_keys:
+                self._runs.popitem(last=False)
+
+    def finish(self, key: Hashable, stage: str, ok: bool = True) -> None:
+        with self._lock:
+            run = self._runs.get(key)
+            if run is None:
+                return
+            run.stages[stage] = DONE if ok else FAILED
+            run.finished_after[stage] = self._clock() - run.started_at
+
+    def status(self, key: Hashable) -> Optional[dict[str, Any]]:
+        """``{"stages": {stage: state}, "seconds": {stage: seconds from start}}``, or None if unknown."""
+        with self._lock:
+            run = self._runs.get(key)
+            if run is None:
+                return None
+            return {"stages": dict(run.stages), "seconds": dict(run.finished_after)}
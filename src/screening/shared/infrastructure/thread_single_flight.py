@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ThreadSingleFlight(Generic[K, V]):
+    """
+    Coalesces calls for the same key across threads onto one ``concurrent.futures.Future``.
+
+    ``share`` returns the in-flight future for ``key``, or adopts the one ``launch`` returns
+    (e.g. a coroutine scheduled on an event loop thread). Every caller gets the same result
+    or exception. Async code awaits the future with ``asyncio.wrap_future`` (shielded, so a
+    timed-out waiter does not cancel the call).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def share(self, key: K, launch: Callable[[], "Future[V]"]) -> "Future[V]":
+        future, leader = self._join(key)
+        if leader:
+            try:
+                inner = launch()
+            except BaseException as e:
+                future.set_exception(e)
+                self._forget(key, future)
+            else:
+                inner.add_done_callback(lambda done: self._adopt(key, future, done))
+        return future
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+    def _join(self, key: K) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self.leaders += 1
+            return future, True
+
+    def _adopt(self, key: K, future: Future, done: Future) -> None:
+        if done.cancelled():
+            future.cancel()
+        elif done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
+        self._forget(key, future)
+
+    def _forget(self, key: K, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
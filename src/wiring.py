@@ -2,13 +2,13 @@
 Composition root: service and repository wiring for the screening bounded context.
 No framework (FastAPI) here; used by apps/backend and by in-process subscribers.
 """
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Optional
 
 from src.config import Settings
 from src.screening.applications.application.services import ApplicationService
 from src.screening.applications.domain.ports import (
     EventPublisher,
-    TorreBiosPort,
     TorreOpportunitiesPort,
 )
 from src.screening.applications.application.ports import ApplicationRepository
@@ -33,6 +33,16 @@ from src.screening.applications.infrastructure.adapters.torre_bios_adapter impor
 from src.screening.applications.infrastructure.adapters.torre_opportunities_adapter import (
     TorreOpportunitiesAdapter,
 )
+from src.screening.applications.infrastructure.adapters.cached_torre_opportunities_adapter import (
+    CachedTorreOpportunitiesAdapter,
+)
+from src.screening.applications.infrastructure.adapters.single_flight_torre_adapters import (
+    SingleFlightTorreBiosAdapter,
+    SingleFlightTorreOpportunitiesAdapter,
+)
+from src.screening.applications.infrastructure.adapters.torre_http_client import (
+    create_torre_http_client,
+)
 
 if TYPE_CHECKING:
     from src.screening.analysis.application.ports import AnalysisRepository
@@ -46,11 +56,20 @@ _application_repository: Optional[Any] = None
 _embedding_repository: Optional[Any] = None
 _outbox_repository: Optional[Any] = None
 _call_repository: Optional[Any] = None
+_call_prompt_repository: Optional[Any] = None
 _analysis_repository: Optional[Any] = None
 _call_service: Optional[Any] = None
 _analysis_service: Optional[Any] = None
+_candidate_ranking_service: Optional[Any] = None
+_job_offer_index: Optional[Any] = None
+_embedding_cache: Optional[Any] = None
+_embedding_batcher: Optional[Any] = None
 _persistence_session_factory: Optional[Any] = None
+_async_sessions: Optional[Any] = None
+_database_pool_metrics: dict[str, Any] = {}
 _audio_transcriber: Optional[Any] = None
+_torre_http_client: Optional[Any] = None
+_torre_adapters: dict[str, Any] = {}
 
 
 def get_settings() -> Settings:
@@ -109,6 +128,14 @@ def _register_subscribers(
     except ImportError:
         pass
 
+    from src.screening.analysis.domain.events import AnalysisCompleted
+
+    def dispatch_analysis(event: DomainEvent) -> None:
+        if isinstance(event, AnalysisCompleted) and _analysis_service is not None:
+            _analysis_service.on_analysis_completed(event)
+
+    publisher.subscribe(dispatch_analysis)
+
 
 def _get_persistence_session_factory():
     global _persistence_session_factory
@@ -116,22 +143,82 @@ def _get_persistence_session_factory():
     if not s.database_url:
         return None
     if _persistence_session_factory is None:
+        from src.screening.persistence import PoolMetrics
         from src.screening.persistence.models import (
-            Base,
             create_engine_from_url,
+            ensure_schema,
             get_session_factory,
         )
-        engine = create_engine_from_url(s.database_url)
-        Base.metadata.create_all(engine)
+        metrics = _database_pool_metrics.setdefault("sync", PoolMetrics())
+        engine = create_engine_from_url(s.database_url, _database_pool_settings(), metrics)
+        ensure_schema(engine, s.embedding_storage)
         _persistence_session_factory = get_session_factory(engine)
     return _persistence_session_factory
 
 
+def _database_pool_settings():
+    from src.screening.persistence import PoolSettings
+
+    s = get_settings()
+    return PoolSettings(
+        pool_size=s.database_pool_size,
+        max_overflow=s.database_max_overflow,
+        pool_timeout=s.database_pool_timeout,
+        pool_recycle=s.database_pool_recycle,
+        statement_timeout_ms=s.database_statement_timeout_ms,
+        prepared_statement_cache_size=s.database_prepared_statement_cache_size,
+    )
+
+
+def get_database_pool_metrics() -> dict[str, dict[str, float]]:
+    """Checkout-wait and in-use gauges per engine ("sync", "async") created so far."""
+    return {name: metrics.snapshot() for name, metrics in _database_pool_metrics.items()}
+
+
+def _get_async_sessions():
+    """AsyncSessionProvider when SCREENING_DATABASE_ASYNC is on; bound to a loop by open_async_database()."""
+    global _async_sessions
+    s = get_settings()
+    if not s.database_url or not s.database_async:
+        return None
+    if _async_sessions is None:
+        from src.screening.persistence import AsyncSessionProvider
+
+        _async_sessions = AsyncSessionProvider(s.database_url, _database_pool_settings())
+    return _async_sessions
+
+
+def open_async_database(pool_name: str = "async") -> None:
+    """
+    Bind an async engine to the running loop (the serving loop, or the call prompt
+    subscriber loop as ``async_subscriber``). No-op unless async mode is enabled.
+    """
+    async_sessions = _get_async_sessions()
+    if async_sessions is not None:
+        from src.screening.persistence import PoolMetrics
+
+        async_sessions.open(_database_pool_metrics.setdefault(pool_name, PoolMetrics()))
+
+
+async def close_async_database() -> None:
+    """Dispose the async engine bound to the running loop."""
+    if _async_sessions is not None:
+        await _async_sessions.close()
+
+
 def get_application_repository() -> ApplicationRepository:
     global _application_repository
     if _application_repository is None:
         session_factory = _get_persistence_session_factory()
-        if session_factory is not None:
+        async_sessions = _get_async_sessions()
+        if async_sessions is not None:
+            from src.screening.applications.infrastructure.adapters.async_postgres_application_repository import (
+                AsyncPostgresApplicationRepository,
+            )
+            _application_repository = AsyncPostgresApplicationRepository(
+                session_factory, async_sessions
+            )
+        elif session_factory is not None:
             from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
                 PostgresApplicationRepository,
             )
@@ -142,24 +229,135 @@ def get_application_repository() -> ApplicationRepository:
 
 
 def get_embedding_repository():
-    global _embedding_repository
+    """
+    The configured embedding repository. With SCREENING_JOB_OFFER_INDEX_ENABLED it is wrapped
+    so job offer saves also update the similarity index.
+    """
+    global _embedding_repository, _job_offer_index
     if _embedding_repository is None:
+        s = get_settings()
         session_factory = _get_persistence_session_factory()
-        if session_factory is not None:
-            from src.screening.applications.application.ports import EmbeddingRepository
+        async_sessions = _get_async_sessions()
+        if async_sessions is not None:
+            from src.screening.applications.infrastructure.adapters.async_postgres_embedding_repository import (
+                AsyncPostgresEmbeddingRepository,
+            )
+            embeddings = AsyncPostgresEmbeddingRepository(
+                session_factory, async_sessions, s.embedding_storage
+            )
+        elif session_factory is not None:
             from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
                 PostgresEmbeddingRepository,
             )
-            _embedding_repository = PostgresEmbeddingRepository(session_factory)
+            embeddings = PostgresEmbeddingRepository(session_factory, s.embedding_storage)
         else:
             from src.screening.applications.infrastructure.adapters.in_memory_embedding_repository import (
                 InMemoryEmbeddingRepository,
             )
-            _embedding_repository = InMemoryEmbeddingRepository()
+            embeddings = InMemoryEmbeddingRepository()
+        if not s.job_offer_index_enabled:
+            _embedding_repository = embeddings
+            return _embedding_repository
+        from src.screening.applications.infrastructure.adapters.indexing_embedding_repository import (
+            IndexingEmbeddingRepository,
+        )
+        from src.screening.applications.infrastructure.adapters.ivf_job_offer_index import (
+            IvfJobOfferIndex,
+        )
+
+        _job_offer_index = IvfJobOfferIndex.open(
+            embeddings, s.job_offer_index_path, s.job_offer_index_nprobe
+        )
+        _embedding_repository = IndexingEmbeddingRepository(embeddings, _job_offer_index)
     return _embedding_repository
 
 
+def get_job_offer_similarity_index():
+    """The job offer similarity index; None unless SCREENING_JOB_OFFER_INDEX_ENABLED is set."""
+    get_embedding_repository()
+    return _job_offer_index
+
+
+def open_job_offer_index() -> None:
+    """
+    Bring the job offer index up to date with the embedding repository in a background
+    thread, then keep re-syncing every SCREENING_JOB_OFFER_INDEX_REFRESH_SECONDS so saves
+    from other workers show up. Searches are served meanwhile, from the loaded snapshot or
+    a partial index.
+    """
+    index = get_job_offer_similarity_index()
+    if index is not None:
+        index.start_sync(get_settings().job_offer_index_refresh_seconds)
+
+
+def close_job_offer_index() -> None:
+    """Stop re-syncing and snapshot the job offer index (when SCREENING_JOB_OFFER_INDEX_PATH is set)."""
+    if _job_offer_index is not None:
+        _job_offer_index.stop_sync()
+        _job_offer_index.save()
+
+
+def get_embedding_cache():
+    """Embedding cache checked before Ollama embed calls; None when SCREENING_EMBEDDING_CACHE_SIZE is 0."""
+    global _embedding_cache
+    s = get_settings()
+    if s.embedding_cache_size <= 0:
+        return None
+    if _embedding_cache is None:
+        from src.screening.applications.infrastructure.adapters.embedding_cache import EmbeddingCache
+
+        repository = None
+        session_factory = _get_persistence_session_factory()
+        if session_factory is not None:
+            from src.screening.applications.infrastructure.adapters.postgres_embedding_cache_repository import (
+                PostgresEmbeddingCacheRepository,
+            )
+            repository = PostgresEmbeddingCacheRepository(session_factory)
+        _embedding_cache = EmbeddingCache(repository, max_size=s.embedding_cache_size)
+    return _embedding_cache
+
+
+def get_embedding_batcher():
+    """Shared batcher for Ollama embed requests; None when SCREENING_EMBEDDING_BATCH_MAX_SIZE is 1."""
+    global _embedding_batcher
+    s = get_settings()
+    if s.embedding_batch_max_size <= 1:
+        return None
+    if _embedding_batcher is None:
+        from src.screening.applications.infrastructure.adapters.embedding_batcher import (
+            EmbeddingBatcher,
+        )
+        from src.screening.applications.infrastructure.subscribers import embeddings
+
+        _embedding_batcher = EmbeddingBatcher(
+            lambda texts: embeddings._embed_batch_with_retry(texts),
+            max_batch_size=s.embedding_batch_max_size,
+            window_seconds=s.embedding_batch_window_ms / 1000.0,
+        )
+    return _embedding_batcher
+
+
+def get_embedding_cache_metrics() -> dict[str, float]:
+    """Hit/miss counters of the embedding cache, once it has been used."""
+    return _embedding_cache.stats() if _embedding_cache is not None else {}
+
+
+def get_torre_adapter_metrics() -> dict[str, dict[str, int]]:
+    """Coalesced-caller counts of the Torre single-flight adapters and the opportunity cache counters."""
+    return {name: adapter.stats() for name, adapter in _torre_adapters.items()}
+
+
+def get_application_readiness(application_id: str) -> Optional[dict[str, Any]]:
+    """JobOfferApplied stage progress for the application, if its run happened in this process."""
+    from src.screening.applications.infrastructure.subscribers.job_offer_applied import (
+        get_application_readiness as readiness,
+    )
+    return readiness(application_id)
+
+
 def get_outbox_repository():
+    # The outbox is written by ReliableEventPublisher, which runs in a worker thread (the
+    # broker publish blocks), so it always uses the sync engine.
     global _outbox_repository
     if _outbox_repository is None:
         session_factory = _get_persistence_session_factory()
@@ -174,43 +372,134 @@ def get_outbox_repository():
     return _outbox_repository
 
 
+def get_torre_http_client():
+    """Shared Torre client while the app lifespan is open; None otherwise (adapters then use one-off clients)."""
+    return _torre_http_client
+
+
+def open_torre_http_client():
+    global _torre_http_client
+    if _torre_http_client is None:
+        s = get_settings()
+        _torre_http_client = create_torre_http_client(
+            timeout=s.torre_timeout,
+            http2=s.torre_http2,
+            max_connections=s.torre_max_connections,
+            max_keepalive_connections=s.torre_max_keepalive_connections,
+            keepalive_expiry=s.torre_keepalive_expiry,
+        )
+    return _torre_http_client
+
+
+async def close_torre_http_client() -> None:
+    global _torre_http_client
+    client = _torre_http_client
+    _torre_http_client = None
+    if client is not None:
+        await client.aclose()
+
+
 def get_app_application_service() -> ApplicationService:
     global _application_service
     if _application_service is None:
         s = get_settings()
-        bios: TorreBiosPort = TorreBiosAdapter(
-            base_url=s.torre_base_url,
-            timeout=s.torre_timeout,
-            retries=s.torre_retries,
+        bios_flight = SingleFlightTorreBiosAdapter(
+            TorreBiosAdapter(
+                base_url=s.torre_base_url,
+                timeout=s.torre_timeout,
+                retries=s.torre_retries,
+                get_client=get_torre_http_client,
+            )
         )
-        opportunities: TorreOpportunitiesPort = TorreOpportunitiesAdapter(
-            base_url=s.torre_base_url,
-            timeout=s.torre_timeout,
-            retries=s.torre_retries,
+        # Single-flight sits under the cache so concurrent misses collapse into one fetch.
+        opportunities_flight = SingleFlightTorreOpportunitiesAdapter(
+            TorreOpportunitiesAdapter(
+                base_url=s.torre_base_url,
+                timeout=s.torre_timeout,
+                retries=s.torre_retries,
+                get_client=get_torre_http_client,
+            )
         )
+        opportunities: TorreOpportunitiesPort = opportunities_flight
+        _torre_adapters["bios_single_flight"] = bios_flight
+        _torre_adapters["opportunities_single_flight"] = opportunities_flight
+        if s.torre_opportunity_cache_size > 0:
+            opportunities = _torre_adapters["opportunity_cache"] = CachedTorreOpportunitiesAdapter(
+                delegate=opportunities,
+                max_size=s.torre_opportunity_cache_size,
+                ttl_seconds=s.torre_opportunity_cache_ttl,
+                negative_ttl_seconds=s.torre_opportunity_cache_negative_ttl,
+            )
         repo = get_application_repository()
         pub = get_event_publisher()
         _application_service = ApplicationService(
-            bios=bios,
+            bios=bios_flight,
             opportunities=opportunities,
             repository=repo,
             event_publisher=pub,
+            job_offer_freshness=timedelta(seconds=s.job_offer_freshness_seconds),
         )
     return _application_service
 
 
-def _get_call_prompt(application_id: str):
+def get_call_prompt_repository():
+    """Prompts per application: the call_prompts table behind an LRU, or a capped in-memory store."""
+    global _call_prompt_repository
+    if _call_prompt_repository is None:
+        s = get_settings()
+        session_factory = _get_persistence_session_factory()
+        async_sessions = _get_async_sessions()
+        if session_factory is not None:
+            from src.screening.calls.infrastructure.adapters.cached_call_prompt_repository import (
+                CachedCallPromptRepository,
+            )
+            if async_sessions is not None:
+                from src.screening.calls.infrastructure.adapters.async_postgres_call_prompt_repository import (
+                    AsyncPostgresCallPromptRepository,
+                )
+                delegate = AsyncPostgresCallPromptRepository(session_factory, async_sessions)
+            else:
+                from src.screening.calls.infrastructure.adapters.postgres_call_prompt_repository import (
+                    PostgresCallPromptRepository,
+                )
+                delegate = PostgresCallPromptRepository(session_factory)
+            _call_prompt_repository = CachedCallPromptRepository(
+                delegate, max_size=s.call_prompt_cache_size, ttl_seconds=s.call_prompt_cache_ttl
+            )
+        else:
+            from src.screening.calls.infrastructure.adapters.in_memory_call_prompt_repository import (
+                InMemoryCallPromptRepository,
+            )
+            _call_prompt_repository = InMemoryCallPromptRepository(max_size=s.call_prompt_cache_size)
+    return _call_prompt_repository
+
+
+def _start_call_prompt(application_id: str):
+    from src.screening.applications.infrastructure.subscribers.call_prompt import (
+        start_call_prompt,
+    )
+    return start_call_prompt(application_id)
+
+
+def close_subscriber_loop() -> None:
+    """Stop the call prompt subscriber loop (no-op if it never started)."""
     from src.screening.applications.infrastructure.subscribers.call_prompt import (
-        get_call_prompt as _get,
+        stop_subscriber_loop,
     )
-    return _get(application_id)
+    stop_subscriber_loop()
 
 
 def get_call_repository():
     global _call_repository
     if _call_repository is None:
         session_factory = _get_persistence_session_factory()
-        if session_factory is not None:
+        async_sessions = _get_async_sessions()
+        if async_sessions is not None:
+            from src.screening.calls.infrastructure.adapters.async_postgres_call_repository import (
+                AsyncPostgresCallRepository,
+            )
+            _call_repository = AsyncPostgresCallRepository(session_factory, async_sessions)
+        elif session_factory is not None:
             from src.screening.calls.infrastructure.adapters.postgres_call_repository import (
                 PostgresCallRepository,
             )
@@ -227,7 +516,13 @@ def get_analysis_repository():
     global _analysis_repository
     if _analysis_repository is None:
         session_factory = _get_persistence_session_factory()
-        if session_factory is not None:
+        async_sessions = _get_async_sessions()
+        if async_sessions is not None:
+            from src.screening.analysis.infrastructure.adapters.async_postgres_analysis_repository import (
+                AsyncPostgresAnalysisRepository,
+            )
+            _analysis_repository = AsyncPostgresAnalysisRepository(session_factory, async_sessions)
+        elif session_factory is not None:
             from src.screening.analysis.infrastructure.adapters.postgres_analysis_repository import (
                 PostgresAnalysisRepository,
             )
@@ -240,14 +535,67 @@ def get_analysis_repository():
     return _analysis_repository
 
 
+def get_candidate_ranking_service():
+    global _candidate_ranking_service
+    if _candidate_ranking_service is None:
+        from src.screening.analysis.application.services import CandidateRankingService
+
+        session_factory = _get_persistence_session_factory()
+        async_sessions = _get_async_sessions()
+        storage = get_settings().embedding_storage
+        if async_sessions is not None:
+            from src.screening.analysis.infrastructure.adapters.async_postgres_candidate_ranking_repository import (
+                AsyncPostgresCandidateRankingRepository,
+            )
+            repository = AsyncPostgresCandidateRankingRepository(
+                session_factory, async_sessions, storage
+            )
+        elif session_factory is not None:
+            from src.screening.analysis.infrastructure.adapters.postgres_candidate_ranking_repository import (
+                PostgresCandidateRankingRepository,
+            )
+            repository = PostgresCandidateRankingRepository(session_factory, storage)
+        else:
+            from src.screening.analysis.infrastructure.adapters.in_memory_candidate_ranking_repository import (
+                InMemoryCandidateRankingRepository,
+            )
+            from src.screening.applications.infrastructure.subscribers.embeddings import (
+                get_candidate_embeddings,
+                get_job_offer_embeddings,
+            )
+
+            embeddings = get_embedding_repository()
+
+            def _candidate_embedding(candidate_id: str):
+                stored = embeddings.get_candidate_embedding(candidate_id)
+                return stored if stored is not None else get_candidate_embeddings(candidate_id)
+
+            def _job_offer_embedding(job_offer_id: str):
+                stored = embeddings.get_job_offer_embedding(job_offer_id)
+                return stored if stored is not None else get_job_offer_embeddings(job_offer_id)
+
+            repository = InMemoryCandidateRankingRepository(
+                get_application_repository(), _candidate_embedding, _job_offer_embedding
+            )
+        _candidate_ranking_service = CandidateRankingService(repository)
+    return _candidate_ranking_service
+
+
+async def _application_exists(application_id) -> bool:
+    return await get_application_repository().get_application(application_id) is not None
+
+
 def get_call_service():
     global _call_service
     if _call_service is None:
         from src.screening.calls.application.services import CallService
         _call_service = CallService(
-            get_call_prompt=_get_call_prompt,
+            get_call_prompt_repository=get_call_prompt_repository,
             get_event_publisher=get_event_publisher,
             get_call_repository=get_call_repository,
+            start_prompt_generation=_start_call_prompt,
+            prompt_wait_seconds=get_settings().call_prompt_wait_seconds,
+            application_exists=_application_exists,
         )
     return _call_service
 
@@ -295,11 +643,14 @@ def get_analysis_service():
                 j = get_job_offer_embeddings(job_offer_id_str)
             return (c, j)
 
+        s = get_settings()
         _analysis_service = AnalysisService(
             get_call_repository=get_call_repository,
             get_application_repository=get_application_repository,
             get_embeddings=_get_embeddings,
             analysis_repository=get_analysis_repository(),
             event_publisher=get_event_publisher(),
+            cache_size=s.analysis_cache_size,
+            cache_ttl_seconds=s.analysis_cache_ttl,
         )
     return _analysis_service
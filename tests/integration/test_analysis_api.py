@@ -0,0 +1,132 @@
+"""
+Integration tests: GET /api/applications/{id}/analysis, including the ?wait= long-poll.
+"""
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from apps.backend.main import app
+from apps.backend.routes.analysis import get_analysis_service
+from src.screening.analysis.application.services import AnalysisService
+from src.screening.analysis.infrastructure.adapters.in_memory_analysis_repository import (
+    InMemoryAnalysisRepository,
+)
+from src.screening.applications.domain.entities import ScreeningApplication
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.shared.domain import ApplicationId, CallId, CandidateId, JobOfferId
+
+
+@pytest.fixture
+async def context():
+    applications = InMemoryApplicationRepository()
+    application = ScreeningApplication(
+        id=ApplicationId(uuid4()),
+        candidate_id=CandidateId(uuid4()),
+        job_offer_id=JobOfferId(uuid4()),
+        created_at=datetime.utcnow(),
+    )
+    await applications.save_application(application)
+    service = AnalysisService(
+        get_call_repository=lambda: None,
+        get_application_repository=lambda: applications,
+        get_embeddings=None,
+        analysis_repository=InMemoryAnalysisRepository(),
+    )
+    app.dependency_overrides[get_analysis_service] = lambda: service
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client, service, application.id
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_pending_analysis_returns_202_without_wait(context):
+    client, _, application_id = context
+    response = await client.get(f"/api/applications/{application_id}/analysis")
+    assert response.status_code == 202
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_as_soon_as_analysis_lands(context):
+    client, service, application_id = context
+
+    async def finish_later():
+        await asyncio.sleep(0.05)
+        await service.run_analysis(application_id, CallId(uuid4()))
+
+    finisher = asyncio.create_task(finish_later())
+    started = asyncio.get_running_loop().time()
+    response = await client.get(f"/api/applications/{application_id}/analysis?wait=5")
+    elapsed = asyncio.get_running_loop().time() - started
+    await finisher
+
+    assert response.status_code == 200
+    assert response.json()["failed"] is False
+    assert elapsed < 2.0
+
+
+@pytest.mark.asyncio
+async def test_long_poll_times_out_with_202(context):
+    client, _, application_id = context
+    response = await client.get(f"/api/applications/{application_id}/analysis?wait=0.05")
+    assert response.status_code == 202
+
+
+@pytest.mark.asyncio
+async def test_wait_above_limit_is_rejected(context):
+    client, _, application_id = context
+    response = await client.get(f"/api/applications/{application_id}/analysis?wait=31")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_finished_analysis_carries_strong_etag_and_revalidates_with_304(context):
+    client, service, application_id = context
+    await service.run_analysis(application_id, CallId(uuid4()))
+    url = f"/api/applications/{application_id}/analysis"
+
+    first = await client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    revalidated = await client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+    stale = await client.get(url, headers={"If-None-Match": '"something-else"'})
+    assert stale.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_when_analysis_is_replaced(context):
+    client, service, application_id = context
+    url = f"/api/applications/{application_id}/analysis"
+    await service.persist_analysis_failed(application_id)
+    failed_etag = (await client.get(url)).headers["etag"]
+
+    await service.run_analysis(application_id, CallId(uuid4()))
+    response = await client.get(url, headers={"If-None-Match": failed_etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != failed_etag
+
+
+@pytest.mark.asyncio
+async def test_revalidation_is_answered_from_cache(context):
+    client, service, application_id = context
+    await service.run_analysis(application_id, CallId(uuid4()))
+    url = f"/api/applications/{application_id}/analysis"
+    etag = (await client.get(url)).headers["etag"]
+
+    async def fail(_application_id):
+        raise AssertionError("analysis repository should not be queried")
+
+    service._repository.get_by_application_async = fail
+    assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 304
@@ -106,3 +106,54 @@ def test_post_applications_missing_body_returns_400(client):
     response = client.post("/api/applications")
     assert response.status_code == 400
     assert response.json()["detail"] == "username and job_offer_id are required"
+
+
+def test_post_applications_batch_returns_result_per_item(client, mock_event_publisher):
+    existing = client.post("/api/applications", json={"username": "u", "job_offer_id": "j1"})
+
+    response = client.post(
+        "/api/applications:batch",
+        json={
+            "items": [
+                {"username": "u", "job_offer_id": "j1"},
+                {"username": "v", "job_offer_id": "j1"},
+                {"job_offer_id": "j1"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    first, second, third = response.json()["results"]
+    assert first == {
+        "status_code": 200,
+        "application_id": existing.json()["application_id"],
+        "created": False,
+        "error": None,
+    }
+    assert second["status_code"] == 201 and second["created"] is True
+    assert third == {
+        "status_code": 400,
+        "application_id": None,
+        "created": False,
+        "error": "username and job_offer_id are required",
+    }
+
+
+def test_post_applications_batch_rejects_empty_list(client):
+    response = client.post("/api/applications:batch", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_get_readiness_reports_stage_progress(client, monkeypatch):
+    from src import wiring
+
+    status = {
+        "stages": {"call_prompt": "done", "candidate_embeddings": "pending"},
+        "seconds": {"call_prompt": 0.2},
+    }
+    monkeypatch.setattr(
+        wiring, "get_application_readiness", lambda application_id: status if application_id == "a1" else None
+    )
+
+    assert client.get("/api/applications/a1/readiness").json() == status
+    assert client.get("/api/applications/a2/readiness").status_code == 404
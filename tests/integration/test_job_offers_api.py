@@ -0,0 +1,79 @@
+"""
+Integration tests: GET /api/job-offers/{external_id}/ranking over in-memory repositories.
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.backend.main import app
+from apps.backend.routes.job_offers import get_candidate_ranking_service
+from src.screening.analysis.application.services import CandidateRankingService
+from src.screening.analysis.infrastructure.adapters.in_memory_candidate_ranking_repository import (
+    InMemoryCandidateRankingRepository,
+)
+from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.in_memory_embedding_repository import (
+    InMemoryEmbeddingRepository,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+@pytest.fixture
+async def client():
+    applications = InMemoryApplicationRepository()
+    embeddings = InMemoryEmbeddingRepository()
+    job_offer = JobOffer(
+        id=JobOfferId(uuid4()), external_id="job-1", objective="o", strengths=[], responsibilities=[]
+    )
+    await applications.save_job_offer(job_offer)
+    embeddings.save_job_offer_embedding(str(job_offer.id), [1.0, 0.0])
+    for index in range(5):
+        candidate = Candidate(
+            id=CandidateId(uuid4()), username=f"user{index}", full_name=f"User {index}", skills=[], jobs=[]
+        )
+        await applications.save_candidate(candidate)
+        await applications.save_application(
+            ScreeningApplication(
+                id=ApplicationId(uuid4()),
+                candidate_id=candidate.id,
+                job_offer_id=job_offer.id,
+                created_at=datetime.utcnow(),
+            )
+        )
+        # user0 points along the job vector, user4 furthest away.
+        embeddings.save_candidate_embedding(str(candidate.id), [1.0 - index * 0.5, index * 0.5])
+    service = CandidateRankingService(
+        InMemoryCandidateRankingRepository(
+            applications, embeddings.get_candidate_embedding, embeddings.get_job_offer_embedding
+        )
+    )
+    app.dependency_overrides[get_candidate_ranking_service] = lambda: service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_ranking_returns_best_fit_first_with_pagination(client):
+    first = client.get("/api/job-offers/job-1/ranking", params={"k": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert [item["username"] for item in body["items"]] == ["user0", "user1"]
+    assert body["items"][0]["fit_score"] == 100
+    assert (body["total"], body["unscored"], body["next_offset"]) == (5, 0, 2)
+
+    last = client.get("/api/job-offers/job-1/ranking", params={"k": 2, "offset": 4}).json()
+    assert [item["username"] for item in last["items"]] == ["user4"]
+    assert last["next_offset"] is None
+
+
+def test_ranking_unknown_job_offer_is_404(client):
+    assert client.get("/api/job-offers/unknown/ranking").status_code == 404
+
+
+def test_ranking_page_size_is_bounded(client):
+    assert client.get("/api/job-offers/job-1/ranking", params={"k": 0}).status_code == 422
+    assert client.get("/api/job-offers/job-1/ranking", params={"k": 501}).status_code == 422
@@ -0,0 +1,173 @@
+"""
+Concurrency test: many threads upserting the same analysis / embedding / job offer key at once.
+The repositories issue INSERT ... ON CONFLICT DO UPDATE, which SQLite also implements, so
+a file-backed SQLite engine stands in for Postgres here.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from src.screening.analysis.domain.entities import ScreeningAnalysis
+from src.screening.analysis.infrastructure.adapters.postgres_analysis_repository import (
+    PostgresAnalysisRepository,
+    _upsert_analysis_stmt,
+)
+from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    PostgresApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+)
+from src.screening.persistence import Base, PoolSettings, create_engine_from_url, get_session_factory
+from src.screening.persistence.models import (
+    AnalysisModel,
+    ApplicationModel,
+    EntityEmbeddingModel,
+    JobOfferModel,
+)
+from src.screening.shared.domain import AnalysisId, ApplicationId, CandidateId, JobOfferId
+
+_THREADS = 16
+_WRITES = 200
+
+
+def _session_factory(tmp_path):
+    engine = create_engine_from_url(
+        f"sqlite:///{tmp_path / 'upsert.db'}", PoolSettings(pool_size=_THREADS, max_overflow=0)
+    )
+    Base.metadata.create_all(engine)
+    return engine, get_session_factory(engine)
+
+
+def _analysis(application_id: ApplicationId, fit_score: int) -> ScreeningAnalysis:
+    return ScreeningAnalysis(
+        id=AnalysisId(uuid4()),
+        application_id=application_id,
+        fit_score=fit_score,
+        skills=[f"skill-{fit_score}"],
+        completed_at=datetime.utcnow(),
+        status="completed",
+    )
+
+
+def test_upsert_statement_is_a_single_on_conflict_insert():
+    sql = str(
+        _upsert_analysis_stmt(_analysis(ApplicationId(uuid4()), 1)).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("INSERT INTO analyses")
+    assert "ON CONFLICT (application_id) DO UPDATE" in sql
+
+
+def test_concurrent_analysis_upserts_leave_one_row(tmp_path):
+    engine, session_factory = _session_factory(tmp_path)
+    repo = PostgresAnalysisRepository(session_factory)
+    application_id = ApplicationId(uuid4())
+    analyses = [_analysis(application_id, i % 101) for i in range(_WRITES)]
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as pool:
+        list(pool.map(repo.upsert_by_application, analyses))
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(AnalysisModel)) == 1
+    stored = repo.get_by_application(application_id)
+    # Whichever write landed last wins as a whole: id, score and skills stay consistent.
+    winner = next(a for a in analyses if a.id == stored.id)
+    assert (stored.fit_score, stored.skills) == (winner.fit_score, winner.skills)
+    engine.dispose()
+
+
+def test_concurrent_embedding_saves_leave_one_row(tmp_path):
+    engine, session_factory = _session_factory(tmp_path)
+    repo = PostgresEmbeddingRepository(session_factory)
+    candidate_id = str(uuid4())
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as pool:
+        list(pool.map(lambda i: repo.save_candidate_embedding(candidate_id, [float(i)] * 4), range(_WRITES)))
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(EntityEmbeddingModel)) == 1
+    embedding = repo.get_candidate_embedding(candidate_id)
+    assert len(embedding) == 4 and len(set(embedding)) == 1
+    engine.dispose()
+
+
+def test_concurrent_first_applications_share_one_job_offer_row(tmp_path):
+    engine, session_factory = _session_factory(tmp_path)
+    repo = PostgresApplicationRepository(session_factory)
+
+    def apply(i: int) -> ApplicationId:
+        # Each worker missed the lookup and minted its own id for the same Torre offer.
+        job_offer = JobOffer(
+            id=JobOfferId(uuid4()),
+            external_id="job123",
+            objective="Build APIs",
+            strengths=["Python"],
+            responsibilities=["Code review"],
+        )
+        candidate = Candidate(
+            id=CandidateId(uuid4()), username=f"user{i}", full_name="", skills=[], jobs=[]
+        )
+        application = ScreeningApplication(
+            id=ApplicationId(uuid4()),
+            candidate_id=candidate.id,
+            job_offer_id=job_offer.id,
+            created_at=datetime.utcnow(),
+        )
+        return repo._save_application_graph_sync(candidate, job_offer, application)
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as pool:
+        list(pool.map(apply, range(_THREADS * 2)))
+
+    with session_factory() as session:
+        job_offer_ids = session.scalars(select(JobOfferModel.id)).all()
+        referenced = set(session.scalars(select(ApplicationModel.job_offer_id)).all())
+    assert len(job_offer_ids) == 1
+    assert referenced == set(job_offer_ids)
+    engine.dispose()
+
+
+def test_concurrent_batches_over_overlapping_offers_share_their_rows(tmp_path):
+    engine, session_factory = _session_factory(tmp_path)
+    repo = PostgresApplicationRepository(session_factory)
+
+    def apply_batch(i: int) -> list[ApplicationId]:
+        # Overlapping offers, listed in opposite orders by alternate batches.
+        external_ids = ["job1", "job2"] if i % 2 else ["job2", "job1"]
+        graphs = []
+        for external_id in external_ids:
+            job_offer = JobOffer(
+                id=JobOfferId(uuid4()),
+                external_id=external_id,
+                objective="Build APIs",
+                strengths=[],
+                responsibilities=[],
+            )
+            candidate = Candidate(
+                id=CandidateId(uuid4()), username=f"user{i}", full_name="", skills=[], jobs=[]
+            )
+            application = ScreeningApplication(
+                id=ApplicationId(uuid4()),
+                candidate_id=candidate.id,
+                job_offer_id=job_offer.id,
+                created_at=datetime.utcnow(),
+            )
+            graphs.append((candidate, job_offer, application))
+        return repo._save_application_graphs_sync(graphs)
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as pool:
+        list(pool.map(apply_batch, range(_THREADS * 2)))
+
+    with session_factory() as session:
+        job_offer_ids = session.scalars(select(JobOfferModel.id)).all()
+        referenced = set(session.scalars(select(ApplicationModel.job_offer_id)).all())
+        applications = session.scalar(select(func.count()).select_from(ApplicationModel))
+    assert len(job_offer_ids) == 2
+    assert referenced == set(job_offer_ids)
+    assert applications == _THREADS * 4
+    engine.dispose()
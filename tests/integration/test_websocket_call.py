@@ -36,9 +36,12 @@ class MockOpportunities:
 
 
 @pytest.fixture
-def client_with_app():
+def client_with_app(monkeypatch):
     from apps.backend.routes.applications import get_application_service
+    from src import wiring
     repo = InMemoryApplicationRepository()
+    # The call checks the application exists in the repository the service writes to.
+    monkeypatch.setattr(wiring, "get_application_repository", lambda: repo)
     pub = InMemoryEventPublisher()
     svc = ApplicationService(
         bios=MockBios(),
@@ -81,6 +84,15 @@ def test_websocket_invalid_application_id_rejected(client_with_app):
             ws.receive_json()
 
 
+def test_websocket_unknown_application_rejected(client_with_app):
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client_with_app.websocket_connect(
+            "/api/ws/call?application_id=00000000-0000-0000-0000-000000000404"
+        ) as ws:
+            ws.receive_json()
+    assert exc.value.code == 4404
+
+
 def test_websocket_duplicate_connection_rejected(client_with_app):
     r = client_with_app.post("/api/applications", json={"username": "dup", "job_offer_id": "j1"})
     assert r.status_code == 201
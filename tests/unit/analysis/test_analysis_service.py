@@ -13,7 +13,12 @@ from src.screening.analysis.application.services.analysis_service import (
 )
 from src.screening.calls.domain.entities import TranscriptSegment
 from src.screening.shared.domain import ApplicationId, CallId, CandidateId, JobOfferId
-from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.domain.entities import (
+    ApplicationGraph,
+    Candidate,
+    JobOffer,
+    ScreeningApplication,
+)
 
 
 @pytest.fixture
@@ -53,7 +58,7 @@ def mock_call_repository(canned_transcript):
     repo = MagicMock()
     call = MagicMock()
     call.transcript = canned_transcript
-    repo.get_call = MagicMock(return_value=call)
+    repo.get_call_async = AsyncMock(return_value=call)
     return repo
 
 
@@ -67,14 +72,21 @@ def mock_application_repository(candidate_with_skills, job_offer_with_strengths)
         created_at=datetime.utcnow(),
     )
     repo.get_application = AsyncMock(return_value=app)
-    repo.get_candidate = MagicMock(return_value=candidate_with_skills)
-    repo.get_job_offer = MagicMock(return_value=job_offer_with_strengths)
+    repo.get_application_graph = AsyncMock(
+        return_value=ApplicationGraph(
+            application=app,
+            candidate=candidate_with_skills,
+            job_offer=job_offer_with_strengths,
+        )
+    )
     return repo
 
 
 @pytest.fixture
 def mock_analysis_repository():
     repo = MagicMock()
+    repo.get_by_application_async = AsyncMock(return_value=None)
+    repo.upsert_by_application_async = AsyncMock()
     return repo
 
 
@@ -96,8 +108,8 @@ async def test_run_analysis_persists_fit_score_and_skills(
     app_id = ApplicationId(uuid4())
     call_id = CallId(uuid4())
     await analysis_service.run_analysis(app_id, call_id)
-    mock_analysis_repository.upsert_by_application.assert_called_once()
-    analysis = mock_analysis_repository.upsert_by_application.call_args[0][0]
+    mock_analysis_repository.upsert_by_application_async.assert_awaited_once()
+    analysis = mock_analysis_repository.upsert_by_application_async.call_args[0][0]
     assert analysis.application_id == app_id
     assert 0 <= analysis.fit_score <= 100
     assert isinstance(analysis.skills, list)
@@ -145,3 +157,163 @@ def test_compute_fit_score_fallback_to_candidate_skills_when_no_job_match(
     )
     assert score >= 40
     assert len(skills) <= 5
+
+
+@pytest.mark.asyncio
+async def test_run_analysis_loads_candidate_and_job_offer_with_one_graph_query(
+    analysis_service, mock_application_repository
+):
+    await analysis_service.run_analysis(ApplicationId(uuid4()), CallId(uuid4()))
+
+    mock_application_repository.get_application_graph.assert_awaited_once()
+    mock_application_repository.get_application.assert_not_awaited()
+    mock_application_repository.get_candidate.assert_not_called()
+    mock_application_repository.get_job_offer.assert_not_called()
+
+
+def _analysis(application_id, status="completed"):
+    from src.screening.analysis.domain.entities import ScreeningAnalysis
+    from src.screening.shared.domain import AnalysisId
+
+    return ScreeningAnalysis(
+        id=AnalysisId(uuid4()),
+        application_id=application_id,
+        fit_score=70,
+        skills=["Python"],
+        completed_at=datetime.utcnow(),
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["completed", "failed"])
+async def test_polls_for_finished_analysis_do_not_reach_repositories(
+    analysis_service, mock_application_repository, mock_analysis_repository, status
+):
+    app_id = ApplicationId(uuid4())
+    mock_analysis_repository.get_by_application_async.return_value = _analysis(app_id, status)
+
+    for _ in range(5):
+        result = await analysis_service.get_analysis_for_application(app_id)
+        assert result.found_application
+        assert result.analysis.status == status
+
+    mock_application_repository.get_application.assert_awaited_once()
+    mock_analysis_repository.get_by_application_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pending_polls_cost_one_analysis_lookup_each(
+    analysis_service, mock_application_repository, mock_analysis_repository
+):
+    app_id = ApplicationId(uuid4())
+
+    for _ in range(3):
+        result = await analysis_service.get_analysis_for_application(app_id)
+        assert result.found_application and result.analysis is None
+
+    mock_application_repository.get_application.assert_awaited_once()
+    assert mock_analysis_repository.get_by_application_async.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_application_is_not_cached(
+    analysis_service, mock_application_repository
+):
+    mock_application_repository.get_application.return_value = None
+    app_id = ApplicationId(uuid4())
+
+    assert not (await analysis_service.get_analysis_for_application(app_id)).found_application
+    assert not (await analysis_service.get_analysis_for_application(app_id)).found_application
+    assert mock_application_repository.get_application.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_analysis_result_is_served_from_cache(
+    analysis_service, mock_application_repository, mock_analysis_repository
+):
+    app_id = ApplicationId(uuid4())
+    await analysis_service.run_analysis(app_id, CallId(uuid4()))
+
+    result = await analysis_service.get_analysis_for_application(app_id)
+
+    assert result.analysis is mock_analysis_repository.upsert_by_application_async.call_args[0][0]
+    mock_application_repository.get_application.assert_not_awaited()
+    mock_analysis_repository.get_by_application_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_analysis_completed_event_invalidates_superseded_entry(
+    analysis_service, mock_analysis_repository
+):
+    from src.screening.analysis.domain.events import AnalysisCompleted
+
+    app_id = ApplicationId(uuid4())
+    failed = _analysis(app_id, "failed")
+    mock_analysis_repository.get_by_application_async.return_value = failed
+    await analysis_service.get_analysis_for_application(app_id)
+
+    # The event for the cached analysis itself keeps the entry.
+    analysis_service.on_analysis_completed(
+        AnalysisCompleted(application_id=app_id, analysis_id=failed.id, occurred_at=datetime.utcnow())
+    )
+    await analysis_service.get_analysis_for_application(app_id)
+    mock_analysis_repository.get_by_application_async.assert_awaited_once()
+
+    completed = _analysis(app_id, "completed")
+    mock_analysis_repository.get_by_application_async.return_value = completed
+    analysis_service.on_analysis_completed(
+        AnalysisCompleted(application_id=app_id, analysis_id=completed.id, occurred_at=datetime.utcnow())
+    )
+
+    result = await analysis_service.get_analysis_for_application(app_id)
+    assert result.analysis is completed
+    assert mock_analysis_repository.get_by_application_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_analysis_returns_when_run_analysis_lands(
+    analysis_service, mock_analysis_repository
+):
+    import asyncio
+
+    app_id = ApplicationId(uuid4())
+    waiter = asyncio.create_task(analysis_service.wait_for_analysis(app_id, 5.0))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await analysis_service.run_analysis(app_id, CallId(uuid4()))
+    result = await asyncio.wait_for(waiter, 1.0)
+
+    assert result.analysis is mock_analysis_repository.upsert_by_application_async.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_analysis_is_woken_by_event_from_another_thread(
+    analysis_service, mock_analysis_repository
+):
+    import asyncio
+    import threading
+    from src.screening.analysis.domain.events import AnalysisCompleted
+
+    app_id = ApplicationId(uuid4())
+    completed = _analysis(app_id)
+    waiter = asyncio.create_task(analysis_service.wait_for_analysis(app_id, 5.0))
+    await asyncio.sleep(0.01)
+
+    mock_analysis_repository.get_by_application_async.return_value = completed
+    event = AnalysisCompleted(application_id=app_id, analysis_id=completed.id, occurred_at=datetime.utcnow())
+    threading.Thread(target=analysis_service.on_analysis_completed, args=(event,)).start()
+
+    result = await asyncio.wait_for(waiter, 1.0)
+    assert result.analysis is completed
+    assert analysis_service._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_analysis_times_out_with_pending_result(analysis_service):
+    result = await analysis_service.wait_for_analysis(ApplicationId(uuid4()), 0.05)
+
+    assert result.found_application
+    assert result.analysis is None
+    assert analysis_service._waiters == {}
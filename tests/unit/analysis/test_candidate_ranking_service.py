@@ -0,0 +1,129 @@
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+
+from src.screening.analysis.application.ports import Applicant, JobOfferApplicants
+from src.screening.analysis.application.services import CandidateRankingService
+from src.screening.analysis.infrastructure.adapters.postgres_candidate_ranking_repository import (
+    PostgresCandidateRankingRepository,
+)
+from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    PostgresApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+)
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+def _applicant(name: str) -> Applicant:
+    return Applicant(
+        application_id=ApplicationId(uuid4()),
+        candidate_id=CandidateId(uuid4()),
+        username=name,
+        full_name=name.title(),
+    )
+
+
+class _StaticRepository:
+    def __init__(self, loaded):
+        self.loaded = loaded
+
+    async def load_job_offer_applicants(self, job_offer_external_id):
+        return self.loaded
+
+
+def _service(job_vector, rows):
+    loaded = JobOfferApplicants.from_rows(JobOfferId(uuid4()), job_vector, rows)
+    return CandidateRankingService(_StaticRepository(loaded))
+
+
+@pytest.mark.asyncio
+async def test_rank_orders_by_fit_and_paginates():
+    job = np.array([1.0, 0.0], dtype=np.float32)
+    rows = [
+        (_applicant("far"), np.array([-1.0, 0.0], dtype=np.float32)),
+        (_applicant("best"), np.array([1.0, 0.0], dtype=np.float32)),
+        (_applicant("mid"), np.array([0.0, 1.0], dtype=np.float32)),
+        (_applicant("no-embedding"), None),
+        (_applicant("other-model"), np.ones(3, dtype=np.float32)),
+    ]
+    service = _service(job, rows)
+
+    first = await service.rank("job", k=2)
+    second = await service.rank("job", k=2, offset=2)
+
+    assert [item.applicant.username for item in first.items] == ["best", "mid"]
+    assert [item.fit_score for item in first.items] == [100, 50]
+    assert [item.applicant.username for item in second.items] == ["far"]
+    assert (first.total, first.unscored) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_rank_without_job_offer_embedding_returns_no_items():
+    service = _service(None, [(_applicant("a"), np.ones(2, dtype=np.float32))])
+    ranking = await service.rank("job", k=10)
+    assert ranking.items == [] and ranking.unscored == 1
+
+
+@pytest.mark.asyncio
+async def test_rank_unknown_job_offer_returns_none():
+    assert await CandidateRankingService(_StaticRepository(None)).rank("missing", k=10) is None
+
+
+@pytest.mark.asyncio
+async def test_rank_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2_000, 768)).astype(np.float32)
+    rows = [(_applicant(f"u{i}"), vector) for i, vector in enumerate(vectors)]
+    job = rng.standard_normal(768).astype(np.float32)
+    service = _service(job, rows)
+    loaded = service._repository.loaded
+
+    ranking = await service.rank("job", k=50)
+
+    expected = np.argsort(-(loaded.candidate_vectors @ job / np.linalg.norm(loaded.candidate_vectors, axis=1)))[:50]
+    assert [item.applicant for item in ranking.items] == [loaded.applicants[i] for i in expected]
+
+
+@pytest.mark.asyncio
+async def test_postgres_repository_loads_applicants_in_one_query(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'ranking.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = get_session_factory(engine)
+    applications = PostgresApplicationRepository(session_factory)
+    embeddings = PostgresEmbeddingRepository(session_factory)
+    job_offer = JobOffer(
+        id=JobOfferId(uuid4()), external_id="job-1", objective="o", strengths=[], responsibilities=[]
+    )
+    await applications.save_job_offer(job_offer)
+    embeddings.save_job_offer_embedding(str(job_offer.id), [1.0, 0.0])
+    for name, vector in [("ana", [1.0, 0.0]), ("bo", [0.0, 1.0]), ("cy", None)]:
+        candidate = Candidate(id=CandidateId(uuid4()), username=name, full_name=name, skills=[], jobs=[])
+        await applications.save_candidate(candidate)
+        await applications.save_application(
+            ScreeningApplication(
+                id=ApplicationId(uuid4()),
+                candidate_id=candidate.id,
+                job_offer_id=job_offer.id,
+                created_at=datetime.utcnow(),
+            )
+        )
+        if vector is not None:
+            embeddings.save_candidate_embedding(str(candidate.id), vector)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    loaded = await PostgresCandidateRankingRepository(session_factory).load_job_offer_applicants("job-1")
+
+    assert len(statements) == 2  # job offer embedding + all applicant embeddings
+    assert sorted(a.username for a in loaded.applicants) == ["ana", "bo"]
+    assert loaded.unscored == 1
+    assert loaded.candidate_vectors.shape == (2, 2)
+    assert await PostgresCandidateRankingRepository(session_factory).load_job_offer_applicants("nope") is None
+    engine.dispose()
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.screening.analysis.domain.similarity import (
+    cosine_similarities,
+    cosine_similarity,
+    fit_scores,
+    score_candidates,
+)
+
+
+def _python_cosine(a, b):
+    # The pure-Python implementation this module replaced, kept as the reference.
+    dot = sum(x * y for x, y in zip(a, b))
+    na = sum(x * x for x in a) ** 0.5
+    nb = sum(y * y for y in b) ** 0.5
+    if na == 0 or nb == 0:
+        return 0.0
+    return dot / (na * nb)
+
+
+def test_cosine_similarity_matches_reference_on_lists_and_arrays():
+    rng = np.random.default_rng(0)
+    a, b = rng.standard_normal((2, 768))
+    expected = _python_cosine(a.tolist(), b.tolist())
+
+    assert cosine_similarity(a.tolist(), b.tolist()) == pytest.approx(expected, abs=1e-5)
+    assert cosine_similarity(a.astype(np.float32), b.astype(np.float32)) == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [([], []), ([1.0, 2.0], [1.0]), ([0.0, 0.0], [1.0, 2.0])],
+)
+def test_cosine_similarity_degenerate_inputs_score_zero(a, b):
+    assert cosine_similarity(a, b) == 0.0
+
+
+def test_batch_scores_match_one_by_one_and_zero_rows_score_zero():
+    rng = np.random.default_rng(1)
+    job = rng.standard_normal(64).astype(np.float32)
+    candidates = rng.standard_normal((50, 64)).astype(np.float32)
+    candidates[7] = 0.0
+
+    batch = cosine_similarities(job, candidates)
+
+    assert batch.shape == (50,)
+    assert batch[7] == 0.0
+    np.testing.assert_allclose(batch, [cosine_similarity(job, c) for c in candidates], atol=1e-5)
+    assert cosine_similarities(job, np.zeros((0, 64))).shape == (0,)
+    assert not cosine_similarities(job, candidates[:, :10]).any()
+
+
+def test_fit_scores_map_cosine_to_0_100():
+    assert fit_scores(np.array([-1.0, 0.0, 0.5, 1.0])).tolist() == [0, 50, 75, 100]
+    assert int(fit_scores(0.999)) == 100
+    job = np.ones(8)
+    assert score_candidates(job, [np.ones(8), -np.ones(8)]).tolist() == [100, 0]
+
+
+def test_vectorized_scoring_matches_pure_python_at_embedding_size():
+    rng = np.random.default_rng(2)
+    job = rng.standard_normal(768).astype(np.float32)
+    candidates = rng.standard_normal((50, 768)).astype(np.float32)
+    job_list = job.tolist()
+
+    reference = [_python_cosine(c, job_list) for c in candidates.tolist()]
+
+    np.testing.assert_allclose(cosine_similarities(job, candidates), reference, atol=1e-4)
+    np.testing.assert_allclose([cosine_similarity(c, job) for c in candidates], reference, atol=1e-4)
@@ -14,6 +14,7 @@ from src.screening.applications.domain.value_objects import (
     CandidateFromTorre,
     JobOfferFromTorre,
 )
+from src.screening.applications.domain.entities import JobOffer
 from src.screening.applications.domain.events import JobOfferApplied
 from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
     InMemoryApplicationRepository,
@@ -53,11 +54,12 @@ def mock_opportunities():
 def mock_repository():
     repo = AsyncMock()
     repo.find_application_by_username_and_job_offer = AsyncMock(return_value=None)
+    repo.find_job_offer_by_external_id = AsyncMock(return_value=None)
     repo.save_candidate = AsyncMock(return_value=CandidateId("00000000-0000-0000-0000-000000000001"))
     repo.save_job_offer = AsyncMock(return_value=JobOfferId("00000000-0000-0000-0000-000000000002"))
     repo.save_application = AsyncMock(return_value=ApplicationId("00000000-0000-0000-0000-000000000003"))
     repo.save_application_graph = AsyncMock(
-        return_value=ApplicationId("00000000-0000-0000-0000-000000000003")
+        side_effect=lambda candidate, job_offer, application: application.id
     )
     return repo
 
@@ -187,3 +189,285 @@ async def test_create_application_best_effort_idempotent_within_process():
     assert str(first.application_id) == str(second.application_id)
     assert {first.created, second.created} == {True, False}
     event_publisher.publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_application_fetches_bio_and_opportunity_concurrently():
+    class SlowBios:
+        async def get_bio(self, username: str):
+            await asyncio.sleep(0.1)
+            return CandidateFromTorre(username=username, full_name="John Doe", skills=[], jobs=[])
+
+    class SlowOpportunities:
+        async def get_opportunity(self, job_offer_id: str):
+            await asyncio.sleep(0.1)
+            return JobOfferFromTorre(
+                external_id=job_offer_id, objective="X", strengths=[], responsibilities=[]
+            )
+
+    service = ApplicationService(
+        bios=SlowBios(),
+        opportunities=SlowOpportunities(),
+        repository=InMemoryApplicationRepository(),
+        event_publisher=MagicMock(),
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await service.create_application("johndoe", "job123")
+    elapsed = loop.time() - started
+
+    assert result.created is True
+    assert elapsed < 0.18
+
+
+@pytest.mark.asyncio
+async def test_create_application_cancels_opportunity_when_bio_not_found():
+    cancelled = asyncio.Event()
+
+    class MissingBios:
+        async def get_bio(self, username: str):
+            return None
+
+    class HangingOpportunities:
+        async def get_opportunity(self, job_offer_id: str):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    service = ApplicationService(
+        bios=MissingBios(),
+        opportunities=HangingOpportunities(),
+        repository=InMemoryApplicationRepository(),
+        event_publisher=MagicMock(),
+    )
+
+    with pytest.raises(TorreNotFoundError, match="Candidate not found"):
+        await asyncio.wait_for(service.create_application("ghost", "job123"), timeout=1.0)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_create_application_propagates_upstream_error_and_cancels_sibling():
+    import httpx
+
+    cancelled = asyncio.Event()
+
+    class HangingBios:
+        async def get_bio(self, username: str):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    class FailingOpportunities:
+        async def get_opportunity(self, job_offer_id: str):
+            raise httpx.ConnectError("torre down")
+
+    service = ApplicationService(
+        bios=HangingBios(),
+        opportunities=FailingOpportunities(),
+        repository=InMemoryApplicationRepository(),
+        event_publisher=MagicMock(),
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        await asyncio.wait_for(service.create_application("johndoe", "job123"), timeout=1.0)
+    assert cancelled.is_set()
+
+
+class CountingOpportunities:
+    def __init__(self, objective: str = "Build APIs") -> None:
+        self.calls = 0
+        self.objective = objective
+
+    async def get_opportunity(self, job_offer_id: str):
+        self.calls += 1
+        return JobOfferFromTorre(
+            external_id=job_offer_id,
+            objective=self.objective,
+            strengths=["Python"],
+            responsibilities=["Code review"],
+        )
+
+
+def _service_with(opportunities, repo, publisher, **kwargs):
+    bios = AsyncMock()
+    bios.get_bio = AsyncMock(
+        side_effect=lambda username: CandidateFromTorre(
+            username=username, full_name=username.title(), skills=[], jobs=[]
+        )
+    )
+    return ApplicationService(
+        bios=bios,
+        opportunities=opportunities,
+        repository=repo,
+        event_publisher=publisher,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_applicants_to_same_job_reuse_one_job_offer_row():
+    from datetime import timedelta
+
+    repo = InMemoryApplicationRepository()
+    publisher = MagicMock()
+    opportunities = CountingOpportunities()
+    service = _service_with(opportunities, repo, publisher, job_offer_freshness=timedelta(hours=1))
+
+    await service.create_application("alice", "job123")
+    await service.create_application("bob", "job123")
+    await asyncio.gather(*(service.create_application(f"user{i}", "job123") for i in range(5)))
+
+    events = [c.args[0] for c in publisher.publish.call_args_list]
+    assert opportunities.calls == 1
+    assert len({str(e.job_offer_id) for e in events}) == 1
+    assert [e.job_offer_changed for e in events] == [True] + [False] * 6
+    assert len(repo._job_offers) == 1  # intentional white-box check: one row per external_id
+
+
+@pytest.mark.asyncio
+async def test_in_memory_job_offers_are_keyed_by_the_stripped_external_id():
+    repo = InMemoryApplicationRepository()
+    job_offer = JobOffer(
+        id=JobOfferId("00000000-0000-0000-0000-0000000000ab"),
+        external_id=" job123 ",
+        objective="Build APIs",
+        strengths=[],
+        responsibilities=[],
+    )
+
+    await repo.save_job_offer(job_offer)
+
+    assert (await repo.find_job_offer_by_external_id("job123")).id == job_offer.id
+
+
+@pytest.mark.asyncio
+async def test_job_offer_stored_first_by_another_worker_is_referenced():
+    repo = InMemoryApplicationRepository()
+    stored_id = JobOfferId("00000000-0000-0000-0000-0000000000aa")
+    repo.save_job_offer = AsyncMock(return_value=stored_id)
+    publisher = MagicMock()
+    service = _service_with(CountingOpportunities(), repo, publisher)
+
+    await service.create_application("alice", "job123")
+
+    event = publisher.publish.call_args.args[0]
+    assert event.job_offer_id == stored_id
+    assert repo._applications[str(event.application_id)].job_offer_id == stored_id
+
+
+@pytest.mark.asyncio
+async def test_stale_job_offer_is_refreshed_in_place():
+    from datetime import timedelta
+
+    repo = InMemoryApplicationRepository()
+    publisher = MagicMock()
+    opportunities = CountingOpportunities()
+    service = _service_with(opportunities, repo, publisher, job_offer_freshness=timedelta(0))
+
+    await service.create_application("alice", "job123")
+    await service.create_application("bob", "job123")
+    opportunities.objective = "Build and run APIs"
+    await service.create_application("carol", "job123")
+
+    events = [c.args[0] for c in publisher.publish.call_args_list]
+    assert opportunities.calls == 3
+    assert len({str(e.job_offer_id) for e in events}) == 1
+    assert [e.job_offer_changed for e in events] == [True, False, True]
+    stored = await repo.find_job_offer_by_external_id("job123")
+    assert stored.objective == "Build and run APIs"
+
+
+@pytest.mark.asyncio
+async def test_create_application_returns_existing_id_when_repository_reports_conflict(
+    application_service, mock_repository, mock_event_publisher
+):
+    winner_id = ApplicationId("00000000-0000-0000-0000-000000000077")
+    mock_repository.save_application_graph = AsyncMock(return_value=winner_id)
+
+    result = await application_service.create_application("johndoe", "job123")
+
+    assert result.application_id == winner_id
+    assert result.created is False
+    mock_event_publisher.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_application_idempotent_across_workers_sharing_a_store():
+    repo = InMemoryApplicationRepository()
+    publisher = MagicMock()
+    # Two services model two worker processes: no shared in-process lock, one shared store.
+    worker_a = _service_with(CountingOpportunities(), repo, publisher)
+    worker_b = _service_with(CountingOpportunities(), repo, publisher)
+
+    first, second = await asyncio.gather(
+        worker_a.create_application("JohnDoe ", "job123"),
+        worker_b.create_application("johndoe", "job123"),
+    )
+
+    assert first.application_id == second.application_id
+    assert {first.created, second.created} == {True, False}
+    publisher.publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_applications_batch_dedupes_torre_lookups_and_publishes_once():
+    repo = InMemoryApplicationRepository()
+    publisher = MagicMock()
+    opportunities = CountingOpportunities()
+    service = _service_with(opportunities, repo, publisher)
+    items = [(user, job) for user in ("ann", "bob", "cy") for job in ("job1", "job2")]
+    items += [("ANN ", "job1"), ("", "job1")]
+
+    results = await service.create_applications(items)
+
+    assert service._bios.get_bio.await_count == 3
+    assert opportunities.calls == 2
+    assert all(r.created and r.error is None for r in results[:6])
+    assert len({r.application_id for r in results[:6]}) == 6
+    assert results[6] is results[0]  # same normalized pair, same outcome
+    assert isinstance(results[7].error, ValueError)
+    publisher.publish_many.assert_called_once()
+    events = publisher.publish_many.call_args.args[0]
+    assert [e.application_id for e in events] == [r.application_id for r in results[:6]]
+    # job1 events: only the first asks subscribers to re-embed the freshly fetched offer.
+    assert [e.job_offer_changed for e in events[0::2]] == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_create_applications_batch_reports_errors_per_item():
+    repo = InMemoryApplicationRepository()
+    publisher = MagicMock()
+    existing = await _service_with(CountingOpportunities(), repo, MagicMock()).create_application(
+        "ann", "job1"
+    )
+
+    class FlakyOpportunities(CountingOpportunities):
+        async def get_opportunity(self, job_offer_id: str):
+            if job_offer_id == "broken":
+                raise RuntimeError("upstream exploded")
+            if job_offer_id == "gone":
+                return None
+            return await super().get_opportunity(job_offer_id)
+
+    service = _service_with(FlakyOpportunities(), repo, publisher)
+    service._bios.get_bio.side_effect = lambda username: None if username == "ghost" else CandidateFromTorre(
+        username=username, full_name=username.title(), skills=[], jobs=[]
+    )
+
+    ann, ghost, gone, broken, bob = await service.create_applications(
+        [("ann", "job1"), ("ghost", "job1"), ("bob", "gone"), ("bob", "broken"), ("bob", "job1")]
+    )
+
+    assert (ann.application_id, ann.created, ann.error) == (existing.application_id, False, None)
+    assert isinstance(ghost.error, TorreNotFoundError) and str(ghost.error) == "Candidate not found"
+    assert isinstance(gone.error, TorreNotFoundError) and str(gone.error) == "Job offer not found"
+    assert isinstance(broken.error, RuntimeError)
+    assert bob.created and bob.error is None
+    events = publisher.publish_many.call_args.args[0]
+    assert [e.application_id for e in events] == [bob.application_id]
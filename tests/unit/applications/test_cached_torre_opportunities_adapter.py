@@ -0,0 +1,70 @@
+import httpx
+import pytest
+
+from src.screening.applications.domain.ports import TorreOpportunitiesPort
+from src.screening.applications.domain.value_objects import JobOfferFromTorre
+from src.screening.applications.infrastructure.adapters.cached_torre_opportunities_adapter import (
+    CachedTorreOpportunitiesAdapter,
+)
+from src.screening.shared.infrastructure import TtlLruCache
+
+
+class CountingOpportunities(TorreOpportunitiesPort):
+    def __init__(self, missing=(), failing=()) -> None:
+        self.calls = 0
+        self._missing = set(missing)
+        self._failing = set(failing)
+
+    async def get_opportunity(self, job_offer_id: str):
+        self.calls += 1
+        if job_offer_id in self._failing:
+            raise httpx.ConnectError("torre down")
+        if job_offer_id in self._missing:
+            return None
+        return JobOfferFromTorre(
+            external_id=job_offer_id, objective="Build APIs", strengths=[], responsibilities=[]
+        )
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookups_for_hot_job_hit_cache():
+    upstream = CountingOpportunities()
+    cached = CachedTorreOpportunitiesAdapter(delegate=upstream)
+
+    for _ in range(50):
+        opportunity = await cached.get_opportunity("hot-job")
+        assert opportunity.external_id == "hot-job"
+
+    assert upstream.calls == 1
+    assert cached.stats()["hits"] == 49
+    assert cached.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_negatively_cached_with_its_own_ttl():
+    now = [0.0]
+    upstream = CountingOpportunities(missing={"gone"})
+    cached = CachedTorreOpportunitiesAdapter(
+        delegate=upstream,
+        negative_ttl_seconds=5.0,
+        cache=TtlLruCache(max_size=8, ttl_seconds=300.0, clock=lambda: now[0]),
+    )
+
+    assert await cached.get_opportunity("gone") is None
+    assert await cached.get_opportunity("gone") is None
+    assert upstream.calls == 1
+
+    now[0] = 6.0
+    assert await cached.get_opportunity("gone") is None
+    assert upstream.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_are_not_cached():
+    upstream = CountingOpportunities(failing={"flaky"})
+    cached = CachedTorreOpportunitiesAdapter(delegate=upstream)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await cached.get_opportunity("flaky")
+    assert upstream.calls == 2
@@ -0,0 +1,115 @@
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src import wiring
+from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.applications.infrastructure.subscribers import call_prompt
+from src.screening.calls.infrastructure.adapters.in_memory_call_prompt_repository import (
+    InMemoryCallPromptRepository,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+@pytest.fixture
+def stored_application(monkeypatch):
+    repo = InMemoryApplicationRepository()
+    prompts = InMemoryCallPromptRepository()
+    candidate = Candidate(
+        id=CandidateId(uuid4()), username="ann", full_name="Ann", skills=["Python", "SQL"], jobs=[]
+    )
+    job_offer = JobOffer(
+        id=JobOfferId(uuid4()),
+        external_id="job123",
+        objective="Build APIs",
+        strengths=["Python"],
+        responsibilities=["Code review"],
+    )
+    application = ScreeningApplication(
+        id=ApplicationId(uuid4()),
+        candidate_id=candidate.id,
+        job_offer_id=job_offer.id,
+        created_at=datetime.utcnow(),
+    )
+    repo._candidates[str(candidate.id)] = candidate
+    repo._job_offers[str(job_offer.id)] = job_offer
+    repo._applications[str(application.id)] = application
+    monkeypatch.setattr(wiring, "get_application_repository", lambda: repo)
+    monkeypatch.setattr(wiring, "get_call_prompt_repository", lambda: prompts)
+    event = JobOfferApplied(
+        candidate_id=candidate.id,
+        job_offer_id=job_offer.id,
+        application_id=application.id,
+        occurred_at=datetime.utcnow(),
+    )
+    return repo, event
+
+
+def test_call_prompt_is_built_from_a_single_graph_load(stored_application, monkeypatch):
+    repo, event = stored_application
+    graph_loader = AsyncMock(wraps=repo.get_application_graph)
+    monkeypatch.setattr(repo, "get_application_graph", graph_loader)
+    monkeypatch.setattr(repo, "get_candidate", lambda _: pytest.fail("extra candidate load"))
+    monkeypatch.setattr(repo, "get_job_offer", lambda _: pytest.fail("extra job offer load"))
+
+    call_prompt.generate_call_prompt(event).result(timeout=5)
+
+    graph_loader.assert_awaited_once_with(event.application_id)
+    prompt = call_prompt.get_call_prompt(str(event.application_id))
+    assert prompt.role_context.startswith("Objective: Build APIs")
+    assert "How have you applied Python, SQL in your work?" in prompt.prepared_questions
+
+
+def test_call_start_and_subscriber_share_one_generation(stored_application, monkeypatch):
+    repo, event = stored_application
+    release = threading.Event()
+    original = repo.get_application_graph
+
+    async def slow_graph(application_id):
+        release.wait(5)
+        return await original(application_id)
+
+    graph_loader = AsyncMock(side_effect=slow_graph)
+    monkeypatch.setattr(repo, "get_application_graph", graph_loader)
+
+    future = call_prompt.start_call_prompt(str(event.application_id))
+    shared = call_prompt.generate_call_prompt(event)
+    release.set()
+
+    assert shared is future
+    assert future.result(timeout=5).role_context.startswith("Objective: Build APIs")
+    assert graph_loader.await_count == 1
+
+
+def test_generations_reuse_the_subscriber_loop(stored_application, monkeypatch):
+    repo, event = stored_application
+    call_prompt.generate_call_prompt(event).result(timeout=5)
+    monkeypatch.setattr(
+        call_prompt.asyncio, "new_event_loop", lambda: pytest.fail("per-event loop created")
+    )
+    first = repo._applications[str(event.application_id)]
+    second = ScreeningApplication(
+        id=ApplicationId(uuid4()),
+        candidate_id=first.candidate_id,
+        job_offer_id=first.job_offer_id,
+        created_at=datetime.utcnow(),
+    )
+    repo._applications[str(second.id)] = second
+
+    prompt = call_prompt.start_call_prompt(str(second.id)).result(timeout=5)
+
+    assert prompt.role_context.startswith("Objective: Build APIs")
+
+
+def test_on_demand_generation_for_an_unknown_application_stores_nothing(stored_application):
+    application_id = str(uuid4())
+
+    assert call_prompt.start_call_prompt(application_id).result(timeout=1) is None
+    assert call_prompt.get_call_prompt(application_id) is None
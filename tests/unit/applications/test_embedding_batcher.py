@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.screening.applications.infrastructure.adapters.embedding_batcher import EmbeddingBatcher
+from src.screening.applications.infrastructure.subscribers import embeddings
+
+
+class RecordingEmbedder:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.requests.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def _embed_concurrently(batcher, texts):
+    with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+        return list(pool.map(batcher.embed, texts))
+
+
+def test_concurrent_callers_share_one_request_and_get_their_own_result():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=8, window_seconds=0.2)
+    texts = ["a", "bb", "ccc", "dddd"]
+
+    results = _embed_concurrently(batcher, texts)
+
+    assert results == [[1.0], [2.0], [3.0], [4.0]]
+    assert len(embedder.requests) == 1
+    assert sorted(embedder.requests[0]) == texts
+
+
+def test_full_batches_are_sent_without_waiting_for_the_window():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=2, window_seconds=30.0)
+
+    results = _embed_concurrently(batcher, ["a", "bb", "ccc", "dddd"])
+
+    assert results == [[1.0], [2.0], [3.0], [4.0]]
+    assert sorted(len(r) for r in embedder.requests) == [2, 2]
+
+
+def test_duplicate_texts_are_sent_once():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=8, window_seconds=0.2)
+
+    results = _embed_concurrently(batcher, ["same", "same", "same"])
+
+    assert results == [[4.0]] * 3
+    assert embedder.requests == [["same"]]
+
+
+def test_a_failed_batch_returns_none_to_every_caller():
+    def broken(texts):
+        raise RuntimeError("connection refused")
+
+    batcher = EmbeddingBatcher(broken, max_batch_size=8, window_seconds=0.1)
+
+    assert _embed_concurrently(batcher, ["a", "b"]) == [None, None]
+    assert batcher.embed("c") is None
+    assert batcher.stats()["batches"] == 2
+
+
+def test_batch_retry_resends_only_missing_inputs(monkeypatch):
+    requests = []
+
+    def flaky(texts):
+        requests.append(list(texts))
+        if len(requests) == 1:
+            return [[1.0], None, [3.0]]
+        return [[2.0] for _ in texts]
+
+    monkeypatch.setattr(embeddings, "_embed_batch_attempt", flaky)
+    monkeypatch.setattr(embeddings, "_EMBED_BACKOFF_BASE", 0.0)
+
+    assert embeddings._embed_batch_with_retry(["a", "b", "c"]) == [[1.0], [2.0], [3.0]]
+    assert requests == [["a", "b", "c"], ["b"]]
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from src import wiring
+from src.screening.applications.infrastructure.adapters.embedding_cache import (
+    EmbeddingCache,
+    text_sha256,
+)
+from src.screening.applications.infrastructure.adapters.postgres_embedding_cache_repository import (
+    PostgresEmbeddingCacheRepository,
+)
+from src.screening.applications.infrastructure.subscribers import embeddings
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine)
+    yield get_session_factory(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    """Counts embed calls that reach Ollama; the cache in front of it is fresh per test."""
+    calls = []
+
+    def fake_attempt(texts):
+        calls.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    cache = EmbeddingCache(max_size=16)
+    monkeypatch.setattr(embeddings, "_embed_batch_attempt", fake_attempt)
+    monkeypatch.setattr(wiring, "get_embedding_cache", lambda: cache)
+    return calls, cache
+
+
+def test_repeated_text_is_embedded_once(ollama):
+    calls, cache = ollama
+
+    first = embeddings._embed_with_retry("Jane Doe  Python\nDjango")
+    second = embeddings._embed_with_retry("  Jane Doe Python Django ")
+
+    assert first == second
+    assert calls == ["Jane Doe Python Django"]
+    assert cache.stats()["embed_calls_avoided"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_cache_is_keyed_by_model(ollama, monkeypatch):
+    calls, _ = ollama
+    embeddings._embed_with_retry("same text")
+    monkeypatch.setattr(wiring.get_settings(), "ollama_embed_model", "other-model")
+
+    embeddings._embed_with_retry("same text")
+
+    assert len(calls) == 2
+
+
+def test_failed_embeddings_are_not_cached(ollama, monkeypatch):
+    calls, cache = ollama
+    monkeypatch.setattr(embeddings, "_EMBED_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(embeddings, "_embed_batch_attempt", lambda texts: [None] * len(texts))
+
+    assert embeddings._embed_with_retry("flaky") is None
+    assert cache.get("nomic-embed-text", "flaky") is None
+
+
+def test_database_tier_survives_a_new_process(session_factory):
+    EmbeddingCache(PostgresEmbeddingCacheRepository(session_factory)).put("m", "bio", [0.5, 0.25])
+    restarted = EmbeddingCache(PostgresEmbeddingCacheRepository(session_factory))
+
+    assert restarted.get("m", "bio") == [0.5, 0.25]
+    assert restarted.get("m", "bio") == [0.5, 0.25]
+    assert restarted.stats()["store_hits"] == 1
+    assert restarted.stats()["memory_hits"] == 1
+    assert restarted.get("other-model", "bio") is None
+
+
+def test_database_tier_keeps_the_first_write(session_factory):
+    repo = PostgresEmbeddingCacheRepository(session_factory)
+    repo.put("m", "abc", [1.0])
+    repo.put("m", "abc", [2.0])
+
+    assert repo.get("m", "abc").tolist() == [1.0]
+
+
+def test_database_tier_errors_are_misses():
+    class BrokenRepository(PostgresEmbeddingCacheRepository):
+        def get(self, model, text_sha256):
+            raise RuntimeError("connection refused")
+
+        def put(self, model, text_sha256, embedding):
+            raise RuntimeError("connection refused")
+
+    cache = EmbeddingCache(BrokenRepository(session_factory=None))
+    cache.put("m", "bio", [1.0])
+
+    assert cache.get("m", "bio") == [1.0]
+    assert cache.get("m", "other") is None
+
+
+def test_memory_tier_holds_float32_arrays_and_returns_lists(session_factory):
+    EmbeddingCache(PostgresEmbeddingCacheRepository(session_factory)).put("m", "bio", [0.5, 0.25])
+    cache = EmbeddingCache(PostgresEmbeddingCacheRepository(session_factory))
+    cache.put("m", "fresh", [1.0, 2.0])
+
+    assert cache.get("m", "bio") == [0.5, 0.25]
+    assert cache.get("m", "fresh") == [1.0, 2.0]
+    assert cache.get("m", "missing") is None
+    assert (cache.stats()["memory_hits"], cache.stats()["store_hits"], cache.stats()["misses"]) == (1, 1, 1)
+    for text in ("bio", "fresh"):
+        stored = cache._memory.get(("m", text_sha256(text)))
+        assert isinstance(stored, np.ndarray) and stored.dtype == np.float32
@@ -0,0 +1,71 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src import wiring
+from src.screening.applications.domain.entities import JobOffer
+from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.in_memory_embedding_repository import (
+    InMemoryEmbeddingRepository,
+)
+from src.screening.applications.infrastructure.subscribers import embeddings
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+@pytest.fixture
+def job_offer_setup(monkeypatch):
+    app_repo = InMemoryApplicationRepository()
+    embedding_repo = InMemoryEmbeddingRepository()
+    job_offer = JobOffer(
+        id=JobOfferId(uuid4()),
+        external_id="job123",
+        objective="Build APIs",
+        strengths=["Python"],
+        responsibilities=["Code review"],
+    )
+    app_repo._job_offers[str(job_offer.id)] = job_offer
+    embed_calls = []
+
+    def fake_embed(text):
+        embed_calls.append(text)
+        return [0.1, 0.2, 0.3]
+
+    monkeypatch.setattr(wiring, "get_application_repository", lambda: app_repo)
+    monkeypatch.setattr(wiring, "get_embedding_repository", lambda: embedding_repo)
+    monkeypatch.setattr(embeddings, "_embed_with_retry", fake_embed)
+    monkeypatch.setattr(embeddings, "_embeddings_store", {})
+    return job_offer, embedding_repo, embed_calls
+
+
+def _event(job_offer_id: JobOfferId, changed: bool) -> JobOfferApplied:
+    return JobOfferApplied(
+        candidate_id=CandidateId(uuid4()),
+        job_offer_id=job_offer_id,
+        application_id=ApplicationId(uuid4()),
+        occurred_at=datetime.utcnow(),
+        job_offer_changed=changed,
+    )
+
+
+def test_unchanged_job_offer_with_stored_embedding_is_not_re_embedded(job_offer_setup):
+    job_offer, embedding_repo, embed_calls = job_offer_setup
+
+    embeddings.generate_job_offer_embeddings(_event(job_offer.id, changed=True))
+    embeddings.generate_job_offer_embeddings(_event(job_offer.id, changed=False))
+    embeddings.generate_job_offer_embeddings(_event(job_offer.id, changed=False))
+
+    assert len(embed_calls) == 1
+    assert embedding_repo.get_job_offer_embedding(str(job_offer.id)) == [0.1, 0.2, 0.3]
+
+
+def test_changed_job_offer_is_re_embedded(job_offer_setup):
+    job_offer, _, embed_calls = job_offer_setup
+
+    embeddings.generate_job_offer_embeddings(_event(job_offer.id, changed=True))
+    embeddings.generate_job_offer_embeddings(_event(job_offer.id, changed=True))
+
+    assert len(embed_calls) == 2
@@ -0,0 +1,96 @@
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.screening.applications.application.ports import SimilarJobOffer
+from src.screening.applications.infrastructure.adapters.in_memory_embedding_repository import (
+    InMemoryEmbeddingRepository,
+)
+from src.screening.applications.infrastructure.adapters.indexing_embedding_repository import (
+    IndexingEmbeddingRepository,
+)
+from src.screening.applications.infrastructure.adapters.ivf_job_offer_index import (
+    IvfJobOfferIndex,
+)
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+)
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
+
+
+@pytest.fixture
+def embeddings():
+    store = InMemoryEmbeddingRepository()
+    store.save_candidate_embedding("candidate", [1.0, 0.0, 0.0])
+    return store
+
+
+async def test_saved_job_offers_are_searchable_by_candidate(embeddings):
+    index = IvfJobOfferIndex(embeddings)
+    repo = IndexingEmbeddingRepository(embeddings, index)
+    repo.save_job_offer_embedding("backend", [0.9, 0.1, 0.0])
+    await repo.save_job_offer_embedding_async("design", [0.0, 1.0, 0.0])
+    repo.save_job_offer_embedding("data", [0.7, 0.0, 0.7])
+
+    results = await index.find_similar_job_offers("candidate", k=2)
+
+    assert [r.job_offer_id for r in results] == ["backend", "data"]
+    assert isinstance(results[0], SimilarJobOffer) and results[0].similarity > 0.99
+    assert repo.get_job_offer_embedding("design") == [0.0, 1.0, 0.0]
+
+
+async def test_unknown_candidate_finds_nothing(embeddings):
+    index = IvfJobOfferIndex(embeddings)
+    index.add_job_offer("backend", [1.0, 0.0, 0.0])
+
+    assert await index.find_similar_job_offers("nobody", k=5) == []
+
+
+async def test_snapshot_is_reopened_and_caught_up_with_the_repository(embeddings, tmp_path):
+    path = str(tmp_path / "job-offer-index")
+    embeddings.save_job_offer_embedding("backend", [1.0, 0.0, 0.0])
+    first = IvfJobOfferIndex.open(embeddings, path)
+    assert first.sync_from_repository() == 1
+    first.save()
+    embeddings.save_job_offer_embedding("data", [0.8, 0.2, 0.0])
+
+    reopened = IvfJobOfferIndex.open(embeddings, path)
+    assert len(reopened) == 1
+    reopened.start_sync().join(timeout=5)
+
+    results = await reopened.find_similar_job_offers("candidate", k=5)
+    assert [r.job_offer_id for r in results] == ["backend", "data"]
+
+
+def test_postgres_repository_streams_job_offer_embeddings(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'embeddings.db'}")
+    Base.metadata.create_all(engine)
+    repo = PostgresEmbeddingRepository(get_session_factory(engine))
+    job_offer_ids = {str(uuid4()) for _ in range(3)}
+    for job_offer_id in job_offer_ids:
+        repo.save_job_offer_embedding(job_offer_id, [0.5, 0.25])
+    repo.save_candidate_embedding(str(uuid4()), [1.0, 1.0])
+
+    listed = dict(repo.list_job_offer_embeddings())
+
+    assert set(listed) == job_offer_ids
+    assert all(isinstance(v, np.ndarray) and v.tolist() == [0.5, 0.25] for v in listed.values())
+    engine.dispose()
+
+
+async def test_periodic_sync_picks_up_embeddings_saved_elsewhere(embeddings):
+    index = IvfJobOfferIndex(embeddings)
+    thread = index.start_sync(refresh_seconds=0.01)
+    embeddings.save_job_offer_embedding("backend", [1.0, 0.0, 0.0])
+
+    for _ in range(200):
+        if len(index):
+            break
+        await asyncio.sleep(0.01)
+    index.stop_sync()
+    thread.join(timeout=5)
+
+    assert [r.job_offer_id for r in await index.find_similar_job_offers("candidate", k=1)] == ["backend"]
+    assert not thread.is_alive()
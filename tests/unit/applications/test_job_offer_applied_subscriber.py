@@ -0,0 +1,128 @@
+import threading
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src import wiring
+from src.screening.applications.domain.entities import Candidate, JobOffer, ScreeningApplication
+from src.screening.applications.domain.events import JobOfferApplied
+from src.screening.applications.infrastructure.adapters.in_memory_application_repository import (
+    InMemoryApplicationRepository,
+)
+from src.screening.applications.infrastructure.adapters.in_memory_embedding_repository import (
+    InMemoryEmbeddingRepository,
+)
+from src.screening.applications.infrastructure.subscribers import (
+    call_prompt,
+    embeddings,
+    job_offer_applied,
+)
+from src.screening.calls.infrastructure.adapters.in_memory_call_prompt_repository import (
+    InMemoryCallPromptRepository,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+from src.screening.shared.infrastructure.stage_tracker import DONE, PENDING
+
+
+@pytest.fixture
+def embed_gate():
+    """Embeddings block until the test sets this, standing in for a slow embedding model."""
+    gate = threading.Event()
+    yield gate
+    gate.set()
+
+
+@pytest.fixture
+def event(monkeypatch, embed_gate):
+    repo = InMemoryApplicationRepository()
+    prompts = InMemoryCallPromptRepository()
+    candidate = Candidate(
+        id=CandidateId(uuid4()), username="ann", full_name="Ann", skills=["Python"], jobs=[]
+    )
+    job_offer = JobOffer(
+        id=JobOfferId(uuid4()),
+        external_id="job123",
+        objective="Build APIs",
+        strengths=["Python"],
+        responsibilities=["Code review"],
+    )
+    application = ScreeningApplication(
+        id=ApplicationId(uuid4()),
+        candidate_id=candidate.id,
+        job_offer_id=job_offer.id,
+        created_at=datetime.utcnow(),
+    )
+    repo._candidates[str(candidate.id)] = candidate
+    repo._job_offers[str(job_offer.id)] = job_offer
+    repo._applications[str(application.id)] = application
+
+    def slow_embed(text):
+        embed_gate.wait(5.0)
+        return [0.1, 0.2]
+
+    monkeypatch.setattr(wiring, "get_application_repository", lambda: repo)
+    monkeypatch.setattr(wiring, "get_embedding_repository", InMemoryEmbeddingRepository)
+    monkeypatch.setattr(embeddings, "_embed_with_retry", slow_embed)
+    monkeypatch.setattr(embeddings, "_embeddings_store", {})
+    monkeypatch.setattr(wiring, "get_call_prompt_repository", lambda: prompts)
+    return JobOfferApplied(
+        candidate_id=candidate.id,
+        job_offer_id=job_offer.id,
+        application_id=application.id,
+        occurred_at=datetime.utcnow(),
+        job_offer_changed=True,
+    )
+
+
+def _wait_for_stage(application_id, stage, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = job_offer_applied.get_application_readiness(application_id)
+        if status is not None and status["stages"][stage] != PENDING:
+            return status
+        time.sleep(0.001)
+    raise AssertionError(f"{stage} still pending after {timeout}s")
+
+
+def test_prompt_is_ready_before_slow_embeddings_finish(event, embed_gate):
+    application_id = str(event.application_id)
+    worker = threading.Thread(target=job_offer_applied.on_job_offer_applied, args=(event,))
+    worker.start()
+
+    status = _wait_for_stage(application_id, job_offer_applied.CALL_PROMPT)
+    # Sequentially the prompt waited for both embeddings; now it is done while they block.
+    assert status["stages"] == {
+        job_offer_applied.CANDIDATE_EMBEDDINGS: PENDING,
+        job_offer_applied.JOB_OFFER_EMBEDDINGS: PENDING,
+        job_offer_applied.CALL_PROMPT: DONE,
+    }
+    assert call_prompt.get_call_prompt(application_id).role_context.startswith("Objective: Build APIs")
+
+    embed_gate.set()
+    worker.join(timeout=5.0)
+
+    status = job_offer_applied.get_application_readiness(application_id)
+    assert set(status["stages"].values()) == {DONE}
+    assert status["seconds"][job_offer_applied.CALL_PROMPT] < min(
+        status["seconds"][job_offer_applied.CANDIDATE_EMBEDDINGS],
+        status["seconds"][job_offer_applied.JOB_OFFER_EMBEDDINGS],
+    )
+
+
+def test_a_failing_stage_does_not_stop_the_others(event, embed_gate, monkeypatch):
+    embed_gate.set()
+
+    def broken(event):
+        raise RuntimeError("embedding model unavailable")
+
+    monkeypatch.setattr(embeddings, "generate_candidate_embeddings", broken)
+
+    job_offer_applied.on_job_offer_applied(event)
+
+    status = job_offer_applied.get_application_readiness(str(event.application_id))
+    assert status["stages"][job_offer_applied.CANDIDATE_EMBEDDINGS] == "failed"
+    assert status["stages"][job_offer_applied.JOB_OFFER_EMBEDDINGS] == "done"
+    assert status["stages"][job_offer_applied.CALL_PROMPT] == "done"
+    assert call_prompt.get_call_prompt(str(event.application_id)) is not None
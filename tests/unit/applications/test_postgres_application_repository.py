@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from src.screening.applications.domain.entities import JobOffer, ScreeningApplication
+from src.screening.applications.infrastructure.adapters.postgres_application_repository import (
+    _application_graph_stmt,
+    _application_row,
+    _insert_application_stmt,
+    _insert_applications_stmt,
+    _insert_job_offers_stmt,
+    _upsert_job_offers_stmt,
+)
+from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _application(n: int) -> ScreeningApplication:
+    return ScreeningApplication(
+        id=ApplicationId(f"00000000-0000-0000-0000-00000000000{n}"),
+        candidate_id=CandidateId("00000000-0000-0000-0000-000000000001"),
+        job_offer_id=JobOfferId("00000000-0000-0000-0000-000000000002"),
+        created_at=datetime.utcnow(),
+    )
+
+
+def test_application_insert_is_a_single_upsert_returning_the_owning_id():
+    sql = _compile(_insert_application_stmt(_application(3), "johndoe", "job123"))
+
+    assert sql.startswith("INSERT INTO applications")
+    assert "ON CONFLICT (username_key, job_external_id) DO UPDATE" in sql
+    assert sql.rstrip().endswith(
+        "RETURNING applications.id, applications.username_key, applications.job_external_id"
+    )
+
+
+def test_batch_application_insert_is_one_multi_row_upsert():
+    rows = [
+        _application_row(_application(n), f"user{n}", "job123") for n in range(3, 6)
+    ]
+
+    sql = _compile(_insert_applications_stmt(rows))
+
+    assert sql.count("INSERT INTO applications") == 1
+    assert sql.count("), (") == 2  # three VALUES tuples
+    assert "ON CONFLICT (username_key, job_external_id) DO UPDATE" in sql
+
+
+def test_application_graph_is_one_select_with_outer_joins():
+    sql = _compile(_application_graph_stmt(ApplicationId("00000000-0000-0000-0000-000000000003")))
+
+    assert sql.count("SELECT") == 1
+    assert "LEFT OUTER JOIN candidates ON candidates.id = applications.candidate_id" in sql
+    assert "LEFT OUTER JOIN job_offers ON job_offers.id = applications.job_offer_id" in sql
+
+
+def test_job_offer_upsert_conflicts_on_the_external_id():
+    job_offer = JobOffer(
+        id=JobOfferId("00000000-0000-0000-0000-000000000002"),
+        external_id="job123",
+        objective="Build APIs",
+        strengths=[],
+        responsibilities=[],
+    )
+
+    sql = _compile(_upsert_job_offers_stmt([job_offer, job_offer]))
+
+    assert "), (" not in sql  # duplicates of one external id are sent once
+    assert "ON CONFLICT (external_id) DO UPDATE SET objective = excluded.objective" in sql
+    assert sql.rstrip().endswith("RETURNING job_offers.id, job_offers.external_id")
+
+
+def test_graph_saves_insert_job_offers_without_touching_stored_rows():
+    job_offer = JobOffer(
+        id=JobOfferId("00000000-0000-0000-0000-000000000002"),
+        external_id="job123",
+        objective="Build APIs",
+        strengths=[],
+        responsibilities=[],
+    )
+    padded = JobOffer(
+        id=JobOfferId("00000000-0000-0000-0000-000000000004"),
+        external_id=" job123 ",
+        objective="Build APIs",
+        strengths=[],
+        responsibilities=[],
+    )
+
+    stmt = _insert_job_offers_stmt([job_offer, padded])
+    sql = _compile(stmt)
+
+    assert sql.rstrip().endswith("ON CONFLICT (external_id) DO NOTHING")
+    assert "), (" not in sql  # padded duplicates of one external id are sent once
+    assert stmt.compile().params["external_id_m0"] == "job123"
+
+
+def test_batch_job_offer_insert_is_ordered_by_external_id():
+    job_offers = [
+        JobOffer(
+            id=JobOfferId(f"00000000-0000-0000-0000-00000000000{n}"),
+            external_id=external_id,
+            objective="",
+            strengths=[],
+            responsibilities=[],
+        )
+        for n, external_id in enumerate(["job3", "job1", "job2"], start=5)
+    ]
+
+    params = _insert_job_offers_stmt(job_offers).compile().params
+
+    assert [params[f"external_id_m{i}"] for i in range(3)] == ["job1", "job2", "job3"]
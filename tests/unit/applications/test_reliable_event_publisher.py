@@ -1,14 +1,19 @@
 from datetime import datetime
 
 import pytest
+from sqlalchemy import event
 
 from src.screening.applications.domain.events import JobOfferApplied
 from src.screening.applications.infrastructure.adapters.in_memory_outbox_repository import (
     InMemoryOutboxRepository,
 )
+from src.screening.applications.infrastructure.adapters.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
 from src.screening.applications.infrastructure.adapters.reliable_event_publisher import (
     ReliableEventPublisher,
 )
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
 from src.screening.shared.domain import ApplicationId, CandidateId, JobOfferId
 
 
@@ -78,3 +83,89 @@ def test_reliable_publisher_replays_pending_after_temporary_failure():
     assert outbox.list_pending() == []
     assert len(delegate.events) == 1
     assert delegate.events[0] == event
+
+
+def test_reliable_publisher_publish_many_uses_one_outbox_write():
+    class DelegatePublisher:
+        def __init__(self) -> None:
+            self.batches = []
+
+        def subscribe(self, handler):
+            pass
+
+        def publish_many(self, events):
+            self.batches.append(list(events))
+
+    class CountingOutbox(InMemoryOutboxRepository):
+        def __init__(self) -> None:
+            super().__init__()
+            self.single_writes = 0
+            self.batch_writes = 0
+
+        def save_pending(self, event_type, payload):
+            self.single_writes += 1
+            return super().save_pending(event_type, payload)
+
+        def save_pending_many(self, items):
+            self.batch_writes += 1
+            save = super().save_pending
+            return [save(event_type, payload) for event_type, payload in items]
+
+    outbox = CountingOutbox()
+    delegate = DelegatePublisher()
+    publisher = ReliableEventPublisher(delegate=delegate, outbox_repository=outbox)
+
+    events = [_event(), _event(), _event()]
+    publisher.publish_many(events)
+
+    assert outbox.batch_writes == 1
+    assert outbox.single_writes == 0
+    assert delegate.batches == [events]
+    assert outbox.list_pending() == []
+
+
+def _sqlite_outbox(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'outbox.db'}")
+    Base.metadata.create_all(engine)
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+    return engine, PostgresOutboxRepository(get_session_factory(engine)), commits
+
+
+class _BatchDelegate:
+    def __init__(self, error=None) -> None:
+        self.error = error
+
+    def subscribe(self, handler):
+        pass
+
+    def publish_many(self, events):
+        if self.error is not None:
+            raise self.error
+
+
+def test_publish_many_marks_the_whole_batch_in_one_transaction(tmp_path):
+    engine, outbox, commits = _sqlite_outbox(tmp_path)
+    publisher = ReliableEventPublisher(delegate=_BatchDelegate(), outbox_repository=outbox)
+
+    publisher.publish_many([_event() for _ in range(50)])
+
+    assert len(commits) == 2  # save_pending_many + mark_published_many
+    assert outbox.list_pending() == []
+    engine.dispose()
+
+
+def test_failed_publish_many_counts_one_attempt_per_row_in_one_transaction(tmp_path):
+    engine, outbox, commits = _sqlite_outbox(tmp_path)
+    publisher = ReliableEventPublisher(
+        delegate=_BatchDelegate(RuntimeError("broker down")), outbox_repository=outbox
+    )
+
+    with pytest.raises(RuntimeError):
+        publisher.publish_many([_event() for _ in range(20)])
+
+    assert len(commits) == 2  # save_pending_many + mark_failed_attempts
+    pending = outbox.list_pending()
+    assert len(pending) == 20
+    assert {(row.attempts, row.last_error) for row in pending} == {(1, "broker down")}
+    engine.dispose()
@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.screening.applications.domain.ports import TorreBiosPort, TorreOpportunitiesPort
+from src.screening.applications.domain.value_objects import (
+    CandidateFromTorre,
+    JobOfferFromTorre,
+)
+from src.screening.applications.infrastructure.adapters.single_flight_torre_adapters import (
+    SingleFlightTorreBiosAdapter,
+    SingleFlightTorreOpportunitiesAdapter,
+)
+
+
+class SlowOpportunities(TorreOpportunitiesPort):
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self._error = error
+
+    async def get_opportunity(self, job_offer_id: str):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self._error is not None:
+            raise self._error
+        return JobOfferFromTorre(
+            external_id=job_offer_id, objective="Build APIs", strengths=[], responsibilities=[]
+        )
+
+
+class SlowBios(TorreBiosPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_bio(self, username: str):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return CandidateFromTorre(username=username, full_name="John Doe", skills=[], jobs=[])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_lookups_share_one_upstream_call():
+    upstream = SlowOpportunities()
+    adapter = SingleFlightTorreOpportunitiesAdapter(upstream)
+
+    results = await asyncio.gather(*(adapter.get_opportunity("hot-job") for _ in range(100)))
+
+    assert upstream.calls == 1
+    assert all(r is results[0] for r in results)
+    assert adapter.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 99}
+
+
+@pytest.mark.asyncio
+async def test_distinct_keys_are_not_coalesced():
+    upstream = SlowBios()
+    adapter = SingleFlightTorreBiosAdapter(upstream)
+
+    await asyncio.gather(adapter.get_bio("alice"), adapter.get_bio("bob"), adapter.get_bio("alice"))
+
+    assert upstream.calls == 2
+    assert adapter.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_exception_propagates_to_every_waiter():
+    upstream = SlowOpportunities(error=httpx.ConnectError("torre down"))
+    adapter = SingleFlightTorreOpportunitiesAdapter(upstream)
+
+    results = await asyncio.gather(
+        *(adapter.get_opportunity("job") for _ in range(5)), return_exceptions=True
+    )
+
+    assert upstream.calls == 1
+    assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_lookup():
+    upstream = SlowOpportunities()
+    adapter = SingleFlightTorreOpportunitiesAdapter(upstream)
+
+    leader = asyncio.create_task(adapter.get_opportunity("job"))
+    follower = asyncio.create_task(adapter.get_opportunity("job"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    result = await follower
+    assert result.external_id == "job"
+    assert leader.cancelled()
+    assert upstream.calls == 1
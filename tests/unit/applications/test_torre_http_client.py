@@ -0,0 +1,67 @@
+import httpx
+import pytest
+
+from src.screening.applications.infrastructure.adapters.torre_bios_adapter import (
+    TorreBiosAdapter,
+)
+from src.screening.applications.infrastructure.adapters.torre_http_client import (
+    create_torre_http_client,
+)
+from src.screening.applications.infrastructure.adapters.torre_opportunities_adapter import (
+    TorreOpportunitiesAdapter,
+)
+
+
+def _torre_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/api/genome/bios/"):
+        return httpx.Response(200, json={"person": {"name": "John Doe"}, "strengths": []})
+    if request.url.path.startswith("/api/suite/opportunities/"):
+        return httpx.Response(200, json={"objective": "Build APIs", "details": []})
+    return httpx.Response(404)
+
+
+@pytest.mark.asyncio
+async def test_adapters_share_the_provided_client_and_leave_it_open():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return _torre_handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    bios = TorreBiosAdapter(base_url="http://torre.test", get_client=lambda: client)
+    opportunities = TorreOpportunitiesAdapter(base_url="http://torre.test", get_client=lambda: client)
+
+    bio = await bios.get_bio("johndoe")
+    opportunity = await opportunities.get_opportunity("job123")
+
+    assert bio is not None and bio.full_name == "John Doe"
+    assert opportunity is not None and opportunity.objective == "Build APIs"
+    assert seen == ["/api/genome/bios/johndoe", "/api/suite/opportunities/job123"]
+    assert client.is_closed is False
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_adapter_returns_none_on_404_through_shared_client():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(404)))
+    bios = TorreBiosAdapter(base_url="http://torre.test", get_client=lambda: client)
+
+    assert await bios.get_bio("missing") is None
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_create_torre_http_client_applies_pool_limits():
+    client = create_torre_http_client(
+        timeout=2.0,
+        http2=False,
+        max_connections=7,
+        max_keepalive_connections=3,
+        keepalive_expiry=11.0,
+    )
+    pool = client._transport._pool  # white-box: httpx does not expose limits publicly
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 11.0
+    await client.aclose()
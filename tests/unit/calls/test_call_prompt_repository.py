@@ -0,0 +1,77 @@
+from uuid import uuid4
+
+import pytest
+
+from src.screening.calls.application.services import CallService
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.calls.infrastructure.adapters.cached_call_prompt_repository import (
+    CachedCallPromptRepository,
+)
+from src.screening.calls.infrastructure.adapters.in_memory_call_prompt_repository import (
+    InMemoryCallPromptRepository,
+)
+from src.screening.calls.infrastructure.adapters.postgres_call_prompt_repository import (
+    PostgresCallPromptRepository,
+)
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
+from src.screening.shared.domain import ApplicationId
+
+PROMPT = CallPrompt(prepared_questions=["Why this role?"], role_context="Objective: Build APIs")
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'prompts.db'}")
+    Base.metadata.create_all(engine)
+    yield get_session_factory(engine)
+    engine.dispose()
+
+
+def test_postgres_prompts_round_trip_and_are_replaced(session_factory):
+    repo = PostgresCallPromptRepository(session_factory)
+    application_id = str(uuid4())
+    repo.save_prompt(application_id, CallPrompt(["first"], "old"))
+    repo.save_prompt(application_id, PROMPT)
+
+    assert repo.get_prompt(application_id) == PROMPT
+    assert repo.get_prompt(str(uuid4())) is None
+    assert repo.get_prompt("not-a-uuid") is None
+
+
+async def test_prompt_saved_by_one_worker_is_read_by_another(session_factory):
+    subscriber_worker = CachedCallPromptRepository(PostgresCallPromptRepository(session_factory))
+    websocket_worker = CachedCallPromptRepository(PostgresCallPromptRepository(session_factory))
+    application_id = str(uuid4())
+
+    assert await websocket_worker.get_prompt_async(application_id) is None
+    subscriber_worker.save_prompt(application_id, PROMPT)
+
+    assert await websocket_worker.get_prompt_async(application_id) == PROMPT
+    assert websocket_worker.get_prompt(application_id) == PROMPT
+    assert websocket_worker.stats()["hits"] == 1
+
+
+def test_in_memory_store_is_capped():
+    repo = InMemoryCallPromptRepository(max_size=2)
+    for application_id in ("a", "b", "c"):
+        repo.save_prompt(application_id, PROMPT)
+
+    assert repo.get_prompt("a") is None
+    assert repo.get_prompt("c") == PROMPT
+
+
+async def test_call_service_reads_through_the_repository_and_defaults_when_missing():
+    repo = InMemoryCallPromptRepository()
+    service = CallService(
+        get_call_prompt_repository=lambda: repo,
+        get_event_publisher=lambda: None,
+        get_call_repository=lambda: None,
+    )
+    application_id = ApplicationId(uuid4())
+
+    assert (await service.get_prompt_for_application_async(application_id)).prepared_questions == [
+        "Tell me about your background."
+    ]
+    repo.save_prompt(str(application_id), PROMPT)
+    assert await service.get_prompt_for_application_async(application_id) == PROMPT
+    assert service.get_prompt_for_application(application_id) == PROMPT
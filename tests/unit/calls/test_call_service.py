@@ -0,0 +1,147 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.screening.calls.application.services import CallService
+from src.screening.calls.domain.value_objects import CallPrompt
+from src.screening.calls.infrastructure.adapters.in_memory_call_prompt_repository import (
+    InMemoryCallPromptRepository,
+)
+from src.screening.shared.domain import ApplicationId
+
+TAILORED = CallPrompt(prepared_questions=["Why this role?"], role_context="Objective: Build APIs")
+
+
+def _service(repo) -> CallService:
+    return CallService(
+        get_call_prompt_repository=lambda: None,
+        get_event_publisher=MagicMock,
+        get_call_repository=lambda: repo,
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_call_async_registers_before_the_save_completes():
+    application_id = ApplicationId(uuid4())
+    release = asyncio.Event()
+    repo = MagicMock()
+
+    async def slow_save(call):
+        await release.wait()
+
+    repo.save_call_async = slow_save
+    service = _service(repo)
+
+    task = asyncio.create_task(service.start_call_async(application_id))
+    await asyncio.sleep(0)
+    assert service.is_application_in_call(application_id)
+    release.set()
+    call = await task
+    assert call.application_id == application_id
+
+
+@pytest.mark.asyncio
+async def test_start_call_async_unregisters_when_save_fails():
+    application_id = ApplicationId(uuid4())
+    repo = MagicMock()
+    repo.save_call_async = AsyncMock(side_effect=RuntimeError("db down"))
+    service = _service(repo)
+
+    with pytest.raises(RuntimeError):
+        await service.start_call_async(application_id)
+    assert not service.is_application_in_call(application_id)
+
+
+@pytest.mark.asyncio
+async def test_end_call_async_persists_and_publishes_call_finished():
+    application_id = ApplicationId(uuid4())
+    repo = MagicMock()
+    repo.save_call_async = AsyncMock()
+    repo.update_call_transcript_async = AsyncMock()
+    repo.mark_call_completed_async = AsyncMock()
+    publisher = MagicMock()
+    service = CallService(
+        get_call_prompt_repository=lambda: None,
+        get_event_publisher=lambda: publisher,
+        get_call_repository=lambda: repo,
+    )
+    call = await service.start_call_async(application_id)
+
+    await service.end_call_async(application_id, call.id, [])
+
+    repo.mark_call_completed_async.assert_awaited_once_with(call.id)
+    assert publisher.publish.call_args.args[0].call_id == call.id
+    assert not service.is_application_in_call(application_id)
+
+
+def _prompt_service(repo, start_prompt_generation, wait_seconds=1.0) -> CallService:
+    return CallService(
+        get_call_prompt_repository=lambda: repo,
+        get_event_publisher=MagicMock,
+        get_call_repository=lambda: None,
+        start_prompt_generation=start_prompt_generation,
+        prompt_wait_seconds=wait_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stored_prompt_is_returned_without_starting_generation():
+    repo = InMemoryCallPromptRepository()
+    application_id = ApplicationId(uuid4())
+    repo.save_prompt(str(application_id), TAILORED)
+    service = _prompt_service(repo, lambda _: pytest.fail("generation started"))
+
+    assert await service.get_prompt_for_application_async(application_id) == TAILORED
+
+
+@pytest.mark.asyncio
+async def test_missing_prompt_waits_for_the_in_flight_generation():
+    executor = ThreadPoolExecutor(max_workers=1)
+    started = []
+
+    def start(application_id):
+        started.append(application_id)
+        return executor.submit(lambda: time.sleep(0.1) or TAILORED)
+
+    service = _prompt_service(InMemoryCallPromptRepository(), start)
+    application_id = ApplicationId(uuid4())
+
+    assert await service.get_prompt_for_application_async(application_id) == TAILORED
+    assert started == [str(application_id)]
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_wait_is_bounded_and_does_not_cancel_the_generation():
+    future = Future()
+    service = _prompt_service(InMemoryCallPromptRepository(), lambda _: future, wait_seconds=0.05)
+
+    start = time.perf_counter()
+    prompt = await service.get_prompt_for_application_async(ApplicationId(uuid4()))
+
+    assert time.perf_counter() - start < 1.0
+    assert prompt.prepared_questions == ["Tell me about your background."]
+    assert not future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_application_exists_uses_the_configured_check():
+    known = ApplicationId(uuid4())
+
+    async def exists(application_id):
+        return application_id == known
+
+    service = CallService(
+        get_call_prompt_repository=lambda: None,
+        get_event_publisher=MagicMock,
+        get_call_repository=lambda: None,
+        application_exists=exists,
+    )
+
+    assert await service.application_exists_async(known)
+    assert not await service.application_exists_async(ApplicationId(uuid4()))
+    assert await _service(None).application_exists_async(known)
@@ -1,8 +1,11 @@
 import asyncio
 import base64
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import WebSocketDisconnect
 
+from src.screening.calls.application.services import CallService
 from src.screening.calls.infrastructure import websocket_handler
 
 
@@ -227,6 +230,9 @@ async def test_handle_call_websocket_rejects_duplicate_with_4409():
     ws.closed = None
 
     class DuplicateCallService:
+        async def application_exists_async(self, _):
+            return True
+
         def is_application_in_call(self, _):
             return True
 
@@ -244,3 +250,88 @@ async def test_handle_call_websocket_rejects_duplicate_with_4409():
         "code": 4409,
         "reason": "Call already active for this application",
     }
+
+
+@pytest.mark.asyncio
+async def test_handle_call_websocket_rejects_unknown_application_with_4404():
+    ws = StubWebSocket()
+
+    class UnknownApplicationCallService:
+        def is_application_in_call(self, _):
+            return False
+
+        async def application_exists_async(self, _):
+            return False
+
+        async def start_call_async(self, _):
+            pytest.fail("call started for an unknown application")
+
+    await websocket_handler.handle_call_websocket(
+        websocket=ws,
+        application_id_str="00000000-0000-0000-0000-000000000404",
+        get_call_service=lambda: UnknownApplicationCallService(),
+        get_emma_service=lambda: None,
+    )
+
+    assert ws.closed == {"code": 4404, "reason": "Application not found"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sockets_behind_a_slow_existence_check_start_one_call():
+    lookup_done = asyncio.Event()
+    hang_up = asyncio.Event()
+
+    async def slow_exists(_):
+        await lookup_done.wait()
+        return True
+
+    service = CallService(
+        get_call_prompt_repository=lambda: None,
+        get_event_publisher=MagicMock,
+        get_call_repository=lambda: None,
+        application_exists=slow_exists,
+    )
+    started = []
+    start_call_async = service.start_call_async
+
+    async def counting_start(application_id):
+        started.append(application_id)
+        return await start_call_async(application_id)
+
+    service.start_call_async = counting_start
+
+    class ConnectedWebSocket(StubWebSocket):
+        closed = None
+
+        async def accept(self):
+            # Keep the first call active until the second socket has been handled.
+            await hang_up.wait()
+            raise WebSocketDisconnect()
+
+    sockets = [ConnectedWebSocket(), ConnectedWebSocket()]
+    handlers = [
+        asyncio.create_task(
+            websocket_handler.handle_call_websocket(
+                websocket=ws,
+                application_id_str="00000000-0000-0000-0000-000000000222",
+                get_call_service=lambda: service,
+                get_emma_service=lambda: None,
+            )
+        )
+        for ws in sockets
+    ]
+    await asyncio.sleep(0)
+    lookup_done.set()
+
+    async def one_rejected():
+        while not any(ws.closed for ws in sockets):
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(one_rejected(), timeout=1)
+    hang_up.set()
+    await asyncio.gather(*handlers)
+
+    assert len(started) == 1
+    assert [ws.closed for ws in sockets].count(
+        {"code": 4409, "reason": "Call already active for this application"}
+    ) == 1
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.screening.analysis.infrastructure.adapters.async_postgres_analysis_repository import (
+    AsyncPostgresAnalysisRepository,
+)
+from src.screening.persistence import AsyncSessionProvider, to_async_database_url
+from src.screening.persistence.models import AnalysisModel
+from src.screening.shared.domain import ApplicationId
+from src.screening.shared.infrastructure import EventLoopThread
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgresql://u:p@db:5432/screening",
+        "postgresql+psycopg2://u:p@db:5432/screening",
+        "postgresql+psycopg://u:p@db:5432/screening",
+    ],
+)
+def test_to_async_database_url_switches_postgres_urls_to_asyncpg(url):
+    assert to_async_database_url(url) == "postgresql+asyncpg://u:p@db:5432/screening"
+
+
+def test_to_async_database_url_leaves_other_urls_alone():
+    assert to_async_database_url("sqlite:///x.db") == "sqlite:///x.db"
+
+
+@pytest.mark.asyncio
+async def test_provider_hands_out_sessions_only_on_its_bound_loop():
+    provider = AsyncSessionProvider("postgresql://u:p@localhost:5432/screening")
+    assert provider.current() is None
+
+    provider.open()  # engine creation does not connect
+    assert provider.current() is not None
+
+    seen_from_other_loop = []
+
+    async def probe():
+        seen_from_other_loop.append(provider.current())
+
+    thread = threading.Thread(target=lambda: asyncio.run(probe()))
+    thread.start()
+    thread.join()
+    assert seen_from_other_loop == [None]
+
+    await provider.close()
+    assert provider.current() is None
+
+
+@pytest.mark.asyncio
+async def test_a_subscriber_loop_binds_its_own_engine():
+    provider = AsyncSessionProvider("postgresql://u:p@localhost:5432/screening")
+    provider.open()
+
+    async def open_on_loop():
+        provider.open()
+
+    async def current():
+        return provider.current()
+
+    subscriber_loop = EventLoopThread(
+        "test_subscriber_loop", on_start=open_on_loop, on_stop=provider.close
+    )
+    try:
+        subscriber_factory = subscriber_loop.submit(current()).result(timeout=5)
+    finally:
+        subscriber_loop.stop()
+
+    assert subscriber_factory is not None
+    assert subscriber_factory is not provider.current()
+    assert len(provider._bindings) == 1  # the subscriber loop disposed its engine on stop
+    await provider.close()
+    assert provider.current() is None
+
+
+def _analysis_row(application_id) -> AnalysisModel:
+    return AnalysisModel(
+        id=uuid4(),
+        application_id=application_id,
+        fit_score=80,
+        skills=["Python"],
+        completed_at=datetime.utcnow(),
+        status="completed",
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_repository_queries_through_async_session_when_bound():
+    application_id = uuid4()
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = _analysis_row(application_id)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    async_sessions = MagicMock()
+    async_sessions.current.return_value = lambda: session
+    sync_session_factory = MagicMock(side_effect=AssertionError("sync path used"))
+
+    repo = AsyncPostgresAnalysisRepository(sync_session_factory, async_sessions)
+    analysis = await repo.get_by_application_async(ApplicationId(application_id))
+
+    assert analysis is not None and analysis.fit_score == 80
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_repository_falls_back_to_sync_path_off_the_bound_loop(monkeypatch):
+    application_id = ApplicationId(uuid4())
+    async_sessions = MagicMock()
+    async_sessions.current.return_value = None
+    repo = AsyncPostgresAnalysisRepository(MagicMock(), async_sessions)
+    sync_lookup = MagicMock(return_value=None)
+    monkeypatch.setattr(repo, "get_by_application", sync_lookup)
+
+    assert await repo.get_by_application_async(application_id) is None
+    sync_lookup.assert_called_once_with(application_id)
@@ -0,0 +1,100 @@
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql
+
+from src.screening.applications.infrastructure.adapters.postgres_embedding_repository import (
+    PostgresEmbeddingRepository,
+    _select_embedding_stmt,
+    _upsert_embedding_stmt,
+)
+from src.screening.persistence import Base, create_engine_from_url, get_session_factory
+from src.screening.persistence.embedding_migration import migrate_jsonb_embeddings
+from src.screening.persistence.models import EntityEmbeddingModel
+from src.screening.persistence.vectors import pack_float32, unpack_float32
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'embeddings.db'}")
+    Base.metadata.create_all(engine)
+    yield get_session_factory(engine)
+    engine.dispose()
+
+
+def _legacy_row(session_factory, values):
+    entity_id = uuid4()
+    with session_factory() as session:
+        session.execute(
+            insert(EntityEmbeddingModel).values(
+                id=uuid4(), entity_type="candidate", entity_id=entity_id, embedding=values
+            )
+        )
+        session.commit()
+    return str(entity_id)
+
+
+def test_float32_pack_is_four_bytes_per_dimension_and_unpacks_without_copy():
+    packed = pack_float32([0.5, -1.25, 3.0])
+    view = unpack_float32(packed)
+
+    assert len(packed) == 12
+    assert view.dtype == np.float32 and not view.flags.writeable
+    assert view.tolist() == [0.5, -1.25, 3.0]
+    assert not view.flags.owndata
+
+
+def test_float32_storage_round_trips_as_numpy_and_leaves_jsonb_empty(session_factory):
+    repo = PostgresEmbeddingRepository(session_factory)
+    candidate_id = str(uuid4())
+    repo.save_candidate_embedding(candidate_id, [0.25] * 768)
+
+    embedding = repo.get_candidate_embedding(candidate_id)
+
+    assert isinstance(embedding, np.ndarray) and embedding.dtype == np.float32
+    assert embedding.shape == (768,) and float(embedding[0]) == 0.25
+    with session_factory() as session:
+        row = session.execute(select(EntityEmbeddingModel)).scalar_one()
+        assert row.embedding is None and len(row.embedding_f32) == 768 * 4
+
+
+def test_legacy_jsonb_rows_stay_readable(session_factory):
+    candidate_id = _legacy_row(session_factory, [1.0, 2.0, 3.0])
+
+    embedding = PostgresEmbeddingRepository(session_factory).get_candidate_embedding(candidate_id)
+
+    assert embedding.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_migration_converts_jsonb_rows_and_is_idempotent(session_factory):
+    ids = [_legacy_row(session_factory, [float(i), 0.5]) for i in range(5)]
+    _legacy_row(session_factory, "not-a-vector")
+
+    assert migrate_jsonb_embeddings(session_factory, batch_size=2) == 5
+    assert migrate_jsonb_embeddings(session_factory, batch_size=2) == 0
+
+    repo = PostgresEmbeddingRepository(session_factory)
+    assert [repo.get_candidate_embedding(i).tolist() for i in ids] == [[float(i), 0.5] for i in range(5)]
+    with session_factory() as session:
+        converted = session.execute(
+            select(EntityEmbeddingModel).where(EntityEmbeddingModel.embedding_f32.is_not(None))
+        ).scalars().all()
+        assert len(converted) == 5 and all(row.embedding is None for row in converted)
+
+
+def test_pgvector_storage_casts_through_text():
+    dialect = postgresql.dialect()
+    upsert = _upsert_embedding_stmt("pgvector", "candidate", uuid4(), [1.0, 2.5])
+    read = _select_embedding_stmt("pgvector", "candidate", uuid4())
+
+    upsert_sql = str(upsert.compile(dialect=dialect))
+    assert "CAST(CAST(%(embedding_vector)s AS TEXT) AS vector)" in upsert_sql
+    assert "embedding_vector = excluded.embedding_vector" in upsert_sql
+    assert "CAST(entity_embeddings.embedding_vector AS TEXT)" in str(read.compile(dialect=dialect))
+
+
+def test_unknown_storage_mode_is_rejected(session_factory):
+    with pytest.raises(ValueError):
+        PostgresEmbeddingRepository(session_factory, storage="float16")
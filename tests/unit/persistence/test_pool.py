@@ -0,0 +1,56 @@
+from fastapi.testclient import TestClient
+
+from apps.backend.main import app
+from src import wiring
+from src.screening.persistence import PoolMetrics, PoolSettings
+
+
+def test_connect_args_for_asyncpg_set_timeout_and_statement_caches():
+    args = PoolSettings(statement_timeout_ms=5000, prepared_statement_cache_size=0).connect_args(
+        "postgresql+asyncpg://u:p@db/screening"
+    )
+    assert args == {
+        "server_settings": {"statement_timeout": "5000"},
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+    }
+
+
+def test_connect_args_for_psycopg_disable_prepares_when_cache_is_zero():
+    args = PoolSettings(statement_timeout_ms=250, prepared_statement_cache_size=0).connect_args(
+        "postgresql+psycopg://u:p@db/screening"
+    )
+    assert args == {"options": "-c statement_timeout=250", "prepare_threshold": None}
+
+
+def test_connect_args_keep_server_defaults_when_unset():
+    assert PoolSettings().connect_args("postgresql+psycopg2://u:p@db/screening") == {}
+
+
+def test_metrics_endpoint_reports_pool_gauges(monkeypatch):
+    metrics = PoolMetrics()
+    metrics.record_checkout(0.002)
+    metrics.record_checkout(0.0, timed_out=True)
+    monkeypatch.setattr(wiring, "_database_pool_metrics", {"sync": metrics})
+
+    with TestClient(app) as client:
+        response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    sync = response.json()["database_pools"]["sync"]
+    assert sync["checkouts"] == 1
+    assert sync["checkout_timeouts"] == 1
+    assert sync["checkout_wait_seconds_max"] == 0.002
+
+
+def test_metrics_endpoint_reports_torre_coalesced_callers(monkeypatch):
+    monkeypatch.setattr(wiring, "_application_service", None)
+    monkeypatch.setattr(wiring, "_torre_adapters", {})
+    wiring.get_app_application_service()
+
+    with TestClient(app) as client:
+        torre = client.get("/api/metrics").json()["torre"]
+
+    assert torre["bios_single_flight"] == {"in_flight": 0, "leaders": 0, "coalesced": 0}
+    assert torre["opportunities_single_flight"]["coalesced"] == 0
+    assert torre["opportunity_cache"]["hits"] == 0
@@ -0,0 +1,30 @@
+from src.screening.persistence.models import (
+    _PGVECTOR_UPGRADES,
+    _SCHEMA_UPGRADES,
+    _pending_schema_upgrades,
+)
+
+
+def _names(upgrades):
+    return [name for name, _ in upgrades]
+
+
+def test_upgrade_names_are_unique():
+    names = _names(_SCHEMA_UPGRADES + _PGVECTOR_UPGRADES)
+    assert len(names) == len(set(names))
+
+
+def test_recorded_upgrades_are_not_run_again():
+    applied = {"job_offers_refreshed_at", "applications_idempotency_key"}
+
+    pending = _names(_pending_schema_upgrades(applied))
+
+    assert pending == [name for name in _names(_SCHEMA_UPGRADES) if name not in applied]
+    assert _pending_schema_upgrades(set(_names(_SCHEMA_UPGRADES))) == []
+
+
+def test_pgvector_upgrade_is_pending_only_for_pgvector_storage():
+    everything = set(_names(_SCHEMA_UPGRADES))
+
+    assert _pending_schema_upgrades(everything, "float32") == []
+    assert _names(_pending_schema_upgrades(everything, "pgvector")) == ["pgvector_embedding_vector"]
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from src.screening.shared.infrastructure import EventLoopThread
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_coroutines_from_many_threads_share_one_loop():
+    runner = EventLoopThread("test_loop")
+    loops = set()
+
+    async def work(i):
+        loops.add(asyncio.get_running_loop())
+        await asyncio.sleep(0.05)
+        return i
+
+    try:
+        threads = [
+            threading.Thread(target=lambda i=i: runner.submit(work(i)).result(timeout=2))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+        assert runner.submit(work(9)).result(timeout=1) == 9
+    finally:
+        runner.stop()
+
+    assert len(loops) == 1
+
+
+def test_hooks_run_on_the_loop_and_stop_cancels_pending_work():
+    events = []
+
+    async def on_start():
+        events.append(("start", asyncio.get_running_loop()))
+
+    async def on_stop():
+        events.append(("stop", asyncio.get_running_loop()))
+
+    runner = EventLoopThread("test_loop", on_start=on_start, on_stop=on_stop)
+    loop = runner.submit(_running_loop()).result(timeout=1)
+    pending = runner.submit(asyncio.sleep(60))
+    runner.stop()
+
+    assert events == [("start", loop), ("stop", loop)]
+    with pytest.raises(CancelledError):
+        pending.result(timeout=1)
+
+
+def test_stop_then_reuse_starts_a_fresh_loop():
+    runner = EventLoopThread("test_loop")
+    first = runner.submit(asyncio.sleep(0, result="first")).result(timeout=1)
+    runner.stop()
+    try:
+        assert runner.submit(asyncio.sleep(0, result="second")).result(timeout=1) == "second"
+    finally:
+        runner.stop()
+    assert first == "first"
@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+import numpy as np
+import pytest
+
+from src.screening.shared.infrastructure import IvfIndex
+
+
+def _clustered(rng, count, dimensions=64, clusters=40):
+    centres = rng.standard_normal((clusters, dimensions)).astype(np.float32)
+    labels = rng.integers(clusters, size=count)
+    return centres[labels] + 0.3 * rng.standard_normal((count, dimensions)).astype(np.float32)
+
+
+def _exact_top(vectors, query, k):
+    units = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return set(np.argsort(-(units @ (query / np.linalg.norm(query))))[:k].tolist())
+
+
+def test_small_index_is_an_exact_scan_ordered_by_similarity():
+    index = IvfIndex(train_threshold=100)
+    index.upsert("east", [1.0, 0.0])
+    index.upsert("north", [0.0, 2.0])
+    index.upsert("north-east", [1.0, 1.0])
+
+    results = index.search([1.0, 0.1], k=2)
+
+    assert not index.trained
+    assert [key for key, _ in results] == ["east", "north-east"]
+    assert results[0][1] == pytest.approx(0.995, abs=1e-3)
+
+
+def test_rejects_empty_zero_and_mismatched_vectors():
+    index = IvfIndex()
+    assert index.upsert("a", [1.0, 2.0, 3.0])
+
+    assert not index.upsert("empty", [])
+    assert not index.upsert("zero", [0.0, 0.0, 0.0])
+    assert not index.upsert("short", [1.0, 2.0])
+    assert len(index) == 1
+    assert index.search([1.0, 2.0], k=5) == []
+
+
+def test_upsert_replaces_an_existing_vector_after_training():
+    rng = np.random.default_rng(0)
+    index = IvfIndex(train_threshold=64)
+    for i, vector in enumerate(_clustered(rng, 200, dimensions=8)):
+        index.upsert(str(i), vector)
+    target = np.full(8, 5.0, dtype=np.float32)
+
+    index.upsert("7", target)
+
+    assert index.trained and len(index) == 200
+    assert index.search(target, k=1)[0][0] == "7"
+
+
+def test_trained_index_recall_against_exact_search():
+    rng = np.random.default_rng(1)
+    vectors = _clustered(rng, 20_000)
+    index = IvfIndex(nprobe=8, train_threshold=1024)
+    for i, vector in enumerate(vectors):
+        index.upsert(str(i), vector)
+    queries = _clustered(rng, 100)
+
+    hits = 0
+    for query in queries:
+        found = {int(key) for key, _ in index.search(query, k=10)}
+        hits += len(found & _exact_top(vectors, query, 10))
+
+    assert index.trained
+    assert hits / (10 * len(queries)) >= 0.9
+
+
+def test_save_and_load_memory_maps_the_snapshot(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = _clustered(rng, 3000, dimensions=16)
+    index = IvfIndex(train_threshold=512)
+    for i, vector in enumerate(vectors):
+        index.upsert(str(i), vector)
+    query = vectors[42]
+    expected = index.search(query, k=5)
+
+    index.save(tmp_path / "index")
+    loaded = IvfIndex.load(tmp_path / "index")
+
+    assert isinstance(loaded._vectors, np.memmap)
+    assert loaded.trained and len(loaded) == 3000
+    assert loaded.search(query, k=5) == expected
+    loaded.upsert("new", -query)
+    assert loaded.search(-query, k=1)[0][0] == "new"
+    assert "new" not in IvfIndex.load(tmp_path / "index")
+
+
+def test_load_without_a_snapshot_returns_none(tmp_path):
+    assert IvfIndex.load(tmp_path / "missing") is None
+
+
+def test_concurrent_saves_to_one_path_leave_a_complete_snapshot(tmp_path):
+    rng = np.random.default_rng(3)
+    indexes = []
+    for size in (100, 200, 300, 400):
+        index = IvfIndex()
+        for i, vector in enumerate(rng.standard_normal((size, 8))):
+            index.upsert(str(i), vector)
+        indexes.append(index)
+
+    with ThreadPoolExecutor(max_workers=len(indexes)) as pool:
+        list(pool.map(lambda index: index.save(tmp_path / "index"), indexes * 5))
+
+    assert len(IvfIndex.load(tmp_path / "index")) in (100, 200, 300, 400)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index", "index.lock"]
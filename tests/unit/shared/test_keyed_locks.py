@@ -0,0 +1,68 @@
+import asyncio
+import sys
+
+import pytest
+
+from src.screening.shared.infrastructure import KeyedLocks
+
+
+@pytest.mark.asyncio
+async def test_same_key_is_serialised_and_entry_dropped_afterwards():
+    locks = KeyedLocks()
+    order = []
+
+    async def worker(name: str) -> None:
+        async with locks.hold("k"):
+            order.append(f"{name}-in")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-out")
+
+    await asyncio.gather(worker("a"), worker("b"))
+
+    assert order == ["a-in", "a-out", "b-in", "b-out"]
+    assert len(locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_distinct_keys_do_not_block_each_other():
+    locks = KeyedLocks()
+    inside = asyncio.Event()
+
+    async def holder() -> None:
+        async with locks.hold("a"):
+            await inside.wait()
+
+    task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    async with locks.hold("b"):
+        inside.set()
+    await task
+    assert len(locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_entry_is_released_when_body_raises():
+    locks = KeyedLocks()
+    with pytest.raises(RuntimeError):
+        async with locks.hold("k"):
+            raise RuntimeError("boom")
+    assert len(locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_stays_flat_across_one_million_distinct_keys():
+    locks = KeyedLocks()
+    table = locks._entries  # intentional white-box check: the backing dict never grows
+    async with locks.hold(("user", -1)):
+        pass
+    baseline = sys.getsizeof(table)
+
+    for i in range(1_000_000):
+        async with locks.hold(("user", i)):
+            pass
+        if i % 100_000 == 0:
+            assert len(locks) == 0
+            assert sys.getsizeof(table) <= baseline
+
+    assert len(locks) == 0
+    assert sys.getsizeof(table) <= baseline
@@ -0,0 +1,38 @@
+from src.screening.shared.infrastructure import StageTracker
+from src.screening.shared.infrastructure.stage_tracker import DONE, FAILED, PENDING
+
+
+def test_status_records_each_stage_outcome():
+    tracker = StageTracker()
+    tracker.start("app", ["embed", "prompt"])
+    tracker.finish("app", "embed", ok=False)
+
+    status = tracker.status("app")
+
+    assert status["stages"] == {"embed": FAILED, "prompt": PENDING}
+    assert set(status["seconds"]) == {"embed"}
+    assert tracker.status("unknown") is None
+
+
+def test_seconds_are_measured_from_the_start_of_the_run():
+    now = [100.0]
+    tracker = StageTracker(clock=lambda: now[0])
+    tracker.start("app", ["embed", "prompt"])
+    now[0] = 100.25
+    tracker.finish("app", "prompt")
+    now[0] = 101.5
+    tracker.finish("app", "embed")
+
+    assert tracker.status("app") == {
+        "stages": {"embed": DONE, "prompt": DONE},
+        "seconds": {"prompt": 0.25, "embed": 1.5},
+    }
+
+
+def test_oldest_runs_are_evicted():
+    tracker = StageTracker(max_keys=2)
+    for key in ("a", "b", "c"):
+        tracker.start(key, ["prompt"])
+
+    assert tracker.status("a") is None
+    assert tracker.status("c") is not None
@@ -0,0 +1,65 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from src.screening.shared.infrastructure import ThreadSingleFlight
+
+
+def test_share_adopts_one_launched_future_for_every_caller():
+    flight = ThreadSingleFlight()
+    launched = []
+
+    def launch():
+        future = Future()
+        launched.append(future)
+        return future
+
+    first = flight.share("app", launch)
+    second = flight.share("app", launch)
+    launched[0].set_result("prompt")
+
+    assert first is second
+    assert first.result(timeout=1) == "prompt"
+    assert len(launched) == 1
+    assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 1}
+
+
+def test_concurrent_callers_share_one_launch():
+    flight = ThreadSingleFlight()
+    inner = Future()
+    launches = []
+
+    def launch():
+        launches.append(1)
+        return inner
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        shared = list(pool.map(lambda _: flight.share("app", launch), range(4)))
+    inner.set_result("prompt")
+
+    assert [future.result(timeout=1) for future in shared] == ["prompt"] * 4
+    assert len(launches) == 1
+
+
+def test_share_propagates_the_launched_failure_and_releases_the_key():
+    flight = ThreadSingleFlight()
+    inner = Future()
+    shared = flight.share("app", lambda: inner)
+    inner.set_exception(RuntimeError("graph load failed"))
+
+    with pytest.raises(RuntimeError, match="graph load failed"):
+        shared.result(timeout=1)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_a_failing_launch_reaches_the_caller_and_releases_the_key():
+    flight = ThreadSingleFlight()
+
+    def broken():
+        raise RuntimeError("loop stopped")
+
+    with pytest.raises(RuntimeError, match="loop stopped"):
+        flight.share("app", broken).result(timeout=1)
+    retried = Future()
+    retried.set_result("prompt")
+    assert flight.share("app", lambda: retried).result(timeout=1) == "prompt"
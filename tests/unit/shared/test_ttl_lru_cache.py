@@ -0,0 +1,47 @@
+from src.screening.shared.infrastructure import TtlLruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lookup_distinguishes_cached_none_from_miss():
+    cache = TtlLruCache(max_size=4)
+    cache.set("negative", None)
+
+    assert cache.lookup("negative") == (True, None)
+    assert cache.lookup("absent") == (False, None)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl_and_per_entry_override():
+    clock = FakeClock()
+    cache = TtlLruCache(max_size=4, ttl_seconds=10.0, clock=clock)
+    cache.set("long", "a")
+    cache.set("short", "b", ttl_seconds=1.0)
+
+    clock.now = 5.0
+    assert cache.get("long") == "a"
+    assert cache.get("short") is None
+
+    clock.now = 11.0
+    assert cache.get("long") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TtlLruCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1